@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Migration script to bring the documents listing indexes up to date.
+
+create_tables only creates indexes together with a new table, so existing
+databases get them here. Indexes are built and dropped CONCURRENTLY, so
+uploads and status updates are not blocked while it runs. Safe to re-run:
+every statement uses IF [NOT] EXISTS.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from src.db.postgres import get_migration_client
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Must match Document.__table_args__ in src/db/postgres.py
+CREATE_INDEXES = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_upload_date_id "
+    "ON documents (upload_date DESC, id DESC)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_status_upload_date "
+    "ON documents (processing_status, upload_date DESC)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_category_upload_date "
+    "ON documents (category, upload_date DESC)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_status_category_upload_date "
+    "ON documents (processing_status, category, upload_date DESC)",
+]
+
+# Indexes that earlier versions of the model created and no query needs
+DROP_INDEXES = [
+    # Single-column upload_date index, superseded by (upload_date, id)
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_documents_upload_date",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_documents_ready_upload_date",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_documents_active_status",
+]
+
+
+def main():
+    """Create the documents listing indexes and drop superseded ones."""
+    logger.info("Starting migration: Updating documents indexes...")
+
+    pg_client = get_migration_client()
+
+    try:
+        # CONCURRENTLY cannot run inside a transaction block
+        with pg_client._engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            for statement in CREATE_INDEXES + DROP_INDEXES:
+                conn.execute(text(statement))
+                logger.info(f"✅ {statement}")
+
+        logger.info("✅ Documents indexes created/verified")
+
+    except Exception as e:
+        # A failed concurrent build leaves an INVALID index behind that
+        # IF NOT EXISTS would skip; drop it before re-running
+        logger.error(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,7 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.db.postgres import PostgreSQLClient, Base
+from src.db.postgres import Feedback, get_migration_client
 from src.utils.logging import setup_logging, get_logger
 
 # Setup logging
@@ -22,12 +22,13 @@ def main():
     """Add search_feedback table to the database."""
     logger.info("Starting migration: Adding search_feedback table...")
 
-    pg_client = PostgreSQLClient()
+    pg_client = get_migration_client()
 
     try:
-        # Create all tables (this will create search_feedback if it doesn't exist)
+        # Create only the search_feedback table (no-op if it already exists)
         # The documents table will remain unchanged
-        Base.metadata.create_all(pg_client._engine)
+        with pg_client._engine.begin() as conn:
+            Feedback.__table__.create(bind=conn, checkfirst=True)
 
         logger.info("✅ search_feedback table created/verified successfully")
         logger.info("Migration completed successfully!")
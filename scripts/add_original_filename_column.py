@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Migration script to add original_filename column to documents table.
+
+Safe to re-run: uses ADD COLUMN IF NOT EXISTS instead of probing
+information_schema first.
 """
 
 import sys
@@ -10,7 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from src.db.postgres import PostgreSQLClient
+from src.db.postgres import get_migration_client
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -20,31 +23,18 @@ def main():
     """Add original_filename column to documents table."""
     logger.info("Starting migration: Adding original_filename column...")
 
-    # Initialize PostgreSQL client
-    pg_client = PostgreSQLClient()
+    pg_client = get_migration_client()
 
-    # Add column using raw SQL
+    # Add column using raw SQL in a single transaction; IF NOT EXISTS makes
+    # the migration idempotent without probing information_schema first
     try:
-        with pg_client._engine.connect() as conn:
-            # Check if column already exists
-            result = conn.execute(text("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name='documents' AND column_name='original_filename';
-            """))
-
-            if result.fetchone():
-                logger.info("✅ Column 'original_filename' already exists")
-                return
-
-            # Add the column
+        with pg_client._engine.begin() as conn:
             conn.execute(text("""
                 ALTER TABLE documents
-                ADD COLUMN original_filename VARCHAR(255) NOT NULL DEFAULT 'unknown.pdf';
+                ADD COLUMN IF NOT EXISTS original_filename VARCHAR(255) NOT NULL DEFAULT 'unknown.pdf';
             """))
-            conn.commit()
 
-            logger.info("✅ Successfully added 'original_filename' column")
+        logger.info("✅ Column 'original_filename' added/verified")
 
     except Exception as e:
         logger.error(f"❌ Migration failed: {e}")
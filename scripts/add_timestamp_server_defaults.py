@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Migration script to move timestamp defaults into PostgreSQL.
+
+The documents and search_feedback timestamp columns used to be filled in
+by SQLAlchemy on the Python side; the models now rely on server defaults,
+so existing tables need them set. Safe to re-run: SET DEFAULT is idempotent.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from src.db.postgres import get_migration_client
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+UTC_NOW_DEFAULT = "timezone('utc', now())"
+
+
+def main():
+    """Set server-side timestamp defaults on documents and search_feedback."""
+    logger.info("Starting migration: Setting timestamp server defaults...")
+
+    pg_client = get_migration_client()
+
+    try:
+        with pg_client._engine.begin() as conn:
+            conn.execute(text(f"""
+                ALTER TABLE documents
+                ALTER COLUMN upload_date SET DEFAULT {UTC_NOW_DEFAULT},
+                ALTER COLUMN created_at SET DEFAULT {UTC_NOW_DEFAULT},
+                ALTER COLUMN updated_at SET DEFAULT {UTC_NOW_DEFAULT};
+            """))
+            conn.execute(text(f"""
+                ALTER TABLE search_feedback
+                ALTER COLUMN timestamp SET DEFAULT {UTC_NOW_DEFAULT},
+                ALTER COLUMN created_at SET DEFAULT {UTC_NOW_DEFAULT};
+            """))
+
+        logger.info("✅ Timestamp server defaults set/verified")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
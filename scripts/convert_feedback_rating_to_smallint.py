@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Migration script to store search_feedback.rating as a SMALLINT.
+
+Existing 'positive'/'negative' strings become 1/0. Safe to re-run: the
+column is only converted while it is still a character type.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from src.db.postgres import get_migration_client
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    """Convert search_feedback.rating from VARCHAR to SMALLINT."""
+    logger.info("Starting migration: Converting feedback rating to SMALLINT...")
+
+    pg_client = get_migration_client()
+
+    try:
+        with pg_client._engine.begin() as conn:
+            conn.execute(text("""
+                DO $$
+                BEGIN
+                    IF EXISTS (
+                        SELECT 1 FROM information_schema.columns
+                        WHERE table_name = 'search_feedback'
+                          AND column_name = 'rating'
+                          AND data_type = 'character varying'
+                    ) THEN
+                        ALTER TABLE search_feedback
+                        ALTER COLUMN rating TYPE SMALLINT
+                        USING CASE WHEN rating = 'positive' THEN 1 ELSE 0 END;
+                    END IF;
+                END $$;
+            """))
+
+        logger.info("✅ Column 'rating' converted/verified")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.db.postgres import get_postgres_client
+from src.db.postgres import PostgreSQLClient
 from src.utils.logging import setup_logging, get_logger
 from src.config import settings
 
@@ -24,7 +24,14 @@ def main():
         logger.info("Starting PostgreSQL database initialization...")
 
         # Get PostgreSQL client
-        db_client = get_postgres_client()
+        db_client = PostgreSQLClient(
+            engine_kwargs={
+                "pool_size": 5,
+                "max_overflow": 10,
+                "pool_pre_ping": True,
+                "pool_recycle": 1800,
+            }
+        )
 
         # Create tables
         logger.info("Creating database tables...")
@@ -3,14 +3,30 @@
 Load sample PDF documents for testing and demonstration.
 
 This script uploads PDFs from the test-files/ directory to the Document Search system.
+
+With --bulk, the API is bypassed: document rows are seeded directly into
+PostgreSQL with a single COPY and the PDFs are processed in-process.
+
+With --batch, all sample PDFs are processed in-process first, then every
+page is sent to Elasticsearch in size-capped _bulk requests and the
+document rows are inserted in small PostgreSQL transactions.
 """
 
+import argparse
+import csv
+import hashlib
+import io
 import os
+import shutil
 import sys
 import time
 import requests
+import uuid_utils
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
 # Add project root to path
@@ -25,6 +41,15 @@ API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 API_KEY = os.getenv("API_KEY")
 SAMPLE_FILES_DIR = project_root / "test-files"
 
+# Status polling (seconds)
+POLL_INITIAL_INTERVAL = 0.25
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_INTERVAL = 5.0
+
+# Batch mode tuning
+ES_BULK_MAX_BYTES = 5 * 1024 * 1024  # Keep each _bulk request under 5MB
+PG_BATCH_SIZE = 25  # Rows per PostgreSQL INSERT batch
+
 # Sample document metadata
 SAMPLE_DOCUMENTS = [
     {
@@ -40,6 +65,26 @@ SAMPLE_DOCUMENTS = [
 ]
 
 
+def file_sha256(file_path: Path) -> str:
+    """
+    Compute the SHA-256 digest of a file without loading it into memory.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        str: Hex-encoded SHA-256 digest
+    """
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        digest = hashlib.sha256()
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+        return digest.hexdigest()
+
+
 class SampleDataLoader:
     """Load sample PDF documents into the system."""
 
@@ -55,6 +100,17 @@ class SampleDataLoader:
         self.api_key = api_key
         self.headers = {"Authorization": f"Bearer {api_key}"}
 
+        # Shared session so connections are kept alive and pooled across
+        # worker threads
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Cached result of the first full document listing
+        self._docs_cache: Optional[List[Dict[str, Any]]] = None
+
     def check_health(self) -> bool:
         """
         Check if the API is healthy.
@@ -63,7 +119,12 @@ class SampleDataLoader:
             bool: True if API is healthy, False otherwise
         """
         try:
-            response = requests.get(f"{self.api_url}/health", timeout=5)
+            # Only the status code matters: stream and close without reading
+            # the body. /health is GET-only, so HEAD would return 405.
+            response = self.session.get(
+                f"{self.api_url}/health", timeout=1.0, stream=True
+            )
+            response.close()
             return response.status_code == 200
         except requests.RequestException as e:
             print(f"❌ API health check failed: {e}")
@@ -88,15 +149,23 @@ class SampleDataLoader:
 
         print(f"📤 Uploading {file_path.name}...")
 
+        digest = file_sha256(file_path)
+
         with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f, "application/pdf")}
-            data = {"category": category, "machine_model": machine_model}
+            # Stream the multipart body instead of buffering the whole PDF
+            encoder = MultipartEncoder(
+                fields={
+                    "file": (file_path.name, f, "application/pdf"),
+                    "category": category,
+                    "machine_model": machine_model,
+                    "sha256": digest,
+                }
+            )
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/api/v1/documents/upload",
-                headers=self.headers,
-                files=files,
-                data=data,
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
             )
 
         if response.status_code == 202:
@@ -120,12 +189,15 @@ class SampleDataLoader:
         """
         print(f"⏳ Waiting for document {document_id} to process...")
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        # Poll quickly at first, backing off towards POLL_MAX_INTERVAL
+        interval = POLL_INITIAL_INTERVAL
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(
+                # Never let a single request outlive the overall deadline
+                response = self.session.get(
                     f"{self.api_url}/api/v1/documents/{document_id}",
-                    headers=self.headers,
+                    timeout=max(0.5, deadline - time.monotonic())
                 )
 
                 if response.status_code == 200:
@@ -145,7 +217,8 @@ class SampleDataLoader:
                     else:
                         # Still processing
                         print(f"   Status: {status}...", end="\r")
-                        time.sleep(5)
+                        time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+                        interval = min(interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL)
                 else:
                     print(f"❌ Status check failed: {response.status_code}")
                     return False
@@ -157,36 +230,340 @@ class SampleDataLoader:
         print(f"⏰ Timeout waiting for processing")
         return False
 
-    def list_documents(self) -> List[Dict[str, Any]]:
+    def list_documents(
+        self, page_size: int = 100, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
         """
-        List all documents in the system.
+        List all documents in the system, following pagination.
+
+        The first successful listing is cached and reused on later calls.
+
+        Args:
+            page_size: Documents to request per page (max 100)
+            refresh: Re-fetch from the API even if a cached listing exists
 
         Returns:
             list: List of document metadata
         """
+        if self._docs_cache is not None and not refresh:
+            return self._docs_cache
+
+        documents = []
+        page = 1
         try:
-            response = requests.get(
-                f"{self.api_url}/api/v1/documents?page=1&page_size=100",
-                headers=self.headers,
-            )
+            while True:
+                response = self.session.get(
+                    f"{self.api_url}/api/v1/documents",
+                    params={"page": page, "page_size": page_size},
+                )
 
-            if response.status_code == 200:
-                return response.json()["documents"]
-            else:
-                print(f"❌ Failed to list documents: {response.status_code}")
-                return []
+                if response.status_code != 200:
+                    print(f"❌ Failed to list documents: {response.status_code}")
+                    return []
+
+                batch = response.json()["documents"]
+                documents.extend(batch)
+                if len(batch) < page_size:
+                    break
+                page += 1
 
         except requests.RequestException as e:
             print(f"❌ Error listing documents: {e}")
             return []
 
+        self._docs_cache = documents
+        return documents
+
+    def count_documents(self) -> Optional[int]:
+        """
+        Get the total number of documents without fetching the full listing.
+
+        Returns:
+            int: Total document count, or None if the request failed
+        """
+        try:
+            response = self.session.get(
+                f"{self.api_url}/api/v1/documents",
+                params={"page": 1, "page_size": 1},
+            )
+            if response.status_code == 200:
+                return response.json()["total"]
+        except requests.RequestException as e:
+            print(f"❌ Error counting documents: {e}")
+        return None
+
+
+def bulk_load_documents(drop_indexes: bool = False) -> None:
+    """
+    Seed sample documents directly into PostgreSQL, bypassing the API.
+
+    All document rows are written with a single COPY FROM STDIN and committed
+    once, then each PDF is run through the processing pipeline locally.
+
+    Args:
+        drop_indexes: Drop secondary indexes on documents before the COPY and
+            rebuild them concurrently afterwards (development only)
+    """
+    # Imported lazily: these require the full application settings
+    from src.config import settings
+    from src.db.postgres import get_migration_client
+    from src.models.document import DocumentCategory, ProcessingStatus
+    from src.tasks import process_document_task
+
+    # Unpooled and without the API's statement timeout: the COPY and index
+    # rebuilds can run long, and autocommit (set below) must not leak back
+    # into a shared pool
+    pg_client = get_migration_client()
+    storage_path = Path(settings.pdf_storage_path)
+    storage_path.mkdir(parents=True, exist_ok=True)
+
+    raw_conn = pg_client._engine.raw_connection()
+    try:
+        with raw_conn.cursor() as cursor:
+            cursor.execute("SELECT original_filename FROM documents")
+            existing_filenames = {row[0] for row in cursor.fetchall()}
+
+        # Pre-compute IDs and copy PDFs into storage
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        seeded = []
+        now = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+        for doc_info in SAMPLE_DOCUMENTS:
+            filename = doc_info["filename"]
+            source_path = SAMPLE_FILES_DIR / filename
+
+            if filename in existing_filenames:
+                print(f"⏭️  Skipping {filename} (already exists)")
+                continue
+
+            if not source_path.exists():
+                print(f"⚠️  File not found: {filename}")
+                continue
+
+            document_id = str(uuid_utils.uuid7())
+            file_path = storage_path / f"{document_id}{source_path.suffix}"
+            shutil.copyfile(source_path, file_path)
+
+            category = DocumentCategory(doc_info["category"])
+            # SQLAlchemy persists Enum columns by member name
+            writer.writerow([
+                document_id,
+                file_path.name,
+                filename,
+                str(file_path),
+                file_path.stat().st_size,
+                category.name,
+                doc_info["machine_model"],
+                ProcessingStatus.UPLOADED.name,
+                now,
+                now,
+                now,
+            ])
+            seeded.append((document_id, file_path, category, doc_info["machine_model"]))
+
+        if not seeded:
+            print("ℹ️  Nothing to seed")
+            return
+
+        index_defs = []
+        if drop_indexes:
+            # Secondary indexes only; constraint-backed ones (the PK) stay
+            with raw_conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT indexname, indexdef FROM pg_indexes
+                    WHERE tablename = 'documents'
+                      AND indexname NOT IN (
+                          SELECT conname FROM pg_constraint
+                          WHERE conrelid = 'documents'::regclass
+                      )
+                """)
+                index_defs = cursor.fetchall()
+                for index_name, _ in index_defs:
+                    cursor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+            print(f"🗑️  Dropped {len(index_defs)} index(es) before COPY")
+
+        buffer.seek(0)
+        with raw_conn.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY documents (id, filename, original_filename, file_path, file_size, "
+                "category, machine_model, processing_status, upload_date, created_at, "
+                "updated_at) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        raw_conn.commit()
+        print(f"✅ Seeded {len(seeded)} document row(s) with COPY")
+
+        if index_defs:
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+            raw_conn.autocommit = True
+            with raw_conn.cursor() as cursor:
+                for _, index_def in index_defs:
+                    cursor.execute(
+                        index_def.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+                        .replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX CONCURRENTLY", 1)
+                    )
+            print(f"🔁 Rebuilt {len(index_defs)} index(es)")
+
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+
+    # Process seeded documents in-process (calling the task directly skips the broker)
+    for document_id, file_path, category, machine_model in seeded:
+        print(f"⚙️  Processing {document_id}...")
+        process_document_task(document_id, str(file_path), category.value, machine_model)
+
+
+def batch_load_documents() -> None:
+    """
+    Process all sample documents in-process and index them in one batch.
+
+    Page documents from every PDF are collected first and sent to
+    Elasticsearch with size-capped _bulk requests; at the same time the
+    document rows are inserted into PostgreSQL in one transaction,
+    PG_BATCH_SIZE rows per INSERT batch.
+    """
+    # Imported lazily: these require the full application settings
+    from datetime import datetime
+    from src.config import settings
+    from src.db.elasticsearch import get_elasticsearch_client
+    from src.db.postgres import Document, get_postgres_client
+    from src.models.document import DocumentCategory, ProcessingStatus
+    from src.services.document_processor import DocumentProcessor
+    from src.utils.pdf_utils import limit_pdf_to_max_pages, cleanup_limited_pdf
+
+    pg_client = get_postgres_client()
+    es_client = get_elasticsearch_client()
+    processor = DocumentProcessor()
+    storage_path = Path(settings.pdf_storage_path)
+    storage_path.mkdir(parents=True, exist_ok=True)
+
+    session = pg_client.get_session()
+    try:
+        existing_filenames = {
+            name for (name,) in session.query(Document.original_filename)
+        }
+    finally:
+        session.close()
+
+    # Parse, chunk and summarize every sample PDF
+    page_documents = []
+    rows = []
+    for doc_info in SAMPLE_DOCUMENTS:
+        filename = doc_info["filename"]
+        source_path = SAMPLE_FILES_DIR / filename
+
+        if filename in existing_filenames:
+            print(f"⏭️  Skipping {filename} (already exists)")
+            continue
+
+        if not source_path.exists():
+            print(f"⚠️  File not found: {filename}")
+            continue
+
+        document_id = str(uuid_utils.uuid7())
+        file_path = storage_path / f"{document_id}{source_path.suffix}"
+        shutil.copyfile(source_path, file_path)
+        category = DocumentCategory(doc_info["category"])
+
+        print(f"⚙️  Processing {filename}...")
+        pdf_to_process, _, was_truncated = limit_pdf_to_max_pages(file_path)
+        try:
+            documents = processor.prepare_documents(
+                file_path=pdf_to_process,
+                document_id=document_id,
+                original_filename=filename,
+                category=category,
+                machine_model=doc_info["machine_model"],
+            )
+        finally:
+            if was_truncated:
+                cleanup_limited_pdf(pdf_to_process)
+
+        page_documents.extend(documents)
+        rows.append({
+            "id": document_id,
+            "filename": file_path.name,
+            "original_filename": filename,
+            "file_path": str(file_path),
+            "file_size": file_path.stat().st_size,
+            "category": category,
+            "machine_model": doc_info["machine_model"],
+            "processing_status": ProcessingStatus.READY,
+            "total_pages": len(documents),
+        })
+
+    if not rows:
+        print("ℹ️  Nothing to load")
+        return
+
+    indexed_at = datetime.utcnow()
+    for row in rows:
+        row["indexed_at"] = indexed_at
+
+    # Elasticsearch and PostgreSQL writes are independent, so overlap them:
+    # pages are indexed with refresh suspended (requests split at
+    # ES_BULK_MAX_BYTES) while document rows go in one transaction
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        index_future = executor.submit(
+            es_client.bulk_index,
+            index_name="documents",
+            documents=page_documents,
+            max_chunk_bytes=ES_BULK_MAX_BYTES,
+            tune_refresh=True,
+        )
+        insert_future = executor.submit(
+            pg_client.bulk_create_documents, rows, chunk_size=PG_BATCH_SIZE
+        )
+        success, errors = index_future.result()
+        inserted = insert_future.result()
+
+    print(f"✅ Indexed {success} page(s), {len(errors)} error(s)")
+    print(f"✅ Inserted {inserted} document row(s)")
+
 
 def main():
     """Main function to load sample data."""
+    parser = argparse.ArgumentParser(description="Load sample PDF documents")
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Seed rows directly into PostgreSQL with COPY instead of using the API",
+    )
+    parser.add_argument(
+        "--drop-indexes",
+        action="store_true",
+        help="With --bulk: drop documents indexes before COPY and rebuild after (dev only)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Process all PDFs in-process and index them with batched _bulk requests",
+    )
+    args = parser.parse_args()
+
     print("📦 Document Search & Retrieval System - Sample Data Loader")
     print("=" * 60)
     print()
 
+    if args.drop_indexes and not args.bulk:
+        parser.error("--drop-indexes requires --bulk")
+
+    if args.bulk:
+        bulk_load_documents(drop_indexes=args.drop_indexes)
+        print()
+        print("✨ Bulk sample data loading complete!")
+        return
+
+    if args.batch:
+        batch_load_documents()
+        print()
+        print("✨ Batch sample data loading complete!")
+        return
+
     # Check configuration
     if not API_KEY:
         print("❌ Error: API_KEY not found in .env file")
@@ -202,9 +579,15 @@ def main():
     # Initialize loader
     loader = SampleDataLoader(API_BASE_URL, API_KEY)
 
-    # Check API health
+    # Check API health and fetch existing documents concurrently
     print("1️⃣  Checking API health...")
-    if not loader.check_health():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        health_future = executor.submit(loader.check_health)
+        docs_future = executor.submit(loader.list_documents)
+        healthy = health_future.result()
+        existing_docs = docs_future.result()
+
+    if not healthy:
         print("❌ API is not healthy. Please start the application:")
         print("   ./scripts/run_app.sh")
         sys.exit(1)
@@ -213,7 +596,6 @@ def main():
 
     # Get existing documents
     print("2️⃣  Checking existing documents...")
-    existing_docs = loader.list_documents()
     existing_filenames = {doc["filename"] for doc in existing_docs}
     print(f"ℹ️  Found {len(existing_docs)} existing document(s)")
     print()
@@ -226,9 +608,14 @@ def main():
     skipped_count = 0
     failed_count = 0
 
+    # One directory read instead of a stat() per sample file
+    with os.scandir(SAMPLE_FILES_DIR) as entries:
+        present_filenames = {entry.name for entry in entries if entry.is_file()}
+
+    # Collect documents that still need to be uploaded
+    pending = []
     for doc_info in SAMPLE_DOCUMENTS:
         filename = doc_info["filename"]
-        file_path = SAMPLE_FILES_DIR / filename
 
         # Skip if already exists
         if filename in existing_filenames:
@@ -237,32 +624,54 @@ def main():
             continue
 
         # Check if file exists
-        if not file_path.exists():
-            print(f"⚠️  File not found: {file_path.name}")
+        if filename not in present_filenames:
+            print(f"⚠️  File not found: {filename}")
             continue
 
-        try:
-            # Upload document
-            result = loader.upload_document(
+        pending.append((doc_info, SAMPLE_FILES_DIR / filename))
+
+    with ThreadPoolExecutor(max_workers=len(SAMPLE_DOCUMENTS)) as executor:
+        # Fire all uploads first
+        upload_futures = {
+            executor.submit(
+                loader.upload_document,
                 file_path=file_path,
                 category=doc_info["category"],
                 machine_model=doc_info["machine_model"],
-            )
+            ): doc_info["filename"]
+            for doc_info, file_path in pending
+        }
 
-            # Wait for processing
-            success = loader.wait_for_processing(result["document_id"], timeout=300)
+        document_ids = []
+        for future in as_completed(upload_futures):
+            filename = upload_futures[future]
+            try:
+                document_ids.append(future.result()["document_id"])
+            except Exception as e:
+                print(f"❌ Error uploading {filename}: {e}")
+                failed_count += 1
+
+        print()
+
+        # Then wait for all uploaded documents to finish processing
+        wait_futures = {
+            executor.submit(loader.wait_for_processing, document_id, timeout=300): document_id
+            for document_id in document_ids
+        }
+
+        for future in as_completed(wait_futures):
+            try:
+                success = future.result()
+            except Exception as e:
+                print(f"❌ Error processing {wait_futures[future]}: {e}")
+                success = False
 
             if success:
                 uploaded_count += 1
             else:
                 failed_count += 1
 
-            print()
-
-        except Exception as e:
-            print(f"❌ Error uploading {filename}: {e}")
-            failed_count += 1
-            print()
+    print()
 
     # Summary
     print("=" * 60)
@@ -274,16 +683,23 @@ def main():
 
     # List all documents
     print("4️⃣  Final document list:")
+    # Reuse the startup listing unless the document count has changed
     all_docs = loader.list_documents()
+    if loader.count_documents() != len(all_docs):
+        all_docs = loader.list_documents(refresh=True)
     if all_docs:
         print()
-        for doc in all_docs:
-            status_icon = "✅" if doc["processing_status"] == "ready" else "⏳"
-            print(
-                f"{status_icon} {doc['filename']:<30} | "
+        # Build the whole listing and write it once
+        sys.stdout.write(
+            "\n".join(
+                f"{'✅' if doc['processing_status'] == 'ready' else '⏳'} "
+                f"{doc['filename']:<30} | "
                 f"{doc['category']:<15} | "
                 f"Status: {doc['processing_status']}"
+                for doc in all_docs
             )
+            + "\n"
+        )
     print()
 
     print("✨ Sample data loading complete!")
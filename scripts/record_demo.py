@@ -2,96 +2,142 @@
 """
 Screen recording script for Document Search & Retrieval System demo.
 Creates a video showing two search examples with the live system.
+
+Each search is recorded in its own browser context in parallel, and the
+two clips are stitched together with ffmpeg afterwards.
 """
 
 import asyncio
-import time
-from playwright.async_api import async_playwright
-
-
-async def record_demo():
-    """Record a demo video of the search system."""
-
-    async with async_playwright() as p:
-        # Launch browser with video recording enabled
-        browser = await p.chromium.launch(
-            headless=True,   # Must use headless in container without X server
-            slow_mo=800      # Slow down actions for better visibility (800ms delay)
-        )
-
-        # Create context with video recording
-        context = await browser.new_context(
-            record_video_dir="static/",
-            record_video_size={"width": 1280, "height": 720},
-            viewport={"width": 1280, "height": 720}
-        )
-
-        page = await context.new_page()
-
-        print("🎬 Starting demo recording...")
-
-        # Navigate to the search page
-        print("📄 Loading search interface...")
-        await page.goto("http://localhost:8000")
-        await page.wait_for_load_state("networkidle")
-        await asyncio.sleep(2)  # Pause to show initial state
-
-        # Demo 1: Search for "User Requirement Specification"
-        print("🔍 Demo 1: Searching for 'User Requirement Specification'...")
-        search_box = page.locator('input[placeholder*="Search for"]')
-        await search_box.click()
-        await search_box.fill("User Requirement Specification")
-        await asyncio.sleep(1)
-
-        # Click search button
-        await page.locator('button:has-text("Search")').click()
-        await page.wait_for_load_state("networkidle")
-        await asyncio.sleep(3)  # Pause to show results
-
-        # Scroll down to show more results
-        await page.evaluate("window.scrollTo(0, 400)")
-        await asyncio.sleep(2)
-
+import subprocess
+import tempfile
+from pathlib import Path
+from playwright.async_api import async_playwright, BrowserContext
+
+OUTPUT_VIDEO = Path("static/demo.webm")
+VIDEO_SIZE = {"width": 1280, "height": 720}
+
+
+async def demo_search(
+    context: BrowserContext, query: str, expand_full_content: bool = False
+) -> Path:
+    """
+    Record a single search demo in its own browser context.
+
+    Args:
+        context: Browser context with video recording enabled
+        query: Search query to type into the UI
+        expand_full_content: Whether to expand the first result's full content
+
+    Returns:
+        Path: Path to the recorded video for this demo
+    """
+    page = await context.new_page()
+
+    # Build locators once and reuse them for every action on this page
+    search_box = page.locator('input[placeholder*="Search for"]')
+    search_btn = page.locator('button:has-text("Search")')
+    show_full_btn = page.locator('button:has-text("Show Full Content")').first
+    first_result = page.locator(".result-card").first
+    first_full_content = page.locator(".result-full-content:not(.content-hidden)").first
+
+    # Navigate to the search page
+    print(f"📄 Loading search interface for '{query}'...")
+    await page.goto("http://localhost:8000")
+    await page.wait_for_load_state("networkidle")
+
+    print(f"🔍 Searching for '{query}'...")
+    await search_box.click()
+    await search_box.fill(query)
+
+    # Click search button and wait for results to render
+    async with page.expect_response("**/api/v1/search"):
+        await search_btn.click()
+    await first_result.wait_for(state="visible", timeout=5000)
+
+    # Scroll down to show more results
+    await page.evaluate("window.scrollTo(0, 400)")
+    await page.wait_for_function("window.scrollY >= 400")
+
+    if expand_full_content:
         # Click "Show Full Content" on first result
         print("📖 Expanding full content...")
-        await page.locator('button:has-text("Show Full Content")').first.click()
-        await asyncio.sleep(3)  # Pause to show full content
+        await show_full_btn.click()
+        await first_full_content.wait_for(state="visible", timeout=5000)
 
         # Scroll down to show the expanded content
         await page.evaluate("window.scrollTo(0, 600)")
-        await asyncio.sleep(2)
+        await page.wait_for_function("window.scrollY >= 600")
+
+    # Scroll back to top
+    await page.evaluate("window.scrollTo(0, 0)")
+    await page.wait_for_function("window.scrollY === 0")
+
+    # Close the page and context to finalize the video
+    await page.close()
+    await context.close()
+
+    return Path(await page.video.path())
+
 
-        # Scroll back up
-        await page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(1)
+def concat_videos(videos: list[Path], output: Path) -> None:
+    """
+    Concatenate recorded clips into a single video with ffmpeg.
 
-        # Demo 2: Search for "safety procedures"
-        print("🔍 Demo 2: Searching for 'safety procedures'...")
-        await search_box.click()
-        await search_box.fill("safety procedures")
-        await asyncio.sleep(1)
+    Args:
+        videos: Clips to join, in playback order
+        output: Destination video path
+    """
+    inputs = []
+    for video in videos:
+        inputs += ["-i", str(video)]
 
-        # Click search button
-        await page.locator('button:has-text("Search")').click()
-        await page.wait_for_load_state("networkidle")
-        await asyncio.sleep(3)  # Pause to show results
+    streams = "".join(f"[{i}:v]" for i in range(len(videos)))
+    subprocess.run(
+        [
+            "ffmpeg", "-y", *inputs,
+            "-filter_complex", f"{streams}concat=n={len(videos)}:v=1:a=0[v]",
+            "-map", "[v]",
+            str(output),
+        ],
+        check=True,
+    )
 
-        # Scroll down to show more results
-        await page.evaluate("window.scrollTo(0, 400)")
-        await asyncio.sleep(2)
 
-        # Scroll back to top
-        await page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(2)
+async def record_demo():
+    """Record a demo video of the search system."""
 
-        print("✅ Demo recording complete!")
+    async with async_playwright() as p:
+        # Launch browser with video recording enabled
+        browser = await p.chromium.launch(
+            headless=True,   # Must use headless in container without X server
+            slow_mo=300      # Slow down actions for better visibility (300ms delay)
+        )
 
-        # Close the page and context to finalize the video
-        await page.close()
-        await context.close()
-        await browser.close()
+        print("🎬 Starting demo recording...")
 
-        print("💾 Video saved to static/ directory")
+        with tempfile.TemporaryDirectory() as video_dir:
+            # One recording context per demo so both run in parallel
+            contexts = [
+                await browser.new_context(
+                    record_video_dir=f"{video_dir}/{i}",
+                    record_video_size=VIDEO_SIZE,
+                    viewport=VIDEO_SIZE
+                )
+                for i in range(2)
+            ]
+
+            videos = await asyncio.gather(
+                demo_search(contexts[0], "User Requirement Specification", expand_full_content=True),
+                demo_search(contexts[1], "safety procedures"),
+            )
+
+            await browser.close()
+            print("✅ Demo recording complete!")
+
+            print("🎞️  Stitching clips...")
+            concat_videos(list(videos), OUTPUT_VIDEO)
+
+        print(f"💾 Video saved to {OUTPUT_VIDEO}")
         print("🎉 Demo video generation complete!")
 
 
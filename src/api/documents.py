@@ -2,11 +2,19 @@
 Document management API endpoints.
 """
 
-import uuid
+import asyncio
+import base64
+import binascii
+import os
+import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+import aiofiles
+import msgspec
+import uuid_utils
 from fastapi import (
     APIRouter,
     UploadFile,
@@ -15,8 +23,9 @@ from fastapi import (
     HTTPException,
     status,
     Depends,
-    BackgroundTasks,
     Query,
+    Request,
+    Response,
 )
 from fastapi.responses import FileResponse
 
@@ -26,19 +35,88 @@ from src.models.document import (
     DocumentListResponse,
     DocumentCategory,
     ProcessingStatus,
-    DocumentMetadata,
+    DocumentMetadataStruct,
+    DocumentListStruct,
 )
 from src.db.postgres import get_postgres_client
 from src.db.elasticsearch import get_elasticsearch_client
-from src.services.document_processor import DocumentProcessor
 from src.config import settings
+from src.tasks import process_document_task
 from src.utils.auth import verify_api_key
 from src.utils.logging import get_logger
-from src.utils.pdf_utils import limit_pdf_to_max_pages, cleanup_limited_pdf
+from src.utils.responses import etag_matches
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
+# Every document endpoint requires a valid API key
+router = APIRouter(
+    prefix="/api/v1/documents",
+    tags=["documents"],
+    dependencies=[Depends(verify_api_key)],
+)
+
+# Upload read/write chunk size in bytes
+CHUNK_SIZE = 1024 * 1024
+
+# Maximum accepted upload size in bytes
+MAX_SIZE = settings.max_file_size_bytes
+
+# Download read chunk size in bytes (FileResponse defaults to 64 KiB)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Stored PDFs never change after upload, so downloads can be cached forever
+DOWNLOAD_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Statuses after which a document's status response no longer changes
+_TERMINAL_STATUSES = frozenset({ProcessingStatus.READY, ProcessingStatus.FAILED})
+
+# Shared encoder for the list endpoint's msgspec payload
+_list_encoder = msgspec.json.Encoder()
+
+# Enum lookup tables, built once instead of per request
+_CATEGORY_BY_NAME: dict[str, DocumentCategory] = {c.value: c for c in DocumentCategory}
+_CATEGORY_VALUES: tuple[str, ...] = tuple(_CATEGORY_BY_NAME)
+_STATUS_BY_NAME: dict[str, ProcessingStatus] = {s.value: s for s in ProcessingStatus}
+_STATUS_VALUES: tuple[str, ...] = tuple(_STATUS_BY_NAME)
+
+
+def _encode_cursor(upload_date: datetime, document_id: str) -> str:
+    """
+    Encode a list_documents keyset cursor as an opaque URL-safe token.
+
+    Args:
+        upload_date: upload_date of the last document on the page
+        document_id: ID of the last document on the page
+
+    Returns:
+        str: Cursor token for the ``after`` query parameter
+    """
+    raw = f"{upload_date.isoformat()}|{document_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor token produced by _encode_cursor.
+
+    Args:
+        cursor: Cursor token from the ``after`` query parameter
+
+    Returns:
+        tuple: (upload_date, document_id)
+
+    Raises:
+        HTTPException: If the token is malformed
+    """
+    try:
+        upload_date, document_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+        return datetime.fromisoformat(upload_date), document_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
 
 
 def validate_pdf_file(file: UploadFile) -> None:
@@ -66,6 +144,66 @@ def validate_pdf_file(file: UploadFile) -> None:
         )
 
 
+def _copy_rolled_upload(file: UploadFile, file_path: Path) -> Optional[int]:
+    """
+    Copy a disk-backed upload to storage without passing bytes through Python.
+
+    Starlette spools uploads into a SpooledTemporaryFile that rolls over to a
+    real temporary file once it grows past its in-memory limit. On Linux such
+    a file can be copied in the kernel with copy_file_range(2), falling back
+    to sendfile(2) where the two files live on filesystems that do not
+    support it.
+
+    Args:
+        file: Uploaded file
+        file_path: Destination path
+
+    Returns:
+        Optional[int]: Bytes copied, or None if the fast path does not apply
+
+    Raises:
+        HTTPException: If the file is too large
+    """
+    spooled = file.file
+    if (
+        sys.platform != "linux"
+        or not isinstance(spooled, tempfile.SpooledTemporaryFile)
+        or not getattr(spooled, "_rolled", False)
+    ):
+        return None
+
+    in_fd = spooled.fileno()
+    file_size = os.fstat(in_fd).st_size
+    if file_size > MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File size exceeds maximum allowed size of {settings.max_file_size_mb}MB",
+        )
+
+    out_fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        offset = 0
+        use_copy_file_range = True
+        while offset < file_size:
+            count = min(CHUNK_SIZE, file_size - offset)
+            if use_copy_file_range:
+                try:
+                    copied = os.copy_file_range(in_fd, out_fd, count, offset_src=offset)
+                except OSError:
+                    # e.g. EXDEV across filesystems; sendfile handles file-to-file too
+                    use_copy_file_range = False
+                    continue
+            else:
+                copied = os.sendfile(out_fd, in_fd, offset, count)
+            if copied == 0:
+                break
+            offset += copied
+    finally:
+        os.close(out_fd)
+
+    return offset
+
+
 async def save_uploaded_file(
     file: UploadFile, document_id: str, storage_path: Path
 ) -> tuple[Path, int]:
@@ -92,15 +230,20 @@ async def save_uploaded_file(
 
     # Save file and check size
     file_size = 0
-    max_size = settings.max_file_size_mb * 1024 * 1024  # Convert to bytes
 
     try:
-        with open(file_path, "wb") as f:
-            while chunk := await file.read(8192):  # Read in 8KB chunks
-                file_size += len(chunk)
+        copied_size = await asyncio.to_thread(_copy_rolled_upload, file, file_path)
+        if copied_size is not None:
+            logger.info("Saved file: %s (%d bytes)", file_path, copied_size)
+            return file_path, copied_size
+
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await file.read(CHUNK_SIZE):
+                # write() reports the bytes written, so no separate len() is needed
+                file_size += await f.write(chunk)
 
                 # Check size limit
-                if file_size > max_size:
+                if file_size > MAX_SIZE:
                     # Delete partial file
                     file_path.unlink(missing_ok=True)
                     raise HTTPException(
@@ -108,9 +251,7 @@ async def save_uploaded_file(
                         detail=f"File size exceeds maximum allowed size of {settings.max_file_size_mb}MB",
                     )
 
-                f.write(chunk)
-
-        logger.info(f"Saved file: {file_path} ({file_size} bytes)")
+        logger.info("Saved file: %s (%d bytes)", file_path, file_size)
         return file_path, file_size
 
     except HTTPException:
@@ -118,118 +259,26 @@ async def save_uploaded_file(
     except Exception as e:
         # Clean up partial file
         file_path.unlink(missing_ok=True)
-        logger.error(f"Failed to save file: {e}")
+        logger.error("Failed to save file: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save file: {str(e)}",
         )
 
 
-async def process_document_task(
-    document_id: str,
-    file_path: Path,
-    category: DocumentCategory,
-    machine_model: Optional[str] = None,
-) -> None:
-    """
-    Background task to process uploaded document.
-
-    Args:
-        document_id: Document ID
-        file_path: Path to PDF file
-        category: Document category
-        machine_model: Optional machine model
-    """
-    processor = DocumentProcessor()
-    pg_client = get_postgres_client()
-    limited_pdf_path = None
-
-    try:
-        # Get document record to fetch original filename
-        doc = pg_client.get_document(document_id)
-        if not doc:
-            raise ValueError(f"Document {document_id} not found in database")
-
-        original_filename = doc.original_filename
-
-        # Update status to parsing
-        pg_client.update_document_status(document_id, ProcessingStatus.PARSING)
-
-        # Check PDF page count and create limited version if needed
-        # This handles LandingAI's 50-page limitation
-        pdf_to_process, original_page_count, was_truncated = limit_pdf_to_max_pages(file_path)
-
-        if was_truncated:
-            limited_pdf_path = pdf_to_process
-            logger.warning(
-                f"Document {document_id} truncated from {original_page_count} to 50 pages "
-                f"due to LandingAI limitation"
-            )
-            # Add truncation info to error message field for user awareness
-            pg_client.update_document_status(
-                document_id=document_id,
-                status=ProcessingStatus.PARSING,
-                error_message=f"Note: PDF truncated from {original_page_count} to 50 pages for processing"
-            )
-
-        # Process document (with limited version if truncated)
-        result = processor.process_document(
-            file_path=pdf_to_process,
-            document_id=document_id,
-            original_filename=original_filename,
-            category=category,
-            machine_model=machine_model,
-            generate_summaries=True,
-        )
-
-        # Update status to ready
-        final_error_msg = None
-        if was_truncated:
-            final_error_msg = f"Note: Original PDF had {original_page_count} pages, processed first 50 pages only"
-
-        pg_client.update_document_status(
-            document_id=document_id,
-            status=ProcessingStatus.READY,
-            total_pages=result.get("total_pages"),
-            indexed_at=datetime.utcnow(),
-            error_message=final_error_msg
-        )
-
-        logger.info(f"Document {document_id} processed successfully")
-
-    except Exception as e:
-        logger.error(f"Document processing failed for {document_id}: {e}")
-
-        # Update status to failed
-        pg_client.update_document_status(
-            document_id=document_id,
-            status=ProcessingStatus.FAILED,
-            error_message=str(e),
-        )
-
-    finally:
-        # Clean up limited PDF if it was created
-        if limited_pdf_path:
-            cleanup_limited_pdf(limited_pdf_path)
-
-
 @router.post("/upload", response_model=DocumentUploadResponse, status_code=202)
 async def upload_document(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     category: str = Form(...),
     machine_model: Optional[str] = Form(None),
-    api_key: str = Depends(verify_api_key),
 ) -> DocumentUploadResponse:
     """
     Upload a PDF document for processing.
 
     Args:
-        background_tasks: FastAPI background tasks
         file: PDF file to upload
         category: Document category (maintenance, operations, spare_parts)
         machine_model: Optional machine model identifier
-        api_key: API key for authentication
 
     Returns:
         DocumentUploadResponse: Upload response with document ID and status
@@ -241,16 +290,15 @@ async def upload_document(
     validate_pdf_file(file)
 
     # Validate category
-    try:
-        doc_category = DocumentCategory(category.lower().replace(" ", "_"))
-    except ValueError:
+    doc_category = _CATEGORY_BY_NAME.get(category.lower().replace(" ", "_"))
+    if doc_category is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid category. Must be one of: {[c.value for c in DocumentCategory]}",
+            detail=f"Invalid category. Must be one of: {list(_CATEGORY_VALUES)}",
         )
 
     # Generate document ID
-    document_id = str(uuid.uuid4())
+    document_id = str(uuid_utils.uuid7())
 
     # Save file
     storage_path = Path(settings.pdf_storage_path)
@@ -260,7 +308,8 @@ async def upload_document(
     pg_client = get_postgres_client()
 
     try:
-        pg_client.create_document(
+        await asyncio.to_thread(
+            pg_client.create_document,
             document_id=document_id,
             filename=file_path.name,  # Storage filename (UUID.pdf)
             original_filename=file.filename,  # Original uploaded filename
@@ -272,23 +321,42 @@ async def upload_document(
     except Exception as e:
         # Clean up file if database insert fails
         file_path.unlink(missing_ok=True)
-        logger.error(f"Failed to create document record: {e}")
+        logger.error("Failed to create document record: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create document record: {str(e)}",
         )
 
-    # Queue background processing
-    background_tasks.add_task(
-        process_document_task,
-        document_id=document_id,
-        file_path=file_path,
-        category=doc_category,
-        machine_model=machine_model,
-    )
+    # Queue processing on the Celery worker pool (publishing to the broker
+    # blocks, so keep it off the event loop)
+    try:
+        await asyncio.to_thread(
+            process_document_task.delay,
+            document_id,
+            str(file_path),
+            doc_category.value,
+            machine_model,
+        )
+    except Exception as e:
+        logger.error("Failed to queue document %s for processing: %s", document_id, e)
+        try:
+            await asyncio.to_thread(
+                pg_client.update_document_status,
+                document_id,
+                ProcessingStatus.FAILED,
+                error_message=f"Failed to queue for processing: {str(e)}",
+            )
+        except Exception as status_error:
+            logger.error(
+                "Failed to mark document %s as failed: %s", document_id, status_error
+            )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Document processing queue is unavailable, please retry later",
+        )
 
     logger.info(
-        f"Document {document_id} uploaded and queued for processing: {file.filename}"
+        "Document %s uploaded and queued for processing: %s", document_id, file.filename
     )
 
     return DocumentUploadResponse(
@@ -301,14 +369,18 @@ async def upload_document(
 
 @router.get("/{document_id}", response_model=DocumentStatusResponse)
 async def get_document_status(
-    document_id: str, api_key: str = Depends(verify_api_key)
+    document_id: str, request: Request, response: Response
 ) -> DocumentStatusResponse:
     """
     Get document metadata and processing status.
 
+    Once processing has finished (ready or failed) the response carries an
+    ETag, so pollers can revalidate with If-None-Match and get a 304.
+
     Args:
         document_id: Document ID
-        api_key: API key for authentication
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for caching headers)
 
     Returns:
         DocumentStatusResponse: Document status information
@@ -317,7 +389,7 @@ async def get_document_status(
         HTTPException: If document not found
     """
     pg_client = get_postgres_client()
-    doc = pg_client.get_document(document_id)
+    doc = await asyncio.to_thread(pg_client.get_document, document_id)
 
     if not doc:
         raise HTTPException(
@@ -325,6 +397,17 @@ async def get_document_status(
             detail=f"Document not found: {document_id}",
         )
 
+    response.headers["Cache-Control"] = "no-cache"
+    if doc.processing_status in _TERMINAL_STATUSES:
+        indexed_at = doc.indexed_at.timestamp() if doc.indexed_at else 0
+        etag = f'"{doc.id}-{doc.processing_status.value}-{indexed_at}"'
+        if etag_matches(request, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "no-cache"},
+            )
+        response.headers["ETag"] = etag
+
     return DocumentStatusResponse(
         document_id=doc.id,
         filename=doc.original_filename,  # Use original filename for display
@@ -342,20 +425,25 @@ async def list_documents(
     category: Optional[str] = None,
     page: int = 1,
     page_size: int = 10,
-    api_key: str = Depends(verify_api_key),
-) -> DocumentListResponse:
+    after: Optional[str] = None,
+) -> Response:
     """
     List documents with optional filters and pagination.
 
+    Pages are fetched by offset unless ``after`` is given; then the page
+    starts right after that cursor with an index seek, so deep pages cost
+    the same as the first. Every full page returns a ``next_cursor``.
+
     Args:
         doc_status: Optional status filter
         category: Optional category filter
-        page: Page number (1-indexed)
+        page: Page number (1-indexed), ignored when after is given
         page_size: Items per page (max 100)
-        api_key: API key for authentication
+        after: Optional next_cursor from a previous page
 
     Returns:
-        DocumentListResponse: Paginated list of documents
+        Response: Paginated list of documents (DocumentListResponse schema),
+            encoded with msgspec
 
     Raises:
         HTTPException: If validation fails
@@ -375,69 +463,91 @@ async def list_documents(
     # Parse filters
     status_filter = None
     if doc_status:
-        try:
-            status_filter = ProcessingStatus(doc_status)
-        except ValueError:
+        status_filter = _STATUS_BY_NAME.get(doc_status)
+        if status_filter is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status. Must be one of: {[s.value for s in ProcessingStatus]}",
+                detail=f"Invalid status. Must be one of: {list(_STATUS_VALUES)}",
             )
 
     category_filter = None
     if category:
-        try:
-            category_filter = DocumentCategory(category)
-        except ValueError:
+        category_filter = _CATEGORY_BY_NAME.get(category)
+        if category_filter is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid category. Must be one of: {[c.value for c in DocumentCategory]}",
+                detail=f"Invalid category. Must be one of: {list(_CATEGORY_VALUES)}",
             )
 
     # Get documents
     pg_client = get_postgres_client()
-    offset = (page - 1) * page_size
 
-    docs = pg_client.list_documents(
-        status=status_filter, category=category_filter, limit=page_size, offset=offset
-    )
-
-    total = pg_client.count_documents(status=status_filter, category=category_filter)
-
-    # Convert to metadata models
-    document_list = []
-    for doc in docs:
-        document_list.append(
-            DocumentMetadata(
-                document_id=doc.id,
-                filename=doc.original_filename,  # Use original filename for display
-                file_size=doc.file_size,
-                file_path=doc.file_path,
-                category=doc.category,
-                machine_model=doc.machine_model,
-                part_numbers=[],  # Not stored in DB currently
-                upload_date=doc.upload_date,
-                processing_status=doc.processing_status,
-                indexed_at=doc.indexed_at,
-                error_message=doc.error_message,
-                total_pages=doc.total_pages,
-            )
+    if after is not None:
+        after_upload_date, after_id = _decode_cursor(after)
+        (rows, cursor), total = await asyncio.gather(
+            asyncio.to_thread(
+                pg_client.list_documents,
+                status=status_filter,
+                category=category_filter,
+                limit=page_size,
+                after_upload_date=after_upload_date,
+                after_id=after_id,
+            ),
+            asyncio.to_thread(
+                pg_client.count_documents, status=status_filter, category=category_filter
+            ),
+        )
+    else:
+        offset = (page - 1) * page_size
+        rows, total = await asyncio.to_thread(
+            pg_client.list_documents_with_total,
+            status=status_filter,
+            category=category_filter,
+            limit=page_size,
+            offset=offset,
+        )
+        cursor = None
+        if len(rows) == page_size and offset + page_size < total:
+            cursor = (rows[-1]["upload_date"], rows[-1]["document_id"])
+
+    # Convert to metadata models; filename is already the original filename
+    document_list = [
+        DocumentMetadataStruct(
+            document_id=row["document_id"],
+            filename=row["filename"],
+            file_size=row["file_size"],
+            file_path=row["file_path"],
+            category=row["category"],
+            machine_model=row["machine_model"],
+            part_numbers=[],  # Not stored in DB currently
+            upload_date=row["upload_date"],
+            processing_status=row["processing_status"],
+            indexed_at=row["indexed_at"],
+            error_message=row["error_message"],
+            total_pages=row["total_pages"],
+        )
+        for row in rows
+    ]
+
+    payload = _list_encoder.encode(
+        DocumentListStruct(
+            total=total,
+            page=page,
+            page_size=page_size,
+            documents=document_list,
+            next_cursor=_encode_cursor(*cursor) if cursor else None,
         )
-
-    return DocumentListResponse(
-        total=total, page=page, page_size=page_size, documents=document_list
     )
+    return Response(content=payload, media_type="application/json")
 
 
 @router.delete("/{document_id}", status_code=204)
-async def delete_document(
-    document_id: str, api_key: str = Depends(verify_api_key)
-) -> None:
+async def delete_document(document_id: str) -> None:
     """
     Delete a document and all associated data.
 
     Args:
         document_id: Document ID
-        api_key: API key for authentication
 
     Raises:
         HTTPException: If document not found or deletion fails
@@ -446,54 +556,64 @@ async def delete_document(
     es_client = get_elasticsearch_client()
 
     # Get document
-    doc = pg_client.get_document(document_id)
+    doc = await asyncio.to_thread(pg_client.get_document, document_id)
     if not doc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Document not found: {document_id}",
         )
 
-    # Delete from Elasticsearch
-    try:
+    def delete_from_elasticsearch() -> None:
         # Delete all pages for this document
         es_client.delete_by_query(
-            index="documents",
-            body={"query": {"term": {"document_id.keyword": document_id}}},
+            index_name="documents",
+            query={"query": {"term": {"document_id": document_id}}},
         )
-        logger.info(f"Deleted Elasticsearch documents for {document_id}")
-    except Exception as e:
-        logger.warning(f"Failed to delete from Elasticsearch: {e}")
-        # Continue with deletion even if ES fails
+        logger.info("Deleted Elasticsearch documents for %s", document_id)
 
-    # Delete PDF file
-    try:
+    def delete_file() -> None:
         file_path = Path(doc.file_path)
-        if file_path.exists():
+        try:
             file_path.unlink()
-            logger.info(f"Deleted file: {file_path}")
-    except Exception as e:
-        logger.warning(f"Failed to delete file: {e}")
-        # Continue with deletion even if file deletion fails
+            logger.info("Deleted file: %s", file_path)
+        except FileNotFoundError:
+            pass
+
+    # The three deletions are independent, so run them concurrently
+    es_result, file_result, pg_result = await asyncio.gather(
+        asyncio.to_thread(delete_from_elasticsearch),
+        asyncio.to_thread(delete_file),
+        asyncio.to_thread(pg_client.delete_document, document_id),
+        return_exceptions=True,
+    )
+
+    # Continue with deletion even if ES or file deletion fails
+    if isinstance(es_result, Exception):
+        logger.warning("Failed to delete from Elasticsearch: %s", es_result)
+    if isinstance(file_result, Exception):
+        logger.warning("Failed to delete file: %s", file_result)
 
-    # Delete from database
-    pg_client.delete_document(document_id)
+    # The database record is authoritative, so its failure is not tolerated
+    if isinstance(pg_result, Exception):
+        raise pg_result
 
-    logger.info(f"Document {document_id} deleted successfully")
+    logger.info("Document %s deleted successfully", document_id)
 
 
 @router.get("/{document_id}/download")
-async def download_document(
-    document_id: str, api_key: str = Depends(verify_api_key)
-) -> FileResponse:
+async def download_document(document_id: str, request: Request) -> Response:
     """
     Download the original PDF document.
 
+    PDFs are immutable after upload, so the response is cacheable forever
+    and a matching If-None-Match short-circuits to 304.
+
     Args:
         document_id: Document ID
-        api_key: API key for authentication
+        request: Incoming request (for If-None-Match)
 
     Returns:
-        FileResponse: PDF file download
+        Response: PDF file download, or 304 if the client copy is current
 
     Raises:
         HTTPException: If document not found or file missing
@@ -501,24 +621,35 @@ async def download_document(
     pg_client = get_postgres_client()
 
     # Get document
-    doc = pg_client.get_document(document_id)
+    doc = await asyncio.to_thread(pg_client.get_document, document_id)
     if not doc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Document not found: {document_id}",
         )
 
-    # Check if file exists
+    etag = f'"{document_id}"'
+    cache_headers = {"ETag": etag, "Cache-Control": DOWNLOAD_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    # Check if file exists (the stat result also sizes the response)
     file_path = Path(doc.file_path)
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"PDF file not found for document {document_id}",
         )
 
     # Return file
-    return FileResponse(
+    response = FileResponse(
         path=file_path,
         media_type="application/pdf",
         filename=doc.filename,
+        stat_result=stat_result,
+        headers=cache_headers,
     )
+    response.chunk_size = DOWNLOAD_CHUNK_SIZE
+    return response
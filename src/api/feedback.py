@@ -2,8 +2,10 @@
 Feedback API endpoints.
 """
 
-import uuid
+import asyncio
 from datetime import datetime
+
+import uuid_utils
 from fastapi import APIRouter, HTTPException, status
 from typing import Dict
 
@@ -40,24 +42,28 @@ async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
     Raises:
         HTTPException: If document not found or database error
     """
-    logger.info(f"Feedback submission: {request.rating.value} for document {request.document_id} page {request.page}")
+    logger.info(
+        "Feedback submission: %s for document %s page %s",
+        request.rating.value, request.document_id, request.page,
+    )
 
     pg_client = get_postgres_client()
 
     # Verify document exists
-    document = pg_client.get_document(request.document_id)
+    document = await asyncio.to_thread(pg_client.get_document, request.document_id)
     if not document:
-        logger.warning(f"Feedback rejected: document not found {request.document_id}")
+        logger.warning("Feedback rejected: document not found %s", request.document_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Document not found: {request.document_id}"
         )
 
     # Create feedback record
-    feedback_id = str(uuid.uuid4())
+    feedback_id = str(uuid_utils.uuid7())
 
     try:
-        feedback = pg_client.create_feedback(
+        feedback = await asyncio.to_thread(
+            pg_client.create_feedback,
             feedback_id=feedback_id,
             query=request.query,
             document_id=request.document_id,
@@ -66,7 +72,7 @@ async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
             session_id=request.session_id
         )
 
-        logger.info(f"Feedback created: {feedback_id}")
+        logger.info("Feedback created: %s", feedback_id)
 
         # Invalidate search service cache for this document page
         search_service = get_search_service()
@@ -83,7 +89,7 @@ async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
         )
 
     except Exception as e:
-        logger.error(f"Failed to create feedback: {e}")
+        logger.error("Failed to create feedback: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to submit feedback: {str(e)}"
@@ -110,12 +116,12 @@ async def get_feedback_stats(document_id: str, page: int) -> FeedbackStats:
     Raises:
         HTTPException: If document not found or database error
     """
-    logger.info(f"Fetching feedback stats for document {document_id} page {page}")
+    logger.info("Fetching feedback stats for document %s page %s", document_id, page)
 
     pg_client = get_postgres_client()
 
     # Verify document exists
-    document = pg_client.get_document(document_id)
+    document = await asyncio.to_thread(pg_client.get_document, document_id)
     if not document:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -123,28 +129,19 @@ async def get_feedback_stats(document_id: str, page: int) -> FeedbackStats:
         )
 
     try:
-        stats = pg_client.get_feedback_stats(document_id, page)
-
-        # Calculate boost score
-        positive_count = stats["positive_count"]
-        negative_count = stats["negative_count"]
-        net_votes = positive_count - negative_count
-        boost_score = 1.0 + (net_votes * 0.1)
-
-        # Clamp boost score to reasonable range (0.1 to 3.0)
-        boost_score = max(0.1, min(3.0, boost_score))
+        stats = await asyncio.to_thread(pg_client.get_feedback_stats, document_id, page)
 
         return FeedbackStats(
             document_id=document_id,
             page=page,
-            positive_count=positive_count,
-            negative_count=negative_count,
+            positive_count=stats["positive_count"],
+            negative_count=stats["negative_count"],
             total_count=stats["total_count"],
-            boost_score=boost_score
+            boost_score=stats["boost_score"]
         )
 
     except Exception as e:
-        logger.error(f"Failed to get feedback stats: {e}")
+        logger.error("Failed to get feedback stats: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve feedback statistics: {str(e)}"
@@ -2,6 +2,8 @@
 Search API endpoints.
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, status
 from typing import Optional
 
@@ -48,27 +50,28 @@ async def search_documents(request: SearchRequest) -> SearchResponse:
         HTTPException: 400 if query is invalid, 500 if search fails
     """
     try:
-        logger.info(f"Search request: query='{request.query}', page={request.page}")
+        logger.info("Search request: query='%s', page=%s", request.query, request.page)
 
-        # Execute search
+        # Execute search; the service makes blocking ES and PostgreSQL
+        # calls, so keep them off the event loop
         search_service = get_search_service()
-        response = search_service.search(request)
+        response = await asyncio.to_thread(search_service.search, request)
 
         logger.info(
-            f"Search completed: {response.total} results, "
-            f"{response.took}ms, page {response.page}/{response.total_pages}"
+            "Search completed: %s results, %sms, page %s/%s",
+            response.total, response.took, response.page, response.total_pages,
         )
 
         return response
 
     except ValueError as e:
-        logger.warning(f"Invalid search request: {e}")
+        logger.warning("Invalid search request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Search failed: {e}")
+        logger.error("Search failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Search failed. Please try again later."
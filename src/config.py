@@ -3,9 +3,10 @@ Configuration management for the Document Search & Retrieval System.
 Loads and validates environment variables using Pydantic.
 """
 
+from functools import cached_property
 from typing import Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field, validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, ValidationInfo, field_validator
 
 
 class Settings(BaseSettings):
@@ -15,13 +16,32 @@ class Settings(BaseSettings):
     vision_agent_api_key: str = Field(..., alias="VISION_AGENT_API_KEY")
     anthropic_api_key: str = Field(..., alias="ANTHROPIC_API_KEY")
 
+    # Summarization
+    summarizer_concurrency: int = Field(default=4, alias="SUMMARIZER_CONCURRENCY")
+
     # Elasticsearch
     elasticsearch_url: str = Field(default="http://localhost:9200", alias="ELASTICSEARCH_URL")
     elasticsearch_user: str = Field(default="elastic", alias="ELASTICSEARCH_USER")
     elasticsearch_password: str = Field(..., alias="ELASTICSEARCH_PASSWORD")
+    elasticsearch_maxsize: int = Field(default=25, alias="ELASTICSEARCH_MAXSIZE")
+    elasticsearch_bulk_threads: int = Field(default=4, alias="ELASTICSEARCH_BULK_THREADS")
+    elasticsearch_bulk_chunk_size: int = Field(default=100, alias="ELASTICSEARCH_BULK_CHUNK_SIZE")
 
     # Database
     database_url: str = Field(..., alias="DATABASE_URL")
+    db_pool_min: int = Field(default=10, alias="DB_POOL_MIN")
+    db_pool_max: int = Field(default=30, alias="DB_POOL_MAX")
+    db_pool_recycle_seconds: int = Field(default=1800, alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_timeout_seconds: int = Field(default=10, alias="DB_POOL_TIMEOUT_SECONDS")
+    # Server-side limits per connection; 0 disables them
+    db_statement_timeout_seconds: int = Field(default=5, alias="DB_STATEMENT_TIMEOUT_SECONDS")
+    db_idle_in_transaction_timeout_seconds: int = Field(
+        default=30, alias="DB_IDLE_IN_TRANSACTION_TIMEOUT_SECONDS"
+    )
+
+    # Task queue
+    celery_broker_url: str = Field(default="redis://localhost:6379/0", alias="CELERY_BROKER_URL")
+    celery_result_backend: str = Field(default="redis://localhost:6379/1", alias="CELERY_RESULT_BACKEND")
 
     # Application
     api_key: str = Field(..., alias="API_KEY")
@@ -32,8 +52,10 @@ class Settings(BaseSettings):
     # Optional settings
     environment: str = Field(default="development", alias="ENVIRONMENT")
     cors_origins: list[str] = Field(default=["*"], alias="CORS_ORIGINS")
+    use_uvloop: bool = Field(default=True, alias="USE_UVLOOP")
 
-    @validator("log_level")
+    @field_validator("log_level")
+    @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level is one of the allowed values."""
         allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -42,18 +64,49 @@ class Settings(BaseSettings):
             raise ValueError(f"LOG_LEVEL must be one of {allowed}")
         return v_upper
 
-    @validator("max_file_size_mb")
+    @field_validator("max_file_size_mb")
+    @classmethod
     def validate_max_file_size(cls, v: int) -> int:
         """Validate max file size is reasonable (1-500 MB)."""
         if v < 1 or v > 500:
             raise ValueError("MAX_FILE_SIZE_MB must be between 1 and 500")
         return v
 
-    class Config:
-        """Pydantic config."""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    @field_validator("summarizer_concurrency")
+    @classmethod
+    def validate_summarizer_concurrency(cls, v: int) -> int:
+        """Validate at least one summary request can run."""
+        if v < 1:
+            raise ValueError("SUMMARIZER_CONCURRENCY must be at least 1")
+        return v
+
+    @field_validator("db_pool_min")
+    @classmethod
+    def validate_db_pool_min(cls, v: int) -> int:
+        """Validate the pool keeps at least one connection."""
+        if v < 1:
+            raise ValueError("DB_POOL_MIN must be at least 1")
+        return v
+
+    @field_validator("db_pool_max")
+    @classmethod
+    def validate_db_pool_max(cls, v: int, info: ValidationInfo) -> int:
+        """Validate the pool maximum is not below the minimum."""
+        if v < info.data.get("db_pool_min", 1):
+            raise ValueError("DB_POOL_MAX must be greater than or equal to DB_POOL_MIN")
+        return v
+
+    @cached_property
+    def max_file_size_bytes(self) -> int:
+        """Upload size limit in bytes, computed once."""
+        return self.max_file_size_mb * 1024 * 1024
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+    )
 
 
 # Global settings instance
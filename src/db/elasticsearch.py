@@ -2,43 +2,135 @@
 Elasticsearch client and index management for Document Search & Retrieval System.
 """
 
-from typing import Optional, Dict, Any
-from elasticsearch import Elasticsearch, exceptions
-from elasticsearch.helpers import bulk
+import json
+import threading
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, Union
+
+import orjson
+from cachetools import TTLCache
+from elasticsearch import AsyncElasticsearch, Elasticsearch, exceptions
+from elasticsearch.helpers import async_bulk, parallel_bulk
+from elasticsearch.serializer import JsonSerializer, NdjsonSerializer
 
 from src.config import settings
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+SEARCH_CACHE_MAXSIZE = 1024
+# Pages are indexed by the Celery worker, whose writes cannot clear this
+# process's cache, so entries live about as long as one index refresh
+# (1 s by default): a document reported READY shows up in searches
+# within seconds instead of a minute
+SEARCH_CACHE_TTL_SECONDS = 2
+
+BulkDocument = Union[Dict[str, Any], bytes, Tuple[str, Union[Dict[str, Any], bytes]]]
+
+
+def _bulk_actions(
+    index_name: str,
+    documents: Iterable[BulkDocument]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Build bulk index actions lazily from documents.
+
+    A document given as an (id, source) tuple is indexed under that id, so
+    re-sending it overwrites the earlier copy instead of adding a duplicate.
+
+    Args:
+        index_name: Name of the index
+        documents: Sources, or (id, source) tuples
+
+    Yields:
+        dict: Bulk action for each document
+    """
+    for doc in documents:
+        if isinstance(doc, tuple):
+            doc_id, source = doc
+            yield {"_index": index_name, "_id": doc_id, "_source": source}
+        else:
+            yield {"_index": index_name, "_source": doc}
+
+
+class OrjsonSerializer(JsonSerializer):
+    """JSON serializer that encodes and decodes with orjson."""
+
+    def json_dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data, default=self.default)
+
+    def json_loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class OrjsonNdjsonSerializer(OrjsonSerializer, NdjsonSerializer):
+    """NDJSON (bulk body) serializer that encodes each line with orjson."""
+
+    mimetype = NdjsonSerializer.mimetype
+
 
 class ElasticsearchClient:
-    """Elasticsearch client with connection pooling and error handling."""
+    """
+    Elasticsearch client with connection pooling and error handling.
+
+    The underlying client holds the HTTP connection pools, so one instance
+    should be shared process-wide via get_elasticsearch_client().
+    """
 
     def __init__(self):
         """Initialize Elasticsearch client."""
         self._client: Optional[Elasticsearch] = None
+        self._aclient: Optional[AsyncElasticsearch] = None
+        # Per-process cache of search responses; writes through this client
+        # clear it, writes from other processes (e.g. the Celery worker) show
+        # up once the TTL expires
+        self._search_cache: TTLCache = TTLCache(
+            maxsize=SEARCH_CACHE_MAXSIZE, ttl=SEARCH_CACHE_TTL_SECONDS
+        )
+        self._search_cache_lock = threading.Lock()
+        # Indexes known to exist, so repeated create_index calls skip the
+        # exists round-trip; misses are always re-checked against the cluster
+        self._index_exists_cache: Dict[str, bool] = {}
+        self._index_exists_lock = threading.Lock()
         self._initialize_client()
 
+    def _client_options(self) -> Dict[str, Any]:
+        """Build the connection options shared by the sync and async clients."""
+        # Build authentication if credentials provided
+        basic_auth = None
+        if settings.elasticsearch_user and settings.elasticsearch_password:
+            basic_auth = (
+                settings.elasticsearch_user,
+                settings.elasticsearch_password
+            )
+
+        # ELASTICSEARCH_URL may list several comma-separated nodes
+        hosts = [url.strip() for url in settings.elasticsearch_url.split(",")]
+        multi_node = len(hosts) > 1
+
+        return {
+            "hosts": hosts,
+            "basic_auth": basic_auth,
+            "max_retries": 3,
+            "retry_on_timeout": True,
+            "http_compress": True,
+            # Default for searches and single writes; bulk calls override it
+            "request_timeout": 30,
+            # Pool size is per node, so capacity scales with the cluster
+            "connections_per_node": settings.elasticsearch_maxsize,
+            "sniff_on_start": multi_node,
+            "sniff_on_node_failure": multi_node,
+            # Bulk helpers encode every action with the JSON serializer;
+            # compatibility-mode mimetypes pick these up too
+            "serializers": {
+                OrjsonSerializer.mimetype: OrjsonSerializer(),
+                OrjsonNdjsonSerializer.mimetype: OrjsonNdjsonSerializer(),
+            },
+        }
+
     def _initialize_client(self) -> None:
         """Create Elasticsearch client with configuration."""
         try:
-            # Build authentication if credentials provided
-            basic_auth = None
-            if settings.elasticsearch_user and settings.elasticsearch_password:
-                basic_auth = (
-                    settings.elasticsearch_user,
-                    settings.elasticsearch_password
-                )
-
-            self._client = Elasticsearch(
-                [settings.elasticsearch_url],
-                basic_auth=basic_auth,
-                max_retries=3,
-                retry_on_timeout=True,
-                http_compress=True,
-                request_timeout=30,
-            )
+            self._client = Elasticsearch(**self._client_options())
 
             logger.info(
                 f"Elasticsearch client initialized: {settings.elasticsearch_url}"
@@ -54,6 +146,26 @@ class ElasticsearchClient:
             self._initialize_client()
         return self._client
 
+    @property
+    def aclient(self) -> AsyncElasticsearch:
+        """
+        Get the async Elasticsearch client, creating it on first use.
+
+        The async client opens its own connection pool and must be used from
+        the event loop, so it is only built when an async method is called.
+        It uses the aiohttp transport, which waits on sockets through the
+        running event loop (uvloop's libuv poller when enabled) rather than
+        blocking a thread per request.
+        """
+        if self._aclient is None:
+            self._aclient = AsyncElasticsearch(
+                **self._client_options(), node_class="aiohttp"
+            )
+            logger.info(
+                f"Async Elasticsearch client initialized: {settings.elasticsearch_url}"
+            )
+        return self._aclient
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check Elasticsearch cluster health.
@@ -114,7 +226,7 @@ class ElasticsearchClient:
             Exception: If index creation fails
         """
         try:
-            if self.client.indices.exists(index=index_name):
+            if self._index_exists(index_name):
                 logger.info(f"Index '{index_name}' already exists")
                 return False
 
@@ -123,6 +235,7 @@ class ElasticsearchClient:
                 body["settings"] = settings
 
             self.client.indices.create(index=index_name, body=body)
+            self._set_index_exists(index_name, True)
             logger.info(f"Created index '{index_name}'")
             return True
 
@@ -144,18 +257,54 @@ class ElasticsearchClient:
             bool: True if index was deleted, False if it didn't exist
         """
         try:
-            if not self.client.indices.exists(index=index_name):
+            if not self._index_exists(index_name):
                 logger.warning(f"Index '{index_name}' does not exist")
                 return False
 
             self.client.indices.delete(index=index_name)
+            self._set_index_exists(index_name, False)
+            self.clear_search_cache()
             logger.info(f"Deleted index '{index_name}'")
             return True
 
+        except exceptions.NotFoundError:
+            # Cached as existing but deleted elsewhere
+            self._set_index_exists(index_name, False)
+            logger.warning(f"Index '{index_name}' does not exist")
+            return False
         except Exception as e:
             logger.error(f"Failed to delete index '{index_name}': {e}")
             raise
 
+    def _index_exists(self, index_name: str) -> bool:
+        """
+        Check whether an index exists, using the cache for known indexes.
+
+        Args:
+            index_name: Name of the index
+
+        Returns:
+            bool: True if the index exists
+        """
+        with self._index_exists_lock:
+            if self._index_exists_cache.get(index_name):
+                return True
+
+        exists = bool(self.client.indices.exists(index=index_name))
+        self._set_index_exists(index_name, exists)
+        return exists
+
+    def _set_index_exists(self, index_name: str, exists: bool) -> None:
+        """
+        Record whether an index exists.
+
+        Args:
+            index_name: Name of the index
+            exists: Whether the index exists
+        """
+        with self._index_exists_lock:
+            self._index_exists_cache[index_name] = exists
+
     def index_document(
         self,
         index_name: str,
@@ -179,6 +328,7 @@ class ElasticsearchClient:
                 document=document,
                 id=doc_id
             )
+            self.clear_search_cache()
             return response['_id']
 
         except Exception as e:
@@ -188,34 +338,267 @@ class ElasticsearchClient:
     def bulk_index(
         self,
         index_name: str,
-        documents: list[Dict[str, Any]]
+        documents: Iterable[BulkDocument],
+        thread_count: int = 4,
+        chunk_size: int = 1000,
+        max_chunk_bytes: int = 10 * 1024 * 1024,
+        queue_size: int = 4,
+        tune_refresh: bool = False,
+        request_timeout: float = 120
     ) -> tuple[int, list]:
         """
         Bulk index multiple documents.
 
+        Chunks are submitted concurrently from a thread pool so large ingests
+        keep several bulk requests in flight. A chunk is flushed at whichever
+        of chunk_size or max_chunk_bytes is reached first. Actions are built
+        lazily, so passing a generator keeps at most a few chunks in memory.
+
+        Bulk requests get their own request_timeout instead of the client's
+        30 s default; raise it along with max_chunk_bytes, since a request
+        that times out is retried and its documents indexed again.
+
+        With tune_refresh, refreshes and replicas are switched off for the
+        duration of the load and restored afterwards, followed by one
+        explicit refresh so the loaded documents are searchable right away.
+        Only use it for bulk loads that own the index: concurrent writers
+        see their documents become searchable late.
+
+        Args:
+            index_name: Name of the index
+            documents: Documents to index (any iterable, including a
+                generator); already JSON-encoded bytes are sent as-is, and
+                (id, source) tuples are indexed under that id
+            thread_count: Number of threads submitting bulk requests
+            chunk_size: Maximum documents per bulk request
+            max_chunk_bytes: Maximum bulk request size in bytes
+            queue_size: Number of chunks queued ahead of the threads
+            tune_refresh: Suspend refresh and replicas while indexing
+            request_timeout: Timeout in seconds for each bulk request
+
+        Returns:
+            tuple: (success_count, errors)
+        """
+        saved_settings = None
+        try:
+            if tune_refresh:
+                saved_settings = self._suspend_refresh(index_name)
+
+            actions = _bulk_actions(index_name, documents)
+
+            success = 0
+            errors = []
+            for ok, item in parallel_bulk(
+                self.client.options(request_timeout=request_timeout),
+                actions,
+                thread_count=thread_count,
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                queue_size=queue_size,
+                raise_on_error=False
+            ):
+                if ok:
+                    success += 1
+                else:
+                    errors.append(item)
+
+            self.clear_search_cache()
+            logger.info(
+                f"Bulk indexed {success} documents to '{index_name}', "
+                f"{len(errors)} errors"
+            )
+
+            return success, errors
+
+        except Exception as e:
+            logger.error(f"Bulk indexing failed: {e}")
+            raise
+
+        finally:
+            if saved_settings is not None:
+                self.client.indices.put_settings(
+                    index=index_name, settings=saved_settings
+                )
+                self.client.indices.refresh(index=index_name)
+                # Searches during the load may have cached pre-refresh results
+                self.clear_search_cache()
+                logger.info(f"Restored refresh settings on '{index_name}'")
+
+    def _suspend_refresh(self, index_name: str) -> Dict[str, Any]:
+        """
+        Disable refreshes and replicas on an index ahead of a bulk load.
+
+        Args:
+            index_name: Name of the index
+
+        Returns:
+            dict: Previous settings, to pass back to put_settings afterwards
+        """
+        response = self.client.indices.get_settings(
+            index=index_name, flat_settings=True
+        )
+        current = next(iter(response.values()))["settings"]
+        saved_settings = {
+            # None resets an unset refresh_interval to the default (1s)
+            "index.refresh_interval": current.get("index.refresh_interval"),
+            "index.number_of_replicas": current.get("index.number_of_replicas", "1"),
+        }
+
+        self.client.indices.put_settings(
+            index=index_name,
+            settings={
+                "index.refresh_interval": "-1",
+                "index.number_of_replicas": 0
+            }
+        )
+        logger.info(f"Suspended refresh on '{index_name}' for bulk load")
+        return saved_settings
+
+    def search(
+        self,
+        index_name: str,
+        query: Dict[str, Any],
+        size: int = 10,
+        from_: int = 0,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Search documents in an index.
+
+        Identical searches are answered from a short-lived in-process cache.
+        Callers must treat the returned response as read-only.
+
+        Args:
+            index_name: Name of the index to search
+            query: Elasticsearch query DSL
+            size: Number of results to return
+            from_: Starting offset for pagination
+            use_cache: Whether to read and populate the search cache
+
+        Returns:
+            dict: Search results
+        """
+        cache_key = None
+        if use_cache:
+            cache_key = (
+                index_name,
+                json.dumps(query, sort_keys=True, default=str),
+                size,
+                from_
+            )
+            with self._search_cache_lock:
+                cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = self.client.search(
+                index=index_name,
+                body=query,
+                size=size,
+                from_=from_
+            )
+
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            raise
+
+        if cache_key is not None:
+            with self._search_cache_lock:
+                self._search_cache[cache_key] = response
+        return response
+
+    def delete_by_query(self, index_name: str, query: Dict[str, Any]) -> int:
+        """
+        Delete all documents matching a query.
+
+        Args:
+            index_name: Name of the index
+            query: Elasticsearch query DSL
+
+        Returns:
+            int: Number of documents deleted
+        """
+        try:
+            response = self.client.delete_by_query(index=index_name, body=query)
+            self.clear_search_cache()
+            return response["deleted"]
+
+        except Exception as e:
+            logger.error(f"Delete by query failed: {e}")
+            raise
+
+    def clear_search_cache(self) -> None:
+        """Drop all cached search responses after a write."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+
+    async def aindex_document(
+        self,
+        index_name: str,
+        document: Dict[str, Any],
+        doc_id: Optional[str] = None
+    ) -> str:
+        """
+        Index a single document without blocking the event loop.
+
+        Args:
+            index_name: Name of the index
+            document: Document to index
+            doc_id: Optional document ID
+
+        Returns:
+            str: Document ID
+        """
+        try:
+            response = await self.aclient.index(
+                index=index_name,
+                document=document,
+                id=doc_id
+            )
+            self.clear_search_cache()
+            return response['_id']
+
+        except Exception as e:
+            logger.error(f"Failed to index document: {e}")
+            raise
+
+    async def abulk_index(
+        self,
+        index_name: str,
+        documents: Iterable[BulkDocument],
+        chunk_size: int = 1000,
+        max_chunk_bytes: int = 10 * 1024 * 1024,
+        request_timeout: float = 120
+    ) -> tuple[int, list]:
+        """
+        Bulk index multiple documents without blocking the event loop.
+
         Args:
             index_name: Name of the index
-            documents: List of documents to index
+            documents: Documents to index (any iterable, including a
+                generator); already JSON-encoded bytes are sent as-is, and
+                (id, source) tuples are indexed under that id
+            chunk_size: Maximum documents per bulk request
+            max_chunk_bytes: Maximum bulk request size in bytes
+            request_timeout: Timeout in seconds for each bulk request
 
         Returns:
             tuple: (success_count, errors)
         """
         try:
-            actions = [
-                {
-                    "_index": index_name,
-                    "_source": doc
-                }
-                for doc in documents
-            ]
-
-            success, errors = bulk(
-                self.client,
+            actions = _bulk_actions(index_name, documents)
+
+            success, errors = await async_bulk(
+                self.aclient.options(request_timeout=request_timeout),
                 actions,
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
                 raise_on_error=False,
                 stats_only=False
             )
 
+            self.clear_search_cache()
             logger.info(
                 f"Bulk indexed {success} documents to '{index_name}', "
                 f"{len(errors)} errors"
@@ -227,7 +610,7 @@ class ElasticsearchClient:
             logger.error(f"Bulk indexing failed: {e}")
             raise
 
-    def search(
+    async def asearch(
         self,
         index_name: str,
         query: Dict[str, Any],
@@ -235,7 +618,7 @@ class ElasticsearchClient:
         from_: int = 0
     ) -> Dict[str, Any]:
         """
-        Search documents in an index.
+        Search documents in an index without blocking the event loop.
 
         Args:
             index_name: Name of the index to search
@@ -247,7 +630,7 @@ class ElasticsearchClient:
             dict: Search results
         """
         try:
-            response = self.client.search(
+            response = await self.aclient.search(
                 index=index_name,
                 body=query,
                 size=size,
@@ -259,6 +642,13 @@ class ElasticsearchClient:
             logger.error(f"Search failed: {e}")
             raise
 
+    async def aclose(self) -> None:
+        """Close the async Elasticsearch client connection, if it was opened."""
+        if self._aclient:
+            await self._aclient.close()
+            self._aclient = None
+            logger.info("Async Elasticsearch client connection closed")
+
     def close(self) -> None:
         """Close the Elasticsearch client connection."""
         if self._client:
@@ -9,10 +9,9 @@ DOCUMENTS_INDEX_SETTINGS = {
     "number_of_shards": 1,  # Single shard for MVP
     "number_of_replicas": 0,  # No replicas for development (1 for production)
     "analysis": {
-        "analyzer": {
-            "part_number_analyzer": {
+        "normalizer": {
+            "part_number_normalizer": {  # Case-insensitive exact matching
                 "type": "custom",
-                "tokenizer": "keyword",
                 "filter": ["lowercase"]
             }
         }
@@ -61,8 +60,8 @@ DOCUMENTS_INDEX_MAPPINGS = {
             "type": "keyword",  # Array of part numbers
             "fields": {
                 "analyzed": {
-                    "type": "text",
-                    "analyzer": "part_number_analyzer"
+                    "type": "keyword",
+                    "normalizer": "part_number_normalizer"
                 }
             }
         },
@@ -80,12 +79,16 @@ DOCUMENTS_INDEX_MAPPINGS = {
             "type": "long"  # Bytes
         },
         "file_path": {
-            "type": "keyword"  # Path to original PDF
+            "type": "keyword",  # Path to original PDF
+            "index": False  # Returned in _source only, never queried
         },
 
         # Processing Status
         "processing_status": {
-            "type": "keyword"  # uploaded, parsing, summarizing, indexing, ready, failed
+            # Pages are only indexed once processing succeeded, so every
+            # page carries the same value and needs no postings at all
+            "type": "constant_keyword",
+            "value": "ready"
         },
         "error_message": {
             "type": "text"
@@ -2,8 +2,13 @@
 PostgreSQL database client for document metadata storage.
 """
 
-from typing import Optional, List, Dict, Any
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator, Mapping, Tuple
 from datetime import datetime
+
+from cachetools import TTLCache
 from sqlalchemy import (
     create_engine,
     Column,
@@ -14,11 +19,20 @@ from sqlalchemy import (
     Text,
     BigInteger,
     ForeignKey,
-    Index
+    Index,
+    SmallInteger,
+    bindparam,
+    func,
+    select,
+    text,
+    tuple_,
+    update,
 )
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
+from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.types import TypeDecorator
 
 from src.config import settings
 from src.models.document import ProcessingStatus, DocumentCategory
@@ -29,11 +43,24 @@ logger = get_logger(__name__)
 # SQLAlchemy Base
 Base = declarative_base()
 
+# Document lookup cache sizing; short enough that status polls stay fresh
+DOCUMENT_CACHE_MAXSIZE = 1024
+DOCUMENT_CACHE_TTL_SECONDS = 2.0
+
+# Document count cache; one entry per (status, category) filter combination
+COUNT_CACHE_MAXSIZE = 64
+COUNT_CACHE_TTL_SECONDS = 30
+
+# Timestamps are filled in by PostgreSQL, in UTC to match naive DateTime columns
+UTC_NOW = func.timezone('utc', func.now())
+
 
 class Document(Base):
     """Document metadata model for PostgreSQL."""
 
     __tablename__ = "documents"
+    # Fetch server-generated timestamps with RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(String(36), primary_key=True)
     filename = Column(String(255), nullable=False)  # Storage filename (UUID-based)
@@ -44,55 +71,102 @@ class Document(Base):
     machine_model = Column(String(100), nullable=True)
     processing_status = Column(SQLEnum(ProcessingStatus), nullable=False, default=ProcessingStatus.UPLOADED)
     total_pages = Column(Integer, nullable=True)
-    upload_date = Column(DateTime, nullable=False, default=datetime.utcnow)
+    upload_date = Column(DateTime, nullable=False, server_default=UTC_NOW)
     indexed_at = Column(DateTime, nullable=True)
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
+    updated_at = Column(DateTime, nullable=False, server_default=UTC_NOW, onupdate=UTC_NOW)
+
+    # Indexes matching the list_documents filters and upload_date ordering;
+    # existing databases get them from scripts/add_documents_indexes.py
+    __table_args__ = (
+        # id breaks upload_date ties for keyset pagination
+        Index('idx_documents_upload_date_id', upload_date.desc(), id.desc()),
+        Index('idx_documents_status_upload_date', processing_status, upload_date.desc()),
+        Index('idx_documents_category_upload_date', category, upload_date.desc()),
+        Index(
+            'idx_documents_status_category_upload_date',
+            processing_status, category, upload_date.desc(),
+        ),
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert model to dictionary."""
+        """
+        Convert a persisted document to a dictionary.
+
+        NOT NULL columns are read without None checks, so the record must
+        have been flushed (its column defaults applied) first.
+        """
+        indexed_at = self.indexed_at
         return {
             "document_id": self.id,
             "filename": self.original_filename,  # Return original filename for display
             "storage_filename": self.filename,  # Internal storage filename
             "file_path": self.file_path,
             "file_size": self.file_size,
-            "category": self.category.value if self.category else None,
+            "category": self.category.value,
             "machine_model": self.machine_model,
-            "processing_status": self.processing_status.value if self.processing_status else None,
+            "processing_status": self.processing_status.value,
             "total_pages": self.total_pages,
-            "upload_date": self.upload_date.isoformat() if self.upload_date else None,
-            "indexed_at": self.indexed_at.isoformat() if self.indexed_at else None,
+            "upload_date": self.upload_date.isoformat(),
+            "indexed_at": indexed_at.isoformat() if indexed_at else None,
             "error_message": self.error_message,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
         }
 
 
+class FeedbackRatingType(TypeDecorator):
+    """
+    Feedback rating stored as a SMALLINT (1 positive, 0 negative).
+
+    Python code keeps using the 'positive'/'negative' strings; values are
+    converted on the way in and out, including in comparisons such as
+    ``Feedback.rating == 'positive'``.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    _to_db = {"positive": 1, "negative": 0}
+    _from_db = {1: "positive", 0: "negative"}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_db[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._from_db[value]
+
+
 class Feedback(Base):
     """User feedback model for search results."""
 
     __tablename__ = "search_feedback"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(String(36), primary_key=True)
     query = Column(Text, nullable=False)
     document_id = Column(String(36), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
     page = Column(Integer, nullable=False)
-    rating = Column(String(10), nullable=False)  # 'positive' or 'negative'
+    rating = Column(FeedbackRatingType, nullable=False)  # 'positive' or 'negative'
     session_id = Column(String(36), nullable=True)  # Optional anonymous session tracking
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    timestamp = Column(DateTime, nullable=False, server_default=UTC_NOW)
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
 
     # Indexes for faster queries
     __table_args__ = (
-        Index('idx_feedback_document_page', 'document_id', 'page'),
+        # rating is included so feedback stats are an index-only scan
+        Index('idx_feedback_document_page', 'document_id', 'page', postgresql_include=['rating']),
         Index('idx_feedback_query', 'query'),
         Index('idx_feedback_timestamp', 'timestamp'),
     )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert model to dictionary."""
+        """Convert a persisted feedback record to a dictionary."""
         return {
             "feedback_id": self.id,
             "query": self.query,
@@ -100,40 +174,186 @@ class Feedback(Base):
             "page": self.page,
             "rating": self.rating,
             "session_id": self.session_id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "timestamp": self.timestamp.isoformat(),
+            "created_at": self.created_at.isoformat(),
         }
 
 
+def _feedback_aggregates():
+    """
+    Build the feedback count and boost score columns shared by stats queries.
+
+    The boost is 1.0 + 0.1 per net positive vote, clamped to [0.1, 3.0].
+    """
+    positive = func.count().filter(Feedback.rating == 'positive')
+    negative = func.count().filter(Feedback.rating == 'negative')
+
+    return (
+        positive.label("positive_count"),
+        negative.label("negative_count"),
+        func.count().label("total_count"),
+        func.greatest(
+            0.1, func.least(3.0, 1.0 + (positive - negative) * 0.1)
+        ).label("boost_score"),
+    )
+
+
+def _build_feedback_stats_statement():
+    """
+    Build the feedback aggregate query for one document page.
+
+    The statement is built once at import time with bound parameters, so
+    its cache key is memoized and the compiled SQL is reused on every call.
+    """
+    return select(*_feedback_aggregates()).where(
+        Feedback.document_id == bindparam("document_id"),
+        Feedback.page == bindparam("page")
+    )
+
+
+FEEDBACK_STATS_STATEMENT = _build_feedback_stats_statement()
+
+# Most recent feedback for a query, served by idx_feedback_query
+FEEDBACK_HISTORY_STATEMENT = (
+    select(Feedback)
+    .where(Feedback.query == bindparam("query"))
+    .order_by(Feedback.timestamp.desc())
+    .limit(bindparam("history_limit"))
+)
+
+# Columns returned by list_documents_with_total, labelled with the
+# DocumentMetadata field names
+DOCUMENT_LIST_COLUMNS = (
+    Document.id.label("document_id"),
+    Document.original_filename.label("filename"),
+    Document.file_size,
+    Document.file_path,
+    Document.category,
+    Document.machine_model,
+    Document.upload_date,
+    Document.processing_status,
+    Document.indexed_at,
+    Document.error_message,
+    Document.total_pages,
+)
+
+
 class PostgreSQLClient:
     """PostgreSQL client with connection pooling."""
 
-    def __init__(self):
-        """Initialize PostgreSQL client."""
+    def __init__(
+        self,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        statement_timeout_seconds: Optional[int] = None
+    ):
+        """
+        Initialize PostgreSQL client.
+
+        Args:
+            engine_kwargs: Optional overrides passed through to create_engine
+                (e.g. pool sizing, or poolclass=NullPool for one-shot scripts);
+                connect_args are merged into the defaults
+            statement_timeout_seconds: Per-statement timeout for this client's
+                connections; defaults to DB_STATEMENT_TIMEOUT_SECONDS, 0
+                disables it (e.g. for migrations and bulk loads)
+        """
         self._engine = None
         self._session_factory = None
+        self._engine_kwargs = engine_kwargs or {}
+        self._statement_timeout_seconds = (
+            settings.db_statement_timeout_seconds
+            if statement_timeout_seconds is None
+            else statement_timeout_seconds
+        )
+        # Per-process cache of get_document results; other processes (e.g. the
+        # Celery worker) can leave it stale for at most the TTL
+        self._document_cache: TTLCache = TTLCache(
+            maxsize=DOCUMENT_CACHE_MAXSIZE, ttl=DOCUMENT_CACHE_TTL_SECONDS
+        )
+        self._document_cache_lock = threading.Lock()
+        self._count_cache: TTLCache = TTLCache(
+            maxsize=COUNT_CACHE_MAXSIZE, ttl=COUNT_CACHE_TTL_SECONDS
+        )
+        self._count_cache_lock = threading.Lock()
         self._initialize_engine()
 
     def _initialize_engine(self) -> None:
         """Create SQLAlchemy engine with connection pooling."""
         try:
-            self._engine = create_engine(
-                settings.database_url,
-                poolclass=QueuePool,
-                pool_size=5,
-                max_overflow=10,
-                pool_pre_ping=True,  # Verify connections before using
-                echo=False  # Set to True for SQL logging
+            engine_kwargs = dict(self._engine_kwargs)
+            # Bound runaway queries and abandoned transactions so they cannot
+            # hold a pooled connection indefinitely; sent as startup options,
+            # so no extra round-trip per connection. Caller-supplied options
+            # come last, so their -c settings win
+            connect_args = dict(engine_kwargs.pop("connect_args", {}))
+            options = (
+                f"-c statement_timeout={self._statement_timeout_seconds * 1000} "
+                f"-c idle_in_transaction_session_timeout="
+                f"{settings.db_idle_in_transaction_timeout_seconds * 1000}"
+            )
+            if connect_args.get("options"):
+                options = f"{options} {connect_args['options']}"
+            connect_args["options"] = options
+
+            engine_options: Dict[str, Any] = {
+                "pool_pre_ping": True,  # Verify connections before using
+                "echo": False,  # Set to True for SQL logging
+                "connect_args": connect_args,
+            }
+            # Pool sizing only applies to the default QueuePool
+            if "poolclass" not in engine_kwargs:
+                engine_options.update(
+                    poolclass=QueuePool,
+                    pool_size=settings.db_pool_min,
+                    max_overflow=settings.db_pool_max - settings.db_pool_min,
+                    # Replace connections before server/firewall idle timeouts
+                    pool_recycle=settings.db_pool_recycle_seconds,
+                    # Fail fast instead of queueing requests behind a full pool
+                    pool_timeout=settings.db_pool_timeout_seconds,
+                )
+            engine_options.update(engine_kwargs)
+
+            self._engine = create_engine(settings.database_url, **engine_options)
+
+            # Thread-local sessions; objects stay loaded after commit so they
+            # can be returned (and cached) without another SELECT. Each scope
+            # does at most one write, flushed at commit, so autoflush before
+            # queries is never needed
+            self._session_factory = scoped_session(
+                sessionmaker(bind=self._engine, expire_on_commit=False, autoflush=False)
             )
 
-            self._session_factory = sessionmaker(bind=self._engine)
-
-            logger.info(f"PostgreSQL engine initialized: {settings.database_url.split('@')[1]}")
+            # Log host/database only; the URL may lack credentials (e.g. peer auth)
+            url = self._engine.url
+            logger.info(f"PostgreSQL engine initialized: {url.host or 'local socket'}/{url.database}")
 
         except Exception as e:
             logger.error(f"Failed to initialize PostgreSQL engine: {e}")
             raise
 
+    def warm_pool(self) -> None:
+        """
+        Open the pool's minimum number of connections ahead of the first request.
+
+        Connection failures are logged rather than raised so the API can still
+        start while the database is unavailable.
+        """
+        connections = []
+        try:
+            for _ in range(settings.db_pool_min):
+                connections.append(self._engine.connect())
+            logger.info(f"PostgreSQL pool warmed with {len(connections)} connection(s)")
+        except Exception as e:
+            logger.warning(f"Failed to warm PostgreSQL pool: {e}")
+        finally:
+            for connection in connections:
+                connection.close()
+
+    def dispose(self) -> None:
+        """Close all pooled connections."""
+        self._engine.dispose()
+        logger.info("PostgreSQL connection pool disposed")
+
     def create_tables(self) -> None:
         """Create database tables if they don't exist."""
         try:
@@ -145,15 +365,41 @@ class PostgreSQLClient:
 
     def get_session(self) -> Session:
         """
-        Get a new database session.
+        Get the current thread's database session.
 
         Returns:
             Session: SQLAlchemy session
 
         Note: Caller is responsible for closing the session
         """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"PostgreSQL pool status: {self._engine.pool.status()}")
         return self._session_factory()
 
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        Provide a transactional scope around a series of operations.
+
+        Commits on success, rolls back on error and always closes the
+        session, returning its connection to the pool. The thread-local
+        session is then discarded, so long-lived threadpool and worker
+        threads don't hold on to idle sessions between requests.
+
+        Yields:
+            Session: SQLAlchemy session
+        """
+        session = self.get_session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+            self._session_factory.remove()
+
     def create_document(
         self,
         document_id: str,
@@ -167,6 +413,9 @@ class PostgreSQLClient:
         """
         Create a new document record.
 
+        The insert is idempotent: if a record with this ID already exists
+        (e.g. a retried upload) it is returned unchanged instead of raising.
+
         Args:
             document_id: Unique document identifier
             filename: Storage filename (UUID-based)
@@ -177,51 +426,154 @@ class PostgreSQLClient:
             machine_model: Optional machine model
 
         Returns:
-            Document: Created document record
+            Document: Created (or already existing) document record
         """
-        session = self.get_session()
-        try:
-            doc = Document(
-                id=document_id,
-                filename=filename,
-                original_filename=original_filename,
-                file_path=file_path,
-                file_size=file_size,
-                category=category,
-                machine_model=machine_model,
-                processing_status=ProcessingStatus.UPLOADED
-            )
-
-            session.add(doc)
-            session.commit()
-            session.refresh(doc)
+        stmt = insert(Document).values(
+            id=document_id,
+            filename=filename,
+            original_filename=original_filename,
+            file_path=file_path,
+            file_size=file_size,
+            category=category,
+            machine_model=machine_model,
+            processing_status=ProcessingStatus.UPLOADED
+        ).on_conflict_do_nothing(index_elements=[Document.id]).returning(Document)
 
-            logger.info(f"Created document record: {document_id}")
+        try:
+            with self.session_scope() as session:
+                doc = session.scalars(stmt).one_or_none()
+                created = doc is not None
+                if not created:
+                    doc = session.get(Document, document_id)
+
+            if created:
+                self._invalidate_document(document_id)
+                logger.info(f"Created document record: {document_id}")
+            else:
+                logger.info(f"Document record already exists: {document_id}")
             return doc
 
         except Exception as e:
-            session.rollback()
             logger.error(f"Failed to create document record: {e}")
             raise
-        finally:
-            session.close()
+
+    def bulk_create_documents(
+        self,
+        rows: List[Dict[str, Any]],
+        chunk_size: int = 500
+    ) -> int:
+        """
+        Insert many document records in a single transaction.
+
+        Rows are sent in executemany batches of chunk_size and committed
+        once, instead of one round-trip and commit per document.
+
+        Args:
+            rows: Column values per document, keyed by Document attribute
+                name (at least id, filename, original_filename, file_path,
+                file_size and category)
+            chunk_size: Maximum rows per INSERT batch
+
+        Returns:
+            int: Number of rows inserted
+        """
+        try:
+            with self.session_scope() as session:
+                for start in range(0, len(rows), chunk_size):
+                    session.bulk_insert_mappings(
+                        Document, rows[start:start + chunk_size]
+                    )
+
+            for row in rows:
+                self._invalidate_document(row["id"])
+
+            logger.info(f"Created {len(rows)} document records")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to bulk create document records: {e}")
+            raise
 
     def get_document(self, document_id: str) -> Optional[Document]:
         """
         Get a document by ID.
 
+        Results are cached briefly so rapid status polling skips the database.
+
         Args:
             document_id: Document identifier
 
         Returns:
             Document: Document record or None if not found
         """
-        session = self.get_session()
-        try:
-            doc = session.query(Document).filter(Document.id == document_id).first()
+        with self._document_cache_lock:
+            doc = self._document_cache.get(document_id)
+        if doc is not None:
             return doc
-        finally:
-            session.close()
+
+        with self.session_scope() as session:
+            doc = session.get(Document, document_id)
+
+        if doc is not None:
+            with self._document_cache_lock:
+                self._document_cache[document_id] = doc
+        return doc
+
+    def get_documents_many(
+        self,
+        document_ids: List[str],
+        chunk_size: int = 1000
+    ) -> Dict[str, Document]:
+        """
+        Get several documents by ID in as few queries as possible.
+
+        IDs already in the get_document cache are served from it; the rest
+        are fetched with one ``WHERE id IN (...)`` query per chunk_size IDs
+        instead of a query per document.
+
+        Args:
+            document_ids: Document identifiers
+            chunk_size: Maximum IDs per IN list
+
+        Returns:
+            dict: Found documents keyed by ID; missing IDs are omitted
+        """
+        found: Dict[str, Document] = {}
+        with self._document_cache_lock:
+            for document_id in document_ids:
+                doc = self._document_cache.get(document_id)
+                if doc is not None:
+                    found[document_id] = doc
+
+        missing = list(dict.fromkeys(i for i in document_ids if i not in found))
+        if not missing:
+            return found
+
+        with self.session_scope() as session:
+            for start in range(0, len(missing), chunk_size):
+                stmt = select(Document).where(
+                    Document.id.in_(missing[start:start + chunk_size])
+                )
+                for doc in session.scalars(stmt):
+                    found[doc.id] = doc
+
+        with self._document_cache_lock:
+            for document_id in missing:
+                if document_id in found:
+                    self._document_cache[document_id] = found[document_id]
+        return found
+
+    def _invalidate_document(self, document_id: str) -> None:
+        """
+        Drop a document from the get_document cache and discard cached counts.
+
+        Args:
+            document_id: Document identifier
+        """
+        with self._document_cache_lock:
+            self._document_cache.pop(document_id, None)
+        with self._count_cache_lock:
+            self._count_cache.clear()
 
     def update_document_status(
         self,
@@ -244,42 +596,101 @@ class PostgreSQLClient:
         Returns:
             bool: True if updated, False if document not found
         """
-        session = self.get_session()
-        try:
-            doc = session.query(Document).filter(Document.id == document_id).first()
+        values: Dict[str, Any] = {"processing_status": status}
+        if error_message is not None:
+            values["error_message"] = error_message
+        if total_pages is not None:
+            values["total_pages"] = total_pages
+        if indexed_at is not None:
+            values["indexed_at"] = indexed_at
 
-            if not doc:
+        try:
+            # Single UPDATE ... WHERE id = ... instead of loading the row first
+            with self.session_scope() as session:
+                result = session.execute(
+                    update(Document)
+                    .where(Document.id == document_id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+
+            if not result.rowcount:
                 logger.warning(f"Document not found: {document_id}")
                 return False
 
-            doc.processing_status = status
-            if error_message is not None:
-                doc.error_message = error_message
-            if total_pages is not None:
-                doc.total_pages = total_pages
-            if indexed_at is not None:
-                doc.indexed_at = indexed_at
-
-            session.commit()
+            self._invalidate_document(document_id)
             logger.info(f"Updated document {document_id} status to {status.value}")
             return True
 
         except Exception as e:
-            session.rollback()
             logger.error(f"Failed to update document status: {e}")
             raise
-        finally:
-            session.close()
 
     def list_documents(
+        self,
+        status: Optional[ProcessingStatus] = None,
+        category: Optional[DocumentCategory] = None,
+        limit: int = 100,
+        after_upload_date: Optional[datetime] = None,
+        after_id: Optional[str] = None
+    ) -> Tuple[List[Mapping[str, Any]], Optional[Tuple[datetime, str]]]:
+        """
+        List documents with optional filters, using keyset pagination.
+
+        Documents are ordered newest first by (upload_date, id). To fetch the
+        next page pass the cursor returned by the previous call as
+        after_upload_date/after_id; each page then starts with an index seek
+        instead of reading and discarding all earlier rows. Rows are returned
+        as read-only mappings of DOCUMENT_LIST_COLUMNS, not ORM objects.
+
+        Args:
+            status: Optional status filter
+            category: Optional category filter
+            limit: Maximum number of results
+            after_upload_date: upload_date of the last document already seen
+            after_id: ID of the last document already seen
+
+        Returns:
+            tuple: (row mappings keyed by DocumentMetadata field name,
+                cursor for the next page as (upload_date, id), or None when
+                this was the last page)
+        """
+        stmt = select(*DOCUMENT_LIST_COLUMNS)
+
+        if status:
+            stmt = stmt.where(Document.processing_status == status)
+        if category:
+            stmt = stmt.where(Document.category == category)
+        if after_upload_date is not None and after_id is not None:
+            stmt = stmt.where(
+                tuple_(Document.upload_date, Document.id)
+                < tuple_(after_upload_date, after_id)
+            )
+
+        stmt = stmt.order_by(Document.upload_date.desc(), Document.id.desc()).limit(limit)
+
+        with self.session_scope() as session:
+            rows = session.execute(stmt).mappings().all()
+
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = (rows[-1]["upload_date"], rows[-1]["document_id"])
+        return rows, next_cursor
+
+    def list_documents_with_total(
         self,
         status: Optional[ProcessingStatus] = None,
         category: Optional[DocumentCategory] = None,
         limit: int = 100,
         offset: int = 0
-    ) -> List[Document]:
+    ) -> Tuple[List[Mapping[str, Any]], int]:
         """
-        List documents with optional filters.
+        List a page of documents together with the total match count.
+
+        Only the DOCUMENT_LIST_COLUMNS are selected and rows come back as
+        read-only mappings, without building ORM objects. The total comes
+        from a ``count(*) OVER ()`` window on the same query, so both are
+        fetched in a single round-trip.
 
         Args:
             status: Optional status filter
@@ -288,25 +699,76 @@ class PostgreSQLClient:
             offset: Pagination offset
 
         Returns:
-            list: List of document records
+            tuple: (row mappings keyed by DocumentMetadata field name,
+                total matching documents)
         """
-        session = self.get_session()
-        try:
-            query = session.query(Document)
+        stmt = select(*DOCUMENT_LIST_COLUMNS, func.count().over().label("total"))
 
-            if status:
-                query = query.filter(Document.processing_status == status)
-            if category:
-                query = query.filter(Document.category == category)
+        if status:
+            stmt = stmt.where(Document.processing_status == status)
+        if category:
+            stmt = stmt.where(Document.category == category)
 
-            query = query.order_by(Document.upload_date.desc())
-            query = query.limit(limit).offset(offset)
+        # Same order as list_documents, so a page's last row is a valid cursor
+        stmt = (
+            stmt.order_by(Document.upload_date.desc(), Document.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
 
-            docs = query.all()
-            return docs
+        with self.session_scope() as session:
+            rows = session.execute(stmt).mappings().all()
 
-        finally:
-            session.close()
+        if rows:
+            return rows, rows[0]["total"]
+
+        # A page past the end carries no window total; fall back to a count
+        total = self.count_documents(status=status, category=category) if offset else 0
+        return [], total
+
+    def list_documents_with_feedback(
+        self,
+        status: Optional[ProcessingStatus] = None,
+        category: Optional[DocumentCategory] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Mapping[str, Any]]:
+        """
+        List a page of documents with their aggregate feedback counts.
+
+        Counts are computed with a LEFT JOIN on search_feedback and grouped
+        per document, so rendering a list with feedback totals costs one
+        query instead of a get_feedback_stats call per row.
+
+        Args:
+            status: Optional status filter
+            category: Optional category filter
+            limit: Maximum number of results
+            offset: Pagination offset
+
+        Returns:
+            list: Row mappings of DOCUMENT_LIST_COLUMNS plus positive_count
+                and negative_count
+        """
+        stmt = (
+            select(
+                *DOCUMENT_LIST_COLUMNS,
+                func.count().filter(Feedback.rating == 'positive').label("positive_count"),
+                func.count().filter(Feedback.rating == 'negative').label("negative_count"),
+            )
+            .outerjoin(Feedback, Feedback.document_id == Document.id)
+            .group_by(Document.id)
+        )
+
+        if status:
+            stmt = stmt.where(Document.processing_status == status)
+        if category:
+            stmt = stmt.where(Document.category == category)
+
+        stmt = stmt.order_by(Document.upload_date.desc()).limit(limit).offset(offset)
+
+        with self.session_scope() as session:
+            return session.execute(stmt).mappings().all()
 
     def delete_document(self, document_id: str) -> bool:
         """
@@ -318,25 +780,23 @@ class PostgreSQLClient:
         Returns:
             bool: True if deleted, False if not found
         """
-        session = self.get_session()
         try:
-            doc = session.query(Document).filter(Document.id == document_id).first()
+            with self.session_scope() as session:
+                doc = session.get(Document, document_id)
 
-            if not doc:
-                logger.warning(f"Document not found: {document_id}")
-                return False
+                if not doc:
+                    logger.warning(f"Document not found: {document_id}")
+                    return False
 
-            session.delete(doc)
-            session.commit()
+                session.delete(doc)
+
+            self._invalidate_document(document_id)
             logger.info(f"Deleted document record: {document_id}")
             return True
 
         except Exception as e:
-            session.rollback()
             logger.error(f"Failed to delete document: {e}")
             raise
-        finally:
-            session.close()
 
     def count_documents(
         self,
@@ -346,6 +806,9 @@ class PostgreSQLClient:
         """
         Count documents with optional filters.
 
+        Counts are exact when computed but cached for COUNT_CACHE_TTL_SECONDS,
+        so writes from other processes may take that long to show up.
+
         Args:
             status: Optional status filter
             category: Optional category filter
@@ -353,20 +816,49 @@ class PostgreSQLClient:
         Returns:
             int: Document count
         """
-        session = self.get_session()
-        try:
-            query = session.query(Document)
+        cache_key = (status, category)
+        with self._count_cache_lock:
+            count = self._count_cache.get(cache_key)
+        if count is not None:
+            return count
 
-            if status:
-                query = query.filter(Document.processing_status == status)
-            if category:
-                query = query.filter(Document.category == category)
+        # A plain COUNT(*), rather than Query.count()'s subquery wrapper
+        stmt = select(func.count()).select_from(Document)
+        if status:
+            stmt = stmt.where(Document.processing_status == status)
+        if category:
+            stmt = stmt.where(Document.category == category)
 
-            count = query.count()
-            return count
+        with self.session_scope() as session:
+            count = session.execute(stmt).scalar_one()
 
-        finally:
-            session.close()
+        with self._count_cache_lock:
+            self._count_cache[cache_key] = count
+        return count
+
+    def estimate_count(self) -> int:
+        """
+        Estimate the total number of documents from planner statistics.
+
+        Reads pg_class.reltuples in constant time instead of scanning the
+        table, so the result is only as fresh as the last VACUUM/ANALYZE.
+        Falls back to an exact count if the table was never analyzed.
+
+        Returns:
+            int: Approximate document count
+        """
+        with self.session_scope() as session:
+            estimate = session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE relname = :table_name"
+                ),
+                {"table_name": Document.__tablename__}
+            ).scalar()
+
+        if estimate is None or estimate < 0:
+            return self.count_documents()
+        return estimate
 
     def create_feedback(
         self,
@@ -391,60 +883,118 @@ class PostgreSQLClient:
         Returns:
             Feedback: Created feedback record
         """
-        session = self.get_session()
         try:
-            feedback = Feedback(
-                id=feedback_id,
-                query=query,
-                document_id=document_id,
-                page=page,
-                rating=rating,
-                session_id=session_id
-            )
-
-            session.add(feedback)
-            session.commit()
-            session.refresh(feedback)
+            with self.session_scope() as session:
+                feedback = Feedback(
+                    id=feedback_id,
+                    query=query,
+                    document_id=document_id,
+                    page=page,
+                    rating=rating,
+                    session_id=session_id
+                )
+                session.add(feedback)
 
             logger.info(f"Created feedback record: {feedback_id} ({rating} for {document_id} page {page})")
             return feedback
 
         except Exception as e:
-            session.rollback()
             logger.error(f"Failed to create feedback record: {e}")
             raise
-        finally:
-            session.close()
 
-    def get_feedback_stats(self, document_id: str, page: int) -> Dict[str, int]:
+    def create_feedback_bulk(
+        self,
+        rows: List[Dict[str, Any]],
+        chunk_size: int = 1000
+    ) -> int:
+        """
+        Insert many feedback records in a single transaction.
+
+        Used for batch imports or replays; each chunk is sent as one
+        multi-row INSERT instead of a round-trip per record.
+
+        Args:
+            rows: Column values per feedback record, keyed by Feedback
+                attribute name (id, query, document_id, page, rating and
+                optionally session_id)
+            chunk_size: Maximum rows per INSERT batch
+
+        Returns:
+            int: Number of rows inserted
+        """
+        try:
+            with self.session_scope() as session:
+                for start in range(0, len(rows), chunk_size):
+                    session.bulk_insert_mappings(
+                        Feedback, rows[start:start + chunk_size]
+                    )
+
+            logger.info(f"Created {len(rows)} feedback records")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to bulk create feedback records: {e}")
+            raise
+
+    def get_feedback_stats(self, document_id: str, page: int) -> Dict[str, Any]:
         """
         Get feedback statistics for a document page.
 
+        Counts and the boost score are aggregated in a single SQL query; the
+        boost is 1.0 + 0.1 per net positive vote, clamped to [0.1, 3.0].
+
         Args:
             document_id: Document identifier
             page: Page number
 
         Returns:
-            dict: Dictionary with 'positive_count' and 'negative_count'
+            dict: Dictionary with 'positive_count', 'negative_count',
+                'total_count' and 'boost_score'
         """
-        session = self.get_session()
-        try:
-            feedbacks = session.query(Feedback).filter(
-                Feedback.document_id == document_id,
-                Feedback.page == page
-            ).all()
-
-            positive_count = sum(1 for f in feedbacks if f.rating == 'positive')
-            negative_count = sum(1 for f in feedbacks if f.rating == 'negative')
+        with self.session_scope() as session:
+            row = session.execute(
+                FEEDBACK_STATS_STATEMENT,
+                {"document_id": document_id, "page": page}
+            ).one()
 
             return {
-                "positive_count": positive_count,
-                "negative_count": negative_count,
-                "total_count": len(feedbacks)
+                "positive_count": row.positive_count,
+                "negative_count": row.negative_count,
+                "total_count": row.total_count,
+                "boost_score": float(row.boost_score)
             }
 
-        finally:
-            session.close()
+    def get_feedback_boosts(
+        self,
+        pages: List[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], float]:
+        """
+        Get feedback boost scores for several document pages in one query.
+
+        Feedback is grouped by (document_id, page) for all requested pages
+        at once, so scoring a page of search hits costs a single round-trip
+        instead of a get_feedback_stats call per hit.
+
+        Args:
+            pages: (document_id, page) pairs
+
+        Returns:
+            dict: Boost score per (document_id, page); pages without any
+                feedback are omitted (their boost is the neutral 1.0)
+        """
+        if not pages:
+            return {}
+
+        stmt = (
+            select(Feedback.document_id, Feedback.page, *_feedback_aggregates())
+            .where(tuple_(Feedback.document_id, Feedback.page).in_(set(pages)))
+            .group_by(Feedback.document_id, Feedback.page)
+        )
+
+        with self.session_scope() as session:
+            rows = session.execute(stmt).all()
+
+        return {(row.document_id, row.page): float(row.boost_score) for row in rows}
 
     def get_query_feedback_history(self, query: str, limit: int = 100) -> List[Feedback]:
         """
@@ -457,20 +1007,16 @@ class PostgreSQLClient:
         Returns:
             list: List of feedback records
         """
-        session = self.get_session()
-        try:
-            feedbacks = session.query(Feedback).filter(
-                Feedback.query == query
-            ).order_by(Feedback.timestamp.desc()).limit(limit).all()
-
-            return feedbacks
-
-        finally:
-            session.close()
+        with self.session_scope() as session:
+            return session.scalars(
+                FEEDBACK_HISTORY_STATEMENT,
+                {"query": query, "history_limit": limit},
+            ).all()
 
 
 # Global PostgreSQL client instance
 _postgres_client: Optional[PostgreSQLClient] = None
+_postgres_client_lock = threading.Lock()
 
 
 def get_postgres_client() -> PostgreSQLClient:
@@ -482,5 +1028,24 @@ def get_postgres_client() -> PostgreSQLClient:
     """
     global _postgres_client
     if _postgres_client is None:
-        _postgres_client = PostgreSQLClient()
+        # Worker threads may race here; only one of them builds the pool
+        with _postgres_client_lock:
+            if _postgres_client is None:
+                _postgres_client = PostgreSQLClient()
     return _postgres_client
+
+
+def get_migration_client() -> PostgreSQLClient:
+    """
+    Create a PostgreSQL client for migrations and other maintenance scripts.
+
+    Scripts open one or two connections, so the client skips the pool, and
+    lifts the API's statement timeout so lock waits, table rewrites and
+    index builds can run to completion.
+
+    Returns:
+        PostgreSQLClient: A new unpooled client without a statement timeout
+    """
+    return PostgreSQLClient(
+        engine_kwargs={"poolclass": NullPool}, statement_timeout_seconds=0
+    )
@@ -2,16 +2,22 @@
 FastAPI application entry point for Document Search & Retrieval System.
 """
 
-import uuid
+import asyncio
+import itertools
+import os
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.config import settings
+from src.db.elasticsearch import get_elasticsearch_client
+from src.db.postgres import get_postgres_client
 from src.utils.logging import setup_logging, get_logger, set_request_id
+from src.utils.responses import CachedPage
 
 
 # Set up logging
@@ -29,9 +35,19 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Document Search & Retrieval System")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"PDF Storage Path: {settings.pdf_storage_path}")
+    # uvicorn picks uvloop automatically when installed; log what actually runs
+    loop = asyncio.get_running_loop()
+    logger.info(f"Event loop: {type(loop).__module__}.{type(loop).__name__}")
+
+    # Open pooled database connections before the first request needs one
+    pg_client = get_postgres_client()
+    pg_client.warm_pool()
+
     yield
     # Shutdown
     logger.info("Shutting down Document Search & Retrieval System")
+    pg_client.dispose()
+    await get_elasticsearch_client().aclose()
 
 
 # Initialize FastAPI application
@@ -40,6 +56,7 @@ app = FastAPI(
     description="AI-powered document search system for sales department",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -52,12 +69,56 @@ app.add_middleware(
 )
 
 
+static_dir = Path(__file__).parent.parent / "static"
+
+# HTML pages kept in memory and revalidated with ETags
+index_page = CachedPage(static_dir / "index.html")
+pitch_page = CachedPage(static_dir / "pitch.html")
+
+
+# Largest upload request body accepted, with an allowance for multipart
+# boundaries and form fields around the file itself
+MAX_UPLOAD_REQUEST_BYTES = settings.max_file_size_bytes + 64 * 1024
+
+
+@app.middleware("http")
+async def reject_oversized_uploads_middleware(request: Request, call_next):
+    """
+    Middleware to reject uploads whose declared Content-Length is too large.
+
+    FastAPI reads the whole multipart body before the endpoint runs, so this
+    check has to happen here to avoid receiving a clearly oversized file.
+    Chunked uploads without a declared length are still checked while
+    streaming in save_uploaded_file.
+    """
+    if request.method == "POST" and request.url.path == "/api/v1/documents/upload":
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and (
+            int(content_length) > MAX_UPLOAD_REQUEST_BYTES
+        ):
+            return JSONResponse(
+                status_code=413,
+                content={
+                    "detail": f"File size exceeds maximum allowed size of {settings.max_file_size_mb}MB"
+                },
+            )
+
+    return await call_next(request)
+
+
+# Request IDs only need to be unique for log correlation, so they are a
+# per-process counter prefixed with the pid and process start time rather
+# than a random UUID
+_REQUEST_ID_PREFIX = f"{os.getpid() & 0xFFFF:04x}-{int(time.time()) & 0xFFFFFFFF:08x}"
+_request_seq = itertools.count()
+
+
 @app.middleware("http")
 async def add_request_id_middleware(request: Request, call_next):
     """
     Middleware to add request ID to each request for tracking.
     """
-    request_id = str(uuid.uuid4())
+    request_id = f"{_REQUEST_ID_PREFIX}-{next(_request_seq):012x}"
     set_request_id(request_id)
 
     # Add request ID to response headers
@@ -83,18 +144,16 @@ async def health_check():
 
 
 @app.get("/", tags=["Root"])
-async def root():
+async def root(request: Request):
     """
     Serve the search UI HTML page.
 
     Returns:
-        FileResponse: HTML search interface
+        Response: HTML search interface
     """
-    static_dir = Path(__file__).parent.parent / "static"
-    index_path = static_dir / "index.html"
-
-    if index_path.exists():
-        return FileResponse(index_path)
+    response = index_page.response(request)
+    if response is not None:
+        return response
 
     # Fallback to API info if HTML not found
     return {
@@ -107,24 +166,21 @@ async def root():
 
 
 @app.get("/pitch.html", tags=["Root"])
-async def pitch():
+async def pitch(request: Request):
     """
     Serve the pitch presentation HTML page.
 
     Returns:
-        FileResponse: Pitch presentation with personalization support
+        Response: Pitch presentation with personalization support
     """
-    static_dir = Path(__file__).parent.parent / "static"
-    pitch_path = static_dir / "pitch.html"
-
-    if pitch_path.exists():
-        return FileResponse(pitch_path)
+    response = pitch_page.response(request)
+    if response is not None:
+        return response
 
     return {"error": "Pitch page not found"}
 
 
 # Mount static files directory
-static_dir = Path(__file__).parent.parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
 # API v1 routers
@@ -143,5 +199,6 @@ if __name__ == "__main__":
         "src.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        loop="uvloop" if settings.use_uvloop else "asyncio"
     )
@@ -5,7 +5,9 @@ Pydantic models for document management.
 from datetime import datetime
 from typing import Optional, List
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ProcessingStatus(str, Enum):
@@ -31,7 +33,8 @@ class DocumentUploadRequest(BaseModel):
     machine_model: Optional[str] = None
     part_numbers: Optional[List[str]] = Field(default_factory=list)
 
-    @validator('category', pre=True)
+    @field_validator('category', mode='before')
+    @classmethod
     def validate_category(cls, v):
         """Validate and normalize category."""
         if isinstance(v, str):
@@ -43,8 +46,7 @@ class DocumentUploadRequest(BaseModel):
                 )
         return v
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class DocumentUploadResponse(BaseModel):
@@ -55,8 +57,7 @@ class DocumentUploadResponse(BaseModel):
     upload_date: datetime
     message: str = "Document uploaded successfully and queued for processing"
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class DocumentMetadata(BaseModel):
@@ -74,9 +75,8 @@ class DocumentMetadata(BaseModel):
     error_message: Optional[str] = None
     total_pages: Optional[int] = None
 
-    class Config:
-        use_enum_values = True
-        from_attributes = True  # For SQLAlchemy models
+    # from_attributes allows validating SQLAlchemy models directly
+    model_config = ConfigDict(use_enum_values=True, from_attributes=True)
 
 
 class DocumentStatusResponse(BaseModel):
@@ -89,8 +89,7 @@ class DocumentStatusResponse(BaseModel):
     total_pages: Optional[int] = None
     error_message: Optional[str] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class DocumentListResponse(BaseModel):
@@ -99,6 +98,32 @@ class DocumentListResponse(BaseModel):
     page: int
     page_size: int
     documents: List[DocumentMetadata]
+    next_cursor: Optional[str] = None  # Pass as ?after= for the next page
+
+
+class DocumentMetadataStruct(msgspec.Struct, kw_only=True):
+    """msgspec mirror of DocumentMetadata for fast list serialization."""
+    document_id: str
+    filename: str
+    file_size: int  # Bytes
+    file_path: str
+    category: DocumentCategory
+    machine_model: Optional[str] = None
+    part_numbers: List[str] = []
+    upload_date: datetime
+    processing_status: ProcessingStatus
+    indexed_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+    total_pages: Optional[int] = None
+
+
+class DocumentListStruct(msgspec.Struct, kw_only=True):
+    """msgspec mirror of DocumentListResponse, encoded directly to JSON."""
+    total: int
+    page: int
+    page_size: int
+    documents: List[DocumentMetadataStruct]
+    next_cursor: Optional[str] = None
 
 
 class DocumentPage(BaseModel):
@@ -117,8 +142,24 @@ class DocumentPage(BaseModel):
     file_path: str
     processing_status: ProcessingStatus = ProcessingStatus.READY
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
+
+
+class DocumentPageStruct(msgspec.Struct, kw_only=True):
+    """msgspec mirror of DocumentPage, encoded directly to JSON for bulk indexing."""
+    document_id: str
+    filename: str
+    page: int
+    content: str
+    summary: Optional[str] = None
+    category: DocumentCategory
+    machine_model: Optional[str] = None
+    part_numbers: List[str] = []
+    upload_date: datetime
+    indexed_at: Optional[datetime] = None
+    file_size: int
+    file_path: str
+    processing_status: ProcessingStatus = ProcessingStatus.READY
 
 
 class ProcessingProgress(BaseModel):
@@ -130,5 +171,4 @@ class ProcessingProgress(BaseModel):
     started_at: datetime
     error_message: Optional[str] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
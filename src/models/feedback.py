@@ -5,7 +5,7 @@ Feedback request and response models.
 from typing import Optional
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class FeedbackRating(str, Enum):
@@ -44,7 +44,8 @@ class FeedbackRequest(BaseModel):
         description="Optional session identifier for anonymous tracking"
     )
 
-    @validator("query")
+    @field_validator("query")
+    @classmethod
     def validate_query(cls, v):
         """Validate and clean query string."""
         v = v.strip()
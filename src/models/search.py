@@ -2,9 +2,9 @@
 Search request and response models.
 """
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 from src.models.document import DocumentCategory
 
@@ -12,6 +12,8 @@ from src.models.document import DocumentCategory
 class SearchFilters(BaseModel):
     """Search filters for narrowing results."""
 
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     category: Optional[DocumentCategory] = Field(
         default=None,
         description="Filter by document category"
@@ -33,18 +35,56 @@ class SearchFilters(BaseModel):
         description="Filter by part numbers"
     )
 
-    @validator("date_to")
-    def validate_date_range(cls, v, values):
+    @field_validator("date_to")
+    @classmethod
+    def validate_date_range(cls, v, info: ValidationInfo):
         """Ensure date_to is after date_from."""
-        if v and "date_from" in values and values["date_from"]:
-            if v < values["date_from"]:
+        date_from = info.data.get("date_from")
+        if v and date_from:
+            if v < date_from:
                 raise ValueError("date_to must be after date_from")
         return v
 
+    def to_es_filter_clauses(self) -> List[Dict[str, Any]]:
+        """
+        Translate the filters into Elasticsearch bool ``filter`` clauses.
+
+        The clauses are meant for filter context, where they skip scoring
+        and Elasticsearch can cache their per-segment bitsets, so repeated
+        category or machine model filters are close to free.
+
+        Returns:
+            list: term/terms/range clauses, empty when no filter is set
+        """
+        clauses: List[Dict[str, Any]] = []
+
+        if self.category:
+            clauses.append({"term": {"category": self.category.value}})
+
+        if self.machine_model:
+            clauses.append({"term": {"machine_model": self.machine_model}})
+
+        if self.date_from or self.date_to:
+            date_range = {}
+            if self.date_from:
+                date_range["gte"] = self.date_from.isoformat()
+            if self.date_to:
+                date_range["lte"] = self.date_to.isoformat()
+            clauses.append({"range": {"upload_date": date_range}})
+
+        if self.part_numbers:
+            clauses.append({"terms": {"part_numbers": self.part_numbers}})
+
+        return clauses
+
 
 class SearchRequest(BaseModel):
     """Search request parameters."""
 
+    # Strips the query in pydantic-core before min_length is checked, so a
+    # whitespace-only query is rejected without a Python validator
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     query: str = Field(
         ...,
         min_length=1,
@@ -79,14 +119,6 @@ class SearchRequest(BaseModel):
         description="Include full page content with preserved structure (tables, formatting)"
     )
 
-    @validator("query")
-    def validate_query(cls, v):
-        """Validate and clean query string."""
-        v = v.strip()
-        if not v:
-            raise ValueError("Query cannot be empty or whitespace")
-        return v
-
 
 class SearchResult(BaseModel):
     """Individual search result."""
@@ -126,6 +158,67 @@ class SearchResult(BaseModel):
         description="Date document was uploaded"
     )
 
+    @classmethod
+    def from_es_hit(
+        cls,
+        hit: Dict[str, Any],
+        score: Optional[float] = None,
+        include_highlights: bool = True,
+        include_content: bool = True
+    ) -> "SearchResult":
+        """
+        Build a result from an Elasticsearch hit without re-validating it.
+
+        Hit sources are written by our own indexer, so the fields are used
+        as-is via model_construct; only upload_date is parsed so it
+        serializes as a datetime.
+
+        Args:
+            hit: Elasticsearch hit with _source, _score and optional highlight
+            score: Score to report (defaults to the hit's _score)
+            include_highlights: Whether to fill snippet/highlighted_content
+            include_content: Whether to include full page content
+
+        Returns:
+            SearchResult: Result built from the hit
+        """
+        source = hit["_source"]
+
+        # Extract highlight snippet and full highlighted content
+        snippet = None
+        highlighted_content = None
+        highlight = hit.get("highlight") if include_highlights else None
+
+        if highlight:
+            # Full-field content highlight is only requested with include_content
+            if "content" in highlight and include_content:
+                highlighted_content = highlight["content"][0]
+
+            # Snippet for preview (prefer summary, fall back to content fragment)
+            if "summary" in highlight:
+                snippet = highlight["summary"][0]
+            elif "content" in highlight and not include_content:
+                snippet = highlight["content"][0]
+
+        upload_date = source.get("upload_date")
+        if isinstance(upload_date, str):
+            upload_date = datetime.fromisoformat(upload_date)
+
+        return cls.model_construct(
+            document_id=source["document_id"],
+            filename=source["filename"],
+            page=source["page"],
+            category=source["category"],
+            score=hit["_score"] if score is None else score,
+            snippet=snippet,
+            content=source.get("content") if include_content else None,
+            highlighted_content=highlighted_content,
+            summary=source.get("summary"),
+            machine_model=source.get("machine_model"),
+            part_numbers=source.get("part_numbers", []),
+            upload_date=upload_date
+        )
+
 
 class SearchResponse(BaseModel):
     """Search response with results and metadata."""
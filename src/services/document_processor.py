@@ -6,17 +6,28 @@ Coordinates PDF parsing, chunking, summarization, and indexing.
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
-from src.models.document import ProcessingStatus, DocumentCategory, DocumentPage
+import msgspec
+
+from src.config import settings
+from src.models.document import (
+    ProcessingStatus,
+    DocumentCategory,
+    DocumentPage,
+    DocumentPageStruct,
+)
 from src.services.pdf_parser import get_pdf_parser
-from src.services.markdown_chunker import get_markdown_chunker
+from src.services.markdown_chunker import PageChunk, get_markdown_chunker
 from src.services.summarizer import get_summarizer
 from src.db.elasticsearch import get_elasticsearch_client
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared encoder for page documents sent to the bulk indexer
+_page_encoder = msgspec.json.Encoder()
+
 
 class DocumentProcessor:
     """Orchestrates the document processing pipeline."""
@@ -75,80 +86,31 @@ class DocumentProcessor:
         }
 
         try:
-            # Stage 1: Parse PDF to markdown
-            logger.info(f"[{document_id}] Stage 1: Parsing PDF")
-            result["status"] = ProcessingStatus.PARSING
-            markdown_content = self.pdf_parser.parse_pdf_with_retry(file_path)
-
-            # Stage 2: Chunk markdown by page
-            logger.info(f"[{document_id}] Stage 2: Chunking markdown")
-            page_chunks = self.chunker.chunk_by_page(markdown_content)
-            result["total_pages"] = len(page_chunks)
-
-            logger.info(
-                f"[{document_id}] Extracted {len(page_chunks)} pages from PDF"
+            # Stages 1-3: Parse, chunk and summarize; page documents are
+            # then built lazily while they are being indexed
+            documents = self.iter_documents(
+                file_path=file_path,
+                document_id=document_id,
+                original_filename=original_filename,
+                category=category,
+                machine_model=machine_model,
+                generate_summaries=generate_summaries,
+                result=result
             )
 
-            # Stage 3: Generate summaries (optional)
-            summaries = []
-            if generate_summaries:
-                logger.info(f"[{document_id}] Stage 3: Generating summaries")
-                result["status"] = ProcessingStatus.SUMMARIZING
-
-                for chunk in page_chunks:
-                    try:
-                        summary = self.summarizer.summarize_text_with_retry(
-                            chunk["content"]
-                        )
-                        summaries.append(summary)
-                        result["summaries_generated"] += 1
-
-                    except Exception as e:
-                        logger.warning(
-                            f"[{document_id}] Failed to summarize page {chunk['page']}: {e}"
-                        )
-                        # Add empty summary on failure
-                        summaries.append("")
-
-            else:
-                logger.info(f"[{document_id}] Skipping summary generation")
-                summaries = [""] * len(page_chunks)
-
             # Stage 4: Index pages in Elasticsearch
             logger.info(f"[{document_id}] Stage 4: Indexing in Elasticsearch")
             result["status"] = ProcessingStatus.INDEXING
 
-            upload_date = datetime.utcnow()
-            file_size = file_path.stat().st_size
-
-            # Prepare documents for bulk indexing
-            documents = []
-            for i, chunk in enumerate(page_chunks):
-                # Extract metadata from chunk
-                metadata = self.chunker.extract_metadata(chunk["content"])
-
-                doc = {
-                    "document_id": document_id,
-                    "filename": original_filename,  # Use original filename for display
-                    "page": chunk["page"],
-                    "content": chunk["content"],
-                    "summary": summaries[i] if summaries[i] else None,
-                    "category": category.value if isinstance(category, DocumentCategory) else category,
-                    "machine_model": machine_model,
-                    "part_numbers": metadata.get("part_numbers", []),
-                    "upload_date": upload_date.isoformat(),
-                    "indexed_at": datetime.utcnow().isoformat(),
-                    "file_size": file_size,
-                    "file_path": str(file_path),
-                    "processing_status": ProcessingStatus.READY.value
-                }
-
-                documents.append(doc)
-
-            # Bulk index all pages
+            # Stream pages into concurrent bulk requests. Refresh and replicas
+            # are left alone (no tune_refresh): workers index into the shared
+            # index concurrently, and dropping replicas per upload would force
+            # a replica rebuild each time
             success, errors = self.es_client.bulk_index(
                 index_name="documents",
-                documents=documents
+                documents=documents,
+                thread_count=settings.elasticsearch_bulk_threads,
+                chunk_size=settings.elasticsearch_bulk_chunk_size
             )
 
             result["pages_indexed"] = success
@@ -177,6 +139,175 @@ class DocumentProcessor:
             result["completed_at"] = datetime.utcnow()
             raise
 
+    def prepare_documents(
+        self,
+        file_path: Path,
+        document_id: str,
+        original_filename: str,
+        category: DocumentCategory,
+        machine_model: Optional[str] = None,
+        generate_summaries: bool = True,
+        result: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, bytes]]:
+        """
+        Parse, chunk and summarize a PDF into page documents ready for indexing.
+
+        Args:
+            file_path: Path to PDF file
+            document_id: Unique document identifier
+            original_filename: Original uploaded filename (for display)
+            category: Document category
+            machine_model: Optional machine model
+            generate_summaries: Whether to generate summaries (default: True)
+            result: Optional processing result dict to update with progress
+
+        Returns:
+            list: One (id, JSON-encoded Elasticsearch document) per page
+        """
+        return list(self.iter_documents(
+            file_path=file_path,
+            document_id=document_id,
+            original_filename=original_filename,
+            category=category,
+            machine_model=machine_model,
+            generate_summaries=generate_summaries,
+            result=result
+        ))
+
+    def iter_documents(
+        self,
+        file_path: Path,
+        document_id: str,
+        original_filename: str,
+        category: DocumentCategory,
+        machine_model: Optional[str] = None,
+        generate_summaries: bool = True,
+        result: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Parse, chunk and summarize a PDF, yielding page documents lazily.
+
+        Parsing, chunking and summarization run (and raise) before this
+        returns; each page document is only built as the iterator is
+        consumed, so a bulk indexer holds no more than a few chunks of them.
+
+        Args:
+            file_path: Path to PDF file
+            document_id: Unique document identifier
+            original_filename: Original uploaded filename (for display)
+            category: Document category
+            machine_model: Optional machine model
+            generate_summaries: Whether to generate summaries (default: True)
+            result: Optional processing result dict to update with progress
+
+        Returns:
+            Iterator: One (id, JSON-encoded Elasticsearch document) per page
+        """
+        if result is None:
+            result = {"total_pages": 0, "summaries_generated": 0}
+
+        # Stage 1: Parse PDF to markdown
+        logger.info(f"[{document_id}] Stage 1: Parsing PDF")
+        result["status"] = ProcessingStatus.PARSING
+        markdown_content = self.pdf_parser.parse_pdf_with_retry(file_path)
+
+        # Stage 2: Chunk markdown by page
+        logger.info(f"[{document_id}] Stage 2: Chunking markdown")
+        page_chunks = self.chunker.chunk_by_page(markdown_content)
+        result["total_pages"] = len(page_chunks)
+
+        logger.info(
+            f"[{document_id}] Extracted {len(page_chunks)} pages from PDF"
+        )
+
+        # Stage 3: Generate summaries (optional)
+        summaries = []
+        if generate_summaries:
+            logger.info(f"[{document_id}] Stage 3: Generating summaries")
+            result["status"] = ProcessingStatus.SUMMARIZING
+
+            # Pages are summarized concurrently; failed pages get ""
+            summaries = self.summarizer.batch_summarize(
+                [chunk.content for chunk in page_chunks]
+            )
+            generated = sum(1 for summary in summaries if summary)
+            result["summaries_generated"] += generated
+
+            failed = len(summaries) - generated
+            if failed:
+                logger.warning(f"[{document_id}] Failed to summarize {failed} page(s)")
+
+        else:
+            logger.info(f"[{document_id}] Skipping summary generation")
+            summaries = [""] * len(page_chunks)
+
+        return self._page_documents(
+            file_path=file_path,
+            document_id=document_id,
+            original_filename=original_filename,
+            category=category,
+            machine_model=machine_model,
+            page_chunks=page_chunks,
+            summaries=summaries
+        )
+
+    def _page_documents(
+        self,
+        file_path: Path,
+        document_id: str,
+        original_filename: str,
+        category: DocumentCategory,
+        machine_model: Optional[str],
+        page_chunks: List[PageChunk],
+        summaries: List[str]
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Build the Elasticsearch document for each page, one at a time.
+
+        Pages are built as DocumentPageStruct and encoded to JSON with
+        msgspec here, so the bulk helper forwards the bytes as-is instead of
+        serializing a dict per page. Each page is keyed by
+        "<document_id>:<page>", so indexing a document again (e.g. a retried
+        task) overwrites its pages instead of duplicating them.
+
+        Args:
+            file_path: Path to PDF file
+            document_id: Unique document identifier
+            original_filename: Original uploaded filename (for display)
+            category: Document category
+            machine_model: Optional machine model
+            page_chunks: Page chunks from the markdown chunker
+            summaries: Summary per page ("" when none)
+
+        Yields:
+            tuple: (id, JSON-encoded Elasticsearch document) for one page
+        """
+        category = DocumentCategory(category)
+        upload_date = datetime.utcnow()
+        file_size = file_path.stat().st_size
+
+        for i, chunk in enumerate(page_chunks):
+            # Extract metadata from chunk
+            metadata = self.chunker.extract_metadata(chunk.content)
+
+            doc = DocumentPageStruct(
+                document_id=document_id,
+                filename=original_filename,  # Use original filename for display
+                page=chunk.page,
+                content=chunk.content,
+                summary=summaries[i] if summaries[i] else None,
+                category=category,
+                machine_model=machine_model,
+                part_numbers=metadata.get("part_numbers", []),
+                upload_date=upload_date,
+                indexed_at=datetime.utcnow(),
+                file_size=file_size,
+                file_path=str(file_path),
+                processing_status=ProcessingStatus.READY
+            )
+
+            yield f"{document_id}:{chunk.page}", _page_encoder.encode(doc)
+
     def reprocess_document(
         self,
         document_id: str,
@@ -205,7 +336,9 @@ class DocumentProcessor:
             "size": 1000
         }
 
-        results = self.es_client.search(index_name="documents", query=query)
+        results = self.es_client.search(
+            index_name="documents", query=query, use_cache=False
+        )
         pages = results["hits"]["hits"]
 
         if not pages:
@@ -228,6 +361,7 @@ class DocumentProcessor:
                         id=page["_id"],
                         body={"doc": {"summary": summary}}
                     )
+                    self.es_client.clear_search_cache()
 
                 except Exception as e:
                     logger.error(
@@ -261,12 +395,10 @@ class DocumentProcessor:
             }
         }
 
-        response = self.es_client.client.delete_by_query(
-            index="documents",
-            body=query
+        deleted = self.es_client.delete_by_query(
+            index_name="documents",
+            query=query
         )
-
-        deleted = response["deleted"]
         logger.info(f"Deleted {deleted} pages for document {document_id}")
 
         return deleted
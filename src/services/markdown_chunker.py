@@ -3,12 +3,22 @@ Markdown chunking service for splitting documents by page.
 """
 
 import re
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from itertools import chain, pairwise
+from typing import List, Dict, Any, Iterator
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class PageChunk:
+    """Content of a single PDF page."""
+    page: int
+    content: str
+    total_pages: int
+
+
 class MarkdownChunker:
     """Chunk markdown content by page boundaries."""
 
@@ -19,7 +29,20 @@ class MarkdownChunker:
         re.IGNORECASE
     )
 
-    def chunk_by_page(self, markdown_content: str) -> List[Dict[str, Any]]:
+    HEADER_PATTERN = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+
+    # Potential part numbers, fused into one alternation so each page is
+    # scanned once. Common patterns: ABC-123, 12345-67, P/N: ABC123,
+    # Part Number: ABC123
+    PART_NUMBER_PATTERN = re.compile(
+        r'\b(?P<code>[A-Z]{2,}-\d{2,})\b'
+        r'|\b(?P<numeric>\d{4,}-\d{2,})\b'
+        r'|P/N:?\s*(?P<pn>[A-Z0-9-]+)'
+        r'|Part\s+(?:Number|No\.?):?\s*(?P<part>[A-Z0-9-]+)',
+        re.IGNORECASE
+    )
+
+    def chunk_by_page(self, markdown_content: str) -> List[PageChunk]:
         """
         Split markdown content into page-level chunks.
 
@@ -27,64 +50,68 @@ class MarkdownChunker:
             markdown_content: Full markdown content from PDF parser
 
         Returns:
-            list: List of page chunks with metadata
+            list: List of page chunks
 
         Example:
             [
-                {
-                    "page": 1,
-                    "content": "...",
-                    "total_pages": 51
-                },
+                PageChunk(page=1, content="...", total_pages=51),
                 ...
             ]
         """
         logger.info("Chunking markdown content by page")
 
-        # Find all page markers
-        page_markers = list(self.PAGE_PATTERN.finditer(markdown_content))
+        chunks = list(self.iter_pages(markdown_content))
 
-        if not page_markers:
-            logger.warning("No page markers found, returning content as single chunk")
-            return [{
-                "page": 1,
-                "content": markdown_content.strip(),
-                "total_pages": 1
-            }]
+        logger.info(
+            f"Created {len(chunks)} page chunks from "
+            f"{chunks[0].total_pages if chunks else 0} total pages"
+        )
+
+        return chunks
+
+    def iter_pages(self, markdown_content: str) -> Iterator[PageChunk]:
+        """
+        Yield page-level chunks in a single pass over the page markers.
 
-        total_pages = int(page_markers[0].group(2))
-        chunks = []
+        Each marker is reduced to a (page, total, start, end) tuple as it is
+        found and paired with the next one to slice out the page content, so
+        no list of Match objects is built.
 
-        for i, match in enumerate(page_markers):
-            page_num = int(match.group(1))
+        Args:
+            markdown_content: Full markdown content from PDF parser
 
-            # Determine start and end positions
-            start_pos = match.end()
+        Yields:
+            PageChunk: Page number, content and total page count
+        """
+        markers = (
+            (int(match.group(1)), int(match.group(2)), match.start(), match.end())
+            for match in self.PAGE_PATTERN.finditer(markdown_content)
+        )
+        # Sentinel marker so the last page runs to the end of the document
+        end_of_document = len(markdown_content)
+        marker_pairs = pairwise(
+            chain(markers, [(None, None, end_of_document, end_of_document)])
+        )
+
+        first_pair = next(marker_pairs, None)
+        if first_pair is None or first_pair[0][0] is None:
+            logger.warning("No page markers found, returning content as single chunk")
+            yield PageChunk(page=1, content=markdown_content.strip(), total_pages=1)
+            return
 
-            if i < len(page_markers) - 1:
-                # Content ends at the next page marker
-                end_pos = page_markers[i + 1].start()
-            else:
-                # Last page goes to end of document
-                end_pos = len(markdown_content)
+        total_pages = first_pair[0][1]
 
-            # Extract page content
-            page_content = markdown_content[start_pos:end_pos].strip()
+        for (page_num, _, _, content_start), (_, _, content_end, _) in chain(
+            [first_pair], marker_pairs
+        ):
+            page_content = markdown_content[content_start:content_end].strip()
 
             # Skip empty pages
             if not page_content:
                 logger.debug(f"Skipping empty page {page_num}")
                 continue
 
-            chunks.append({
-                "page": page_num,
-                "content": page_content,
-                "total_pages": total_pages
-            })
-
-        logger.info(f"Created {len(chunks)} page chunks from {total_pages} total pages")
-
-        return chunks
+            yield PageChunk(page=page_num, content=page_content, total_pages=total_pages)
 
     def extract_metadata(self, page_content: str) -> Dict[str, Any]:
         """
@@ -104,32 +131,25 @@ class MarkdownChunker:
         }
 
         # Extract headers
-        header_pattern = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
-        headers = header_pattern.findall(page_content)
+        headers = self.HEADER_PATTERN.findall(page_content)
         if headers:
             metadata["headers"] = headers
 
+        lowered = page_content.lower()
+
         # Check for tables
-        if '<table' in page_content.lower() or '|' in page_content:
+        if '<table' in lowered or '|' in page_content:
             metadata["has_tables"] = True
 
         # Check for images
-        if '![' in page_content or '<img' in page_content.lower():
+        if '![' in page_content or '<img' in lowered:
             metadata["has_images"] = True
 
-        # Extract potential part numbers (alphanumeric patterns)
-        # Common patterns: ABC-123, 12345-6789, P/N: ABC123
-        part_number_patterns = [
-            r'\b([A-Z]{2,}-\d{2,})\b',  # ABC-123
-            r'\b(\d{4,}-\d{2,})\b',  # 12345-67
-            r'P/N:?\s*([A-Z0-9-]+)',  # P/N: ABC123
-            r'Part\s+(?:Number|No\.?):?\s*([A-Z0-9-]+)',  # Part Number: ABC123
-        ]
-
-        part_numbers = set()
-        for pattern in part_number_patterns:
-            matches = re.findall(pattern, page_content, re.IGNORECASE)
-            part_numbers.update(matches)
+        # Extract potential part numbers in a single pass
+        part_numbers = {
+            match.group(match.lastgroup)
+            for match in self.PART_NUMBER_PATTERN.finditer(page_content)
+        }
 
         if part_numbers:
             metadata["part_numbers"] = sorted(list(part_numbers))
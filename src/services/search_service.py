@@ -2,9 +2,11 @@
 Search service for querying documents in Elasticsearch.
 """
 
-from typing import Optional, List, Dict, Any
+import threading
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from time import time
+
+from cachetools import TTLCache
 
 from src.db.elasticsearch import get_elasticsearch_client
 from src.db.postgres import get_postgres_client
@@ -15,17 +17,21 @@ logger = get_logger(__name__)
 
 
 class FeedbackCache:
-    """Simple in-memory cache for feedback boost scores with TTL."""
+    """Bounded in-memory cache for feedback boost scores with TTL."""
 
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(self, ttl_seconds: int = 300, maxsize: int = 10_000):
         """
         Initialize feedback cache.
 
         Args:
             ttl_seconds: Time-to-live for cache entries (default 5 minutes)
+            maxsize: Maximum number of cached document pages; the least
+                recently used entries are evicted first
         """
-        self.cache: Dict[str, tuple[float, float]] = {}  # key -> (boost_score, expiry_time)
+        self.cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
         self.ttl_seconds = ttl_seconds
+        # Searches run in the threadpool, so guard the shared cache
+        self._lock = threading.Lock()
 
     def get(self, document_id: str, page: int) -> Optional[float]:
         """
@@ -38,15 +44,8 @@ class FeedbackCache:
         Returns:
             float: Boost score or None if not cached or expired
         """
-        key = f"{document_id}:{page}"
-        if key in self.cache:
-            boost_score, expiry_time = self.cache[key]
-            if time() < expiry_time:
-                return boost_score
-            else:
-                # Expired, remove from cache
-                del self.cache[key]
-        return None
+        with self._lock:
+            return self.cache.get((document_id, page))
 
     def set(self, document_id: str, page: int, boost_score: float) -> None:
         """
@@ -57,9 +56,8 @@ class FeedbackCache:
             page: Page number
             boost_score: Boost multiplier to cache
         """
-        key = f"{document_id}:{page}"
-        expiry_time = time() + self.ttl_seconds
-        self.cache[key] = (boost_score, expiry_time)
+        with self._lock:
+            self.cache[(document_id, page)] = boost_score
 
     def invalidate(self, document_id: str, page: int) -> None:
         """
@@ -69,9 +67,8 @@ class FeedbackCache:
             document_id: Document identifier
             page: Page number
         """
-        key = f"{document_id}:{page}"
-        if key in self.cache:
-            del self.cache[key]
+        with self._lock:
+            self.cache.pop((document_id, page), None)
 
 
 class SearchService:
@@ -110,9 +107,9 @@ class SearchService:
 
         # Execute search
         try:
-            es_response = self.es_client.client.search(
-                index=self.index_name,
-                body=es_query,
+            es_response = self.es_client.search(
+                index_name=self.index_name,
+                query=es_query,
                 size=request.page_size,
                 from_=from_offset
             )
@@ -172,7 +169,7 @@ class SearchService:
             "must": [query_clause]
         }
 
-        # Add filters
+        # Filters go in filter context (not must) so ES can cache them
         if request.filters:
             filter_clauses = self._build_filters(request.filters)
             if filter_clauses:
@@ -234,39 +231,7 @@ class SearchService:
         Returns:
             list: List of filter clauses
         """
-        filter_clauses = []
-
-        # Category filter
-        if filters.category:
-            filter_clauses.append({
-                "term": {"category": filters.category.value}
-            })
-
-        # Machine model filter
-        if filters.machine_model:
-            filter_clauses.append({
-                "term": {"machine_model": filters.machine_model}
-            })
-
-        # Date range filter
-        if filters.date_from or filters.date_to:
-            date_range = {}
-            if filters.date_from:
-                date_range["gte"] = filters.date_from.isoformat()
-            if filters.date_to:
-                date_range["lte"] = filters.date_to.isoformat()
-
-            filter_clauses.append({
-                "range": {"upload_date": date_range}
-            })
-
-        # Part numbers filter
-        if filters.part_numbers:
-            filter_clauses.append({
-                "terms": {"part_numbers": filters.part_numbers}
-            })
-
-        return filter_clauses
+        return filters.to_es_filter_clauses()
 
     def get_feedback_boost(self, document_id: str, page: int) -> float:
         """
@@ -286,18 +251,9 @@ class SearchService:
 
         # Fetch from database
         try:
-            stats = self.pg_client.get_feedback_stats(document_id, page)
-            positive_count = stats["positive_count"]
-            negative_count = stats["negative_count"]
-
-            # Calculate boost: 1.0 + (net_votes * 0.1)
-            # Each net positive vote adds 10% boost
-            # Each net negative vote subtracts 10% boost
-            net_votes = positive_count - negative_count
-            boost = 1.0 + (net_votes * 0.1)
-
-            # Clamp to reasonable range (0.1 to 3.0)
-            boost = max(0.1, min(3.0, boost))
+            # Boost is computed and clamped (0.1 to 3.0) in the stats query:
+            # each net positive vote adds 10%, each net negative subtracts 10%
+            boost = self.pg_client.get_feedback_stats(document_id, page)["boost_score"]
 
             # Cache the result
             self.feedback_cache.set(document_id, page, boost)
@@ -308,11 +264,54 @@ class SearchService:
             logger.warning(f"Failed to get feedback boost for {document_id}:{page}: {e}")
             return 1.0  # Neutral boost on error
 
+    def get_feedback_boosts(self, pages: List[Tuple[str, int]]) -> Dict[Tuple[str, int], float]:
+        """
+        Get feedback boost scores for several document pages.
+
+        Cached pages are served from the feedback cache; the rest are
+        fetched together in a single query and cached, including the
+        neutral boost for pages without feedback.
+
+        Args:
+            pages: (document_id, page) pairs
+
+        Returns:
+            dict: Boost multiplier per (document_id, page)
+        """
+        boosts: Dict[Tuple[str, int], float] = {}
+        missing = []
+        for document_id, page in pages:
+            cached_boost = self.feedback_cache.get(document_id, page)
+            if cached_boost is not None:
+                boosts[(document_id, page)] = cached_boost
+            else:
+                missing.append((document_id, page))
+
+        if not missing:
+            return boosts
+
+        try:
+            fetched = self.pg_client.get_feedback_boosts(missing)
+        except Exception as e:
+            logger.warning(f"Failed to get feedback boosts for {len(missing)} page(s): {e}")
+            boosts.update(dict.fromkeys(missing, 1.0))  # Neutral boost on error
+            return boosts
+
+        for document_id, page in missing:
+            boost = fetched.get((document_id, page), 1.0)
+            self.feedback_cache.set(document_id, page, boost)
+            boosts[(document_id, page)] = boost
+        return boosts
+
     def invalidate_feedback_cache(self, document_id: str, page: int) -> None:
         """
         Invalidate feedback cache for a document page.
         Call this when new feedback is submitted.
 
+        The cache is in-process, so this is a single pop and is kept
+        synchronous: deferring it would only let the next search read a
+        stale boost.
+
         Args:
             document_id: Document identifier
             page: Page number
@@ -346,15 +345,21 @@ class SearchService:
         total = es_response["hits"]["total"]["value"]
         took = es_response["took"]
 
+        hits = es_response["hits"]["hits"]
+        # Look up boosts for all hits at once rather than one query per hit
+        boosts = self.get_feedback_boosts(
+            [(hit["_source"]["document_id"], hit["_source"]["page"]) for hit in hits]
+        )
+
         results = []
-        for hit in es_response["hits"]["hits"]:
+        for hit in hits:
             source = hit["_source"]
             base_score = hit["_score"]
 
             # Apply feedback boosting to score
             document_id = source["document_id"]
             page_num = source["page"]
-            feedback_boost = self.get_feedback_boost(document_id, page_num)
+            feedback_boost = boosts[(document_id, page_num)]
             boosted_score = base_score * feedback_boost
 
             # Log if boost is significant
@@ -364,37 +369,12 @@ class SearchService:
                     f"base={base_score:.2f} boost={feedback_boost:.2f} final={boosted_score:.2f}"
                 )
 
-            # Extract highlight snippet and full highlighted content
-            snippet = None
-            highlighted_content = None
-
-            if include_highlights and "highlight" in hit:
-                # Extract highlighted content (full-field when include_content=True)
-                if "content" in hit["highlight"] and include_content:
-                    # Full-field highlighting - use for highlighted_content
-                    highlighted_content = hit["highlight"]["content"][0]
-
-                # Extract snippet for preview (prefer summary, fall back to content fragment)
-                if "summary" in hit["highlight"]:
-                    snippet = hit["highlight"]["summary"][0]
-                elif "content" in hit["highlight"] and not include_content:
-                    # Content fragment (when include_content=False) - use for snippet
-                    snippet = hit["highlight"]["content"][0]
-
-            # Create search result with boosted score
-            result = SearchResult(
-                document_id=source["document_id"],
-                filename=source["filename"],
-                page=source["page"],
-                category=source["category"],
+            # Sources come from our own index, so skip re-validation
+            result = SearchResult.from_es_hit(
+                hit,
                 score=boosted_score,  # Use boosted score
-                snippet=snippet,
-                content=source.get("content") if include_content else None,
-                highlighted_content=highlighted_content,
-                summary=source.get("summary"),
-                machine_model=source.get("machine_model"),
-                part_numbers=source.get("part_numbers", []),
-                upload_date=source.get("upload_date")
+                include_highlights=include_highlights,
+                include_content=include_content
             )
             results.append(result)
 
@@ -2,6 +2,7 @@
 Document summarization service using Claude Haiku 3.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from anthropic import Anthropic
 
@@ -160,40 +161,47 @@ class Summarizer:
         self,
         contents: list[str],
         model: str = "claude-3-haiku-20240307",
-        max_tokens: int = 500
+        max_tokens: int = 500,
+        max_workers: Optional[int] = None
     ) -> list[str]:
         """
-        Summarize multiple text contents.
+        Summarize multiple text contents concurrently.
+
+        Requests are network-bound, so they run on a thread pool; summaries
+        are returned in input order, with an empty string for any content
+        that failed after retries.
 
         Args:
             contents: List of text contents to summarize
             model: Claude model to use
             max_tokens: Maximum tokens per summary
+            max_workers: Concurrent requests (defaults to
+                settings.summarizer_concurrency, sized to the API rate limit)
 
         Returns:
             list: List of summaries
-
-        Note: This processes sequentially, not in parallel, to respect API rate limits.
         """
-        summaries = []
+        if not contents:
+            return []
 
-        for i, content in enumerate(contents, 1):
+        def summarize(indexed_content: tuple[int, str]) -> str:
+            i, content = indexed_content
             logger.info(f"Summarizing content {i}/{len(contents)}")
 
             try:
-                summary = self.summarize_text_with_retry(
+                return self.summarize_text_with_retry(
                     content,
                     model=model,
                     max_tokens=max_tokens
                 )
-                summaries.append(summary)
-
             except Exception as e:
                 logger.error(f"Failed to summarize content {i}: {e}")
-                # Add empty summary on failure
-                summaries.append("")
+                # Empty summary on failure
+                return ""
 
-        return summaries
+        workers = min(max_workers or settings.summarizer_concurrency, len(contents))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(summarize, enumerate(contents, 1)))
 
 
 # Global summarizer instance
@@ -0,0 +1,146 @@
+"""
+Celery application and background tasks.
+
+Document processing runs on a separate Celery worker pool so the API
+process only saves the upload and enqueues work. Start a worker with:
+
+    celery -A src.tasks worker --loglevel=info
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from celery import Celery
+
+from src.config import settings
+from src.db.postgres import get_postgres_client
+from src.models.document import DocumentCategory, ProcessingStatus
+from src.services.document_processor import DocumentProcessor
+from src.utils.logging import get_logger
+from src.utils.pdf_utils import limit_pdf_to_max_pages, cleanup_limited_pdf
+
+logger = get_logger(__name__)
+
+celery_app = Celery(
+    "doc_parser",
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
+)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_acks_late=True,
+    task_ignore_result=True,
+    worker_prefetch_multiplier=1,
+)
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=3,
+)
+def process_document_task(
+    self,
+    document_id: str,
+    file_path: str,
+    category: str,
+    machine_model: Optional[str] = None,
+) -> None:
+    """
+    Process an uploaded document on a Celery worker.
+
+    Arguments are JSON-serializable so the task can cross the broker.
+    Failures are retried with backoff; the document is only marked as
+    failed once retries are exhausted (or immediately when called
+    directly, outside a worker).
+
+    Args:
+        document_id: Document ID
+        file_path: Path to PDF file
+        category: Document category value (e.g. "maintenance")
+        machine_model: Optional machine model
+    """
+    processor = DocumentProcessor()
+    pg_client = get_postgres_client()
+    limited_pdf_path = None
+
+    try:
+        # Get document record to fetch original filename
+        doc = pg_client.get_document(document_id)
+        if not doc:
+            raise ValueError(f"Document {document_id} not found in database")
+
+        original_filename = doc.original_filename
+
+        # Update status to parsing
+        pg_client.update_document_status(document_id, ProcessingStatus.PARSING)
+
+        # Check PDF page count and create limited version if needed
+        # This handles LandingAI's 50-page limitation
+        pdf_to_process, original_page_count, was_truncated = limit_pdf_to_max_pages(
+            Path(file_path)
+        )
+
+        if was_truncated:
+            limited_pdf_path = pdf_to_process
+            logger.warning(
+                f"Document {document_id} truncated from {original_page_count} to 50 pages "
+                f"due to LandingAI limitation"
+            )
+            # Add truncation info to error message field for user awareness
+            pg_client.update_document_status(
+                document_id=document_id,
+                status=ProcessingStatus.PARSING,
+                error_message=f"Note: PDF truncated from {original_page_count} to 50 pages for processing"
+            )
+
+        # Process document (with limited version if truncated)
+        result = processor.process_document(
+            file_path=pdf_to_process,
+            document_id=document_id,
+            original_filename=original_filename,
+            category=DocumentCategory(category),
+            machine_model=machine_model,
+            generate_summaries=True,
+        )
+
+        # Update status to ready
+        final_error_msg = None
+        if was_truncated:
+            final_error_msg = f"Note: Original PDF had {original_page_count} pages, processed first 50 pages only"
+
+        pg_client.update_document_status(
+            document_id=document_id,
+            status=ProcessingStatus.READY,
+            total_pages=result.get("total_pages"),
+            indexed_at=datetime.utcnow(),
+            error_message=final_error_msg
+        )
+
+        logger.info(f"Document {document_id} processed successfully")
+
+    except Exception as e:
+        if not self.request.called_directly and self.request.retries < self.max_retries:
+            logger.warning(
+                f"Document processing failed for {document_id} "
+                f"(attempt {self.request.retries + 1}), retrying: {e}"
+            )
+            raise
+
+        logger.error(f"Document processing failed for {document_id}: {e}")
+
+        # Update status to failed
+        pg_client.update_document_status(
+            document_id=document_id,
+            status=ProcessingStatus.FAILED,
+            error_message=str(e),
+        )
+
+    finally:
+        # Clean up limited PDF if it was created
+        if limited_pdf_path:
+            cleanup_limited_pdf(limited_pdf_path)
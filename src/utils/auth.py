@@ -1,6 +1,7 @@
 """
 Authentication utilities for API key validation.
 """
+import hmac
 from typing import Optional
 from fastapi import HTTPException, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -12,6 +13,22 @@ logger = get_logger(__name__)
 # HTTP Bearer security scheme
 security = HTTPBearer()
 
+# Configured API key, encoded once for constant-time comparison
+_API_KEY_BYTES = settings.api_key.encode("utf-8")
+
+
+def _is_valid_api_key(api_key: str) -> bool:
+    """
+    Compare an API key against the configured key in constant time.
+
+    Args:
+        api_key: API key provided by the client
+
+    Returns:
+        bool: True if the key matches
+    """
+    return hmac.compare_digest(api_key.encode("utf-8"), _API_KEY_BYTES)
+
 
 def verify_api_key(
     credentials: HTTPAuthorizationCredentials = Security(security)
@@ -47,7 +64,7 @@ def verify_api_key(
         )
 
     # Validate against configured API key
-    if api_key != settings.api_key:
+    if not _is_valid_api_key(api_key):
         logger.warning(f"Invalid API key attempt: {api_key[:8]}...")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -79,7 +96,7 @@ def get_optional_api_key(
     api_key = credentials.credentials
 
     # Validate against configured API key
-    if api_key != settings.api_key:
+    if not _is_valid_api_key(api_key):
         logger.warning(f"Invalid API key attempt: {api_key[:8]}...")
         return None
 
@@ -4,6 +4,7 @@ PDF utility functions for page counting and limiting.
 Temporary solution to handle LandingAI's 50-page limit.
 """
 
+import mmap
 from pathlib import Path
 from typing import Tuple
 from pypdf import PdfReader, PdfWriter
@@ -68,51 +69,61 @@ def limit_pdf_to_max_pages(
     Raises:
         Exception: If PDF reading or writing fails
     """
-    # Get original page count
-    original_page_count = get_pdf_page_count(file_path)
-
-    # If within limit, return original
-    if original_page_count <= max_pages:
-        logger.info(
-            f"PDF {file_path.name} has {original_page_count} pages "
-            f"(within {max_pages} page limit)"
-        )
-        return file_path, original_page_count, False
+    if not file_path.exists():
+        raise FileNotFoundError(f"PDF file not found: {file_path}")
 
-    # PDF exceeds limit, create truncated version
-    logger.warning(
-        f"PDF {file_path.name} has {original_page_count} pages, "
-        f"exceeding {max_pages} page limit. Creating truncated version..."
-    )
+    # Map the file once and share it between the page count and truncation,
+    # instead of parsing the PDF from disk twice
+    with open(file_path, "rb") as source, \
+            mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        try:
+            reader = PdfReader(mapped)
+            original_page_count = len(reader.pages)
+        except Exception as e:
+            logger.error(f"Failed to read PDF {file_path.name}: {e}")
+            raise
+
+        # If within limit, return original
+        if original_page_count <= max_pages:
+            logger.info(
+                f"PDF {file_path.name} has {original_page_count} pages "
+                f"(within {max_pages} page limit)"
+            )
+            return file_path, original_page_count, False
+
+        # PDF exceeds limit, create truncated version
+        logger.warning(
+            f"PDF {file_path.name} has {original_page_count} pages, "
+            f"exceeding {max_pages} page limit. Creating truncated version..."
+        )
 
-    try:
-        reader = PdfReader(file_path)
-        writer = PdfWriter()
+        try:
+            writer = PdfWriter()
 
-        # Add first max_pages to new PDF
-        for i in range(min(max_pages, original_page_count)):
-            writer.add_page(reader.pages[i])
+            # Add first max_pages to new PDF
+            for i in range(min(max_pages, original_page_count)):
+                writer.add_page(reader.pages[i])
 
-        # Create limited PDF with "_limited" suffix
-        limited_path = file_path.parent / f"{file_path.stem}_limited{file_path.suffix}"
+            # Create limited PDF with "_limited" suffix
+            limited_path = file_path.parent / f"{file_path.stem}_limited{file_path.suffix}"
 
-        with open(limited_path, 'wb') as output_file:
-            writer.write(output_file)
+            with open(limited_path, 'wb') as output_file:
+                writer.write(output_file)
 
-        limited_size = limited_path.stat().st_size
-        original_size = file_path.stat().st_size
+            limited_size = limited_path.stat().st_size
+            original_size = len(mapped)
 
-        logger.warning(
-            f"Created limited PDF: {limited_path.name} "
-            f"({max_pages} pages, {limited_size:,} bytes) "
-            f"from {file_path.name} ({original_page_count} pages, {original_size:,} bytes)"
-        )
+            logger.warning(
+                f"Created limited PDF: {limited_path.name} "
+                f"({max_pages} pages, {limited_size:,} bytes) "
+                f"from {file_path.name} ({original_page_count} pages, {original_size:,} bytes)"
+            )
 
-        return limited_path, original_page_count, True
+            return limited_path, original_page_count, True
 
-    except Exception as e:
-        logger.error(f"Failed to create limited PDF for {file_path.name}: {e}")
-        raise
+        except Exception as e:
+            logger.error(f"Failed to create limited PDF for {file_path.name}: {e}")
+            raise
 
 
 def cleanup_limited_pdf(file_path: Path) -> None:
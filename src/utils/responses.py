@@ -0,0 +1,93 @@
+"""
+Response helpers for serving cacheable static content.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Browser/CDN cache lifetime for the HTML pages served from memory
+PAGE_CACHE_CONTROL = "public, max-age=3600"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Quoted ETag of the current representation
+
+    Returns:
+        bool: True if the client's cached copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class CachedPage:
+    """
+    Small static page served from memory with ETag revalidation.
+
+    The file is read once and kept as ``(mtime, etag, body)``; it is only
+    re-read when its modification time changes, so requests cost a single
+    ``stat`` instead of opening and streaming the file through the
+    threadpool. Requests carrying a matching ``If-None-Match`` get a 304.
+    """
+
+    def __init__(self, path: Path, media_type: str = "text/html"):
+        self.path = path
+        self.media_type = media_type
+        self._entry: Optional[Tuple[float, str, bytes]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Optional[Tuple[str, bytes]]:
+        """
+        Return the cached (etag, body), re-reading the file if it changed.
+
+        Returns None if the file does not exist.
+        """
+        try:
+            mtime = self.path.stat().st_mtime
+            entry = self._entry
+            if entry is None or entry[0] != mtime:
+                with self._lock:
+                    entry = self._entry
+                    if entry is None or entry[0] != mtime:
+                        body = self.path.read_bytes()
+                        etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+                        entry = (mtime, etag, body)
+                        self._entry = entry
+        except FileNotFoundError:
+            return None
+        return entry[1], entry[2]
+
+    def response(self, request: Request) -> Optional[Response]:
+        """
+        Build the response for a request, honouring If-None-Match.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            Response: 304 when the client copy is current, else the page;
+                None if the file does not exist
+        """
+        loaded = self._load()
+        if loaded is None:
+            return None
+
+        etag, body = loaded
+        headers = {"ETag": etag, "Cache-Control": PAGE_CACHE_CONTROL}
+
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=body, media_type=self.media_type, headers=headers)
@@ -32,6 +32,20 @@ def test_settings():
     }
 
 
+@pytest.fixture(autouse=True)
+def isolated_pdf_storage(tmp_path, monkeypatch):
+    """Write uploaded PDFs to a per-test directory instead of ./data/pdfs."""
+    import src.api.documents
+
+    storage_path = tmp_path / "pdfs"
+    monkeypatch.setattr(
+        src.api.documents,
+        "settings",
+        settings.model_copy(update={"pdf_storage_path": str(storage_path)}),
+    )
+    return storage_path
+
+
 # ==================== FastAPI Test Client ====================
 
 @pytest.fixture
@@ -121,8 +135,9 @@ def mock_postgres_client():
     client.create_document = Mock(return_value=Mock(id="test-doc-id"))
     client.get_document = Mock(return_value=None)
     client.update_document_status = Mock(return_value=True)
-    client.list_documents = Mock(return_value=[])
+    client.list_documents = Mock(return_value=([], None))
     client.count_documents = Mock(return_value=0)
+    client.list_documents_with_total = Mock(return_value=([], 0))
     client.delete_document = Mock(return_value=True)
 
     return client
@@ -155,7 +170,7 @@ def mock_elasticsearch_client():
             "hits": []
         }
     })
-    client.delete_by_query = Mock(return_value={"deleted": 0})
+    client.delete_by_query = Mock(return_value=0)
 
     return client
 
@@ -3,6 +3,7 @@ Tests for document management API endpoints.
 """
 
 import io
+import tempfile
 import pytest
 from pathlib import Path
 from datetime import datetime
@@ -27,12 +28,10 @@ def mock_postgres_client():
 
 
 @pytest.fixture
-def mock_document_processor():
-    """Mock document processor."""
-    with patch("src.api.documents.DocumentProcessor") as mock:
-        processor = Mock()
-        mock.return_value = processor
-        yield processor
+def mock_process_task():
+    """Mock Celery document processing task."""
+    with patch("src.api.documents.process_document_task") as mock:
+        yield mock
 
 
 @pytest.fixture
@@ -48,11 +47,49 @@ def auth_headers():
     return {"Authorization": f"Bearer {settings.api_key}"}
 
 
+class TestSaveUploadedFile:
+    """Test saving uploads to storage."""
+
+    @pytest.mark.asyncio
+    async def test_save_rolled_upload(self, tmp_path):
+        """Test a disk-backed upload is copied byte for byte."""
+        from starlette.datastructures import UploadFile as StarletteUploadFile
+        from src.api.documents import save_uploaded_file
+
+        content = b"%PDF-1.4\n" + b"A" * 4096 + b"\n%%EOF"
+        spooled = tempfile.SpooledTemporaryFile(max_size=1024)
+        spooled.write(content)
+        spooled.seek(0)
+        upload = StarletteUploadFile(file=spooled, filename="doc.pdf")
+
+        file_path, file_size = await save_uploaded_file(upload, "doc-1", tmp_path)
+
+        assert file_size == len(content)
+        assert file_path.read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_save_in_memory_upload(self, tmp_path):
+        """Test an in-memory upload is streamed to storage."""
+        from starlette.datastructures import UploadFile as StarletteUploadFile
+        from src.api.documents import save_uploaded_file
+
+        content = b"%PDF-1.4\ntest\n%%EOF"
+        spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        spooled.write(content)
+        spooled.seek(0)
+        upload = StarletteUploadFile(file=spooled, filename="doc.pdf")
+
+        file_path, file_size = await save_uploaded_file(upload, "doc-2", tmp_path)
+
+        assert file_size == len(content)
+        assert file_path.read_bytes() == content
+
+
 class TestUploadDocument:
     """Test document upload endpoint."""
 
     def test_upload_success(
-        self, mock_postgres_client, sample_pdf_file, auth_headers
+        self, mock_postgres_client, mock_process_task, sample_pdf_file, auth_headers
     ):
         """Test successful document upload."""
         # Mock database response
@@ -81,6 +118,53 @@ class TestUploadDocument:
         # Verify database was called
         mock_postgres_client.create_document.assert_called_once()
 
+        # Verify processing was enqueued with serializable arguments
+        mock_process_task.delay.assert_called_once()
+        args = mock_process_task.delay.call_args.args
+        assert args[0] == result["document_id"]
+        assert args[2] == "maintenance"
+        assert args[3] == "MODEL-123"
+
+    def test_upload_queue_unavailable(
+        self, mock_postgres_client, mock_process_task, sample_pdf_file, auth_headers
+    ):
+        """Test upload returns 503 and marks the document failed when enqueueing fails."""
+        mock_process_task.delay.side_effect = ConnectionError("broker down")
+
+        files = {"file": ("test.pdf", sample_pdf_file, "application/pdf")}
+        data = {"category": "maintenance"}
+
+        response = client.post(
+            "/api/v1/documents/upload",
+            files=files,
+            data=data,
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 503
+        mock_postgres_client.update_document_status.assert_called_once()
+        args = mock_postgres_client.update_document_status.call_args.args
+        assert args[1] == ProcessingStatus.FAILED
+
+    def test_upload_rejects_declared_oversize(
+        self, mock_postgres_client, mock_process_task, auth_headers
+    ):
+        """Test upload is rejected from Content-Length before the body is parsed."""
+        files = {"file": ("big.pdf", io.BytesIO(b"%PDF-1.4\n" + b"A" * 4096), "application/pdf")}
+        data = {"category": "maintenance"}
+
+        with patch("src.main.MAX_UPLOAD_REQUEST_BYTES", 1024):
+            response = client.post(
+                "/api/v1/documents/upload",
+                files=files,
+                data=data,
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 413
+        mock_postgres_client.create_document.assert_not_called()
+        mock_process_task.delay.assert_not_called()
+
     def test_upload_without_auth(self, sample_pdf_file):
         """Test upload without authentication."""
         files = {"file": ("test.pdf", sample_pdf_file, "application/pdf")}
@@ -192,6 +276,48 @@ class TestGetDocumentStatus:
         assert result["status"] == "ready"
         assert result["total_pages"] == 5
 
+    def test_get_status_revalidates_when_terminal(self, mock_postgres_client, auth_headers):
+        """Test a finished document's status can be revalidated with If-None-Match."""
+        mock_doc = Mock()
+        mock_doc.id = "test-id"
+        mock_doc.original_filename = "test.pdf"
+        mock_doc.processing_status = ProcessingStatus.READY
+        mock_doc.upload_date = datetime.utcnow()
+        mock_doc.indexed_at = datetime.utcnow()
+        mock_doc.total_pages = 5
+        mock_doc.error_message = None
+
+        mock_postgres_client.get_document.return_value = mock_doc
+
+        response = client.get("/api/v1/documents/test-id", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+        etag = response.headers["etag"]
+
+        response = client.get(
+            "/api/v1/documents/test-id",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+    def test_get_status_no_etag_while_processing(self, mock_postgres_client, auth_headers):
+        """Test no ETag is sent while the document is still processing."""
+        mock_doc = Mock()
+        mock_doc.id = "test-id"
+        mock_doc.original_filename = "test.pdf"
+        mock_doc.processing_status = ProcessingStatus.PARSING
+        mock_doc.upload_date = datetime.utcnow()
+        mock_doc.indexed_at = None
+        mock_doc.total_pages = None
+        mock_doc.error_message = None
+
+        mock_postgres_client.get_document.return_value = mock_doc
+
+        response = client.get("/api/v1/documents/test-id", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
     def test_get_status_not_found(self, mock_postgres_client, auth_headers):
         """Test getting status for non-existent document."""
         mock_postgres_client.get_document.return_value = None
@@ -214,23 +340,23 @@ class TestListDocuments:
 
     def test_list_success(self, mock_postgres_client, auth_headers):
         """Test listing documents successfully."""
-        # Mock documents
-        mock_doc = Mock()
-        mock_doc.id = "doc-1"
-        mock_doc.filename = "uuid-filename.pdf"
-        mock_doc.original_filename = "test.pdf"
-        mock_doc.file_size = 1024
-        mock_doc.file_path = "/path/to/test.pdf"
-        mock_doc.category = DocumentCategory.MAINTENANCE
-        mock_doc.machine_model = "MODEL-123"
-        mock_doc.processing_status = ProcessingStatus.READY
-        mock_doc.upload_date = datetime.utcnow()
-        mock_doc.indexed_at = datetime.utcnow()
-        mock_doc.total_pages = 5
-        mock_doc.error_message = None
-
-        mock_postgres_client.list_documents.return_value = [mock_doc]
-        mock_postgres_client.count_documents.return_value = 1
+        # Mock document rows
+        mock_row = {
+            "document_id": "doc-1",
+            "filename": "test.pdf",
+            "file_size": 1024,
+            "file_path": "/path/to/test.pdf",
+            "category": DocumentCategory.MAINTENANCE,
+            "machine_model": "MODEL-123",
+            "processing_status": ProcessingStatus.READY,
+            "upload_date": datetime.utcnow(),
+            "indexed_at": datetime.utcnow(),
+            "total_pages": 5,
+            "error_message": None,
+            "total": 1,
+        }
+
+        mock_postgres_client.list_documents_with_total.return_value = ([mock_row], 1)
 
         response = client.get(
             "/api/v1/documents",
@@ -244,11 +370,11 @@ class TestListDocuments:
         assert result["page_size"] == 10
         assert len(result["documents"]) == 1
         assert result["documents"][0]["document_id"] == "doc-1"
+        assert result["documents"][0]["filename"] == "test.pdf"
 
     def test_list_with_filters(self, mock_postgres_client, auth_headers):
         """Test listing documents with filters."""
-        mock_postgres_client.list_documents.return_value = []
-        mock_postgres_client.count_documents.return_value = 0
+        mock_postgres_client.list_documents_with_total.return_value = ([], 0)
 
         response = client.get(
             "/api/v1/documents?status=ready&category=maintenance",
@@ -258,15 +384,14 @@ class TestListDocuments:
         assert response.status_code == 200
 
         # Verify filters were passed
-        mock_postgres_client.list_documents.assert_called_once()
-        call_kwargs = mock_postgres_client.list_documents.call_args[1]
+        mock_postgres_client.list_documents_with_total.assert_called_once()
+        call_kwargs = mock_postgres_client.list_documents_with_total.call_args[1]
         assert call_kwargs["status"] == ProcessingStatus.READY
         assert call_kwargs["category"] == DocumentCategory.MAINTENANCE
 
     def test_list_with_pagination(self, mock_postgres_client, auth_headers):
         """Test listing documents with pagination."""
-        mock_postgres_client.list_documents.return_value = []
-        mock_postgres_client.count_documents.return_value = 0
+        mock_postgres_client.list_documents_with_total.return_value = ([], 0)
 
         response = client.get(
             "/api/v1/documents?page=2&page_size=20",
@@ -276,10 +401,56 @@ class TestListDocuments:
         assert response.status_code == 200
 
         # Verify pagination
-        call_kwargs = mock_postgres_client.list_documents.call_args[1]
+        call_kwargs = mock_postgres_client.list_documents_with_total.call_args[1]
         assert call_kwargs["limit"] == 20
         assert call_kwargs["offset"] == 20  # (page 2 - 1) * 20
 
+    def test_list_returns_cursor_and_pages_by_it(self, mock_postgres_client, auth_headers):
+        """Test a full page returns next_cursor and ?after= pages by keyset."""
+        upload_date = datetime(2024, 1, 2, 3, 4, 5)
+        mock_row = {
+            "document_id": "doc-1",
+            "filename": "test.pdf",
+            "file_size": 1024,
+            "file_path": "/path/to/test.pdf",
+            "category": DocumentCategory.MAINTENANCE,
+            "machine_model": None,
+            "processing_status": ProcessingStatus.READY,
+            "upload_date": upload_date,
+            "indexed_at": None,
+            "total_pages": 5,
+            "error_message": None,
+        }
+        mock_postgres_client.list_documents_with_total.return_value = ([mock_row], 3)
+
+        response = client.get("/api/v1/documents?page_size=1", headers=auth_headers)
+
+        assert response.status_code == 200
+        next_cursor = response.json()["next_cursor"]
+        assert next_cursor
+
+        mock_postgres_client.list_documents.return_value = ([mock_row], None)
+        mock_postgres_client.count_documents.return_value = 3
+
+        response = client.get(
+            f"/api/v1/documents?page_size=1&after={next_cursor}", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+        assert response.json()["next_cursor"] is None
+        call_kwargs = mock_postgres_client.list_documents.call_args[1]
+        assert call_kwargs["after_upload_date"] == upload_date
+        assert call_kwargs["after_id"] == "doc-1"
+        assert call_kwargs["limit"] == 1
+
+    def test_list_invalid_cursor(self, mock_postgres_client, auth_headers):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/api/v1/documents?after=not-a-cursor", headers=auth_headers)
+
+        assert response.status_code == 400
+        mock_postgres_client.list_documents.assert_not_called()
+
     def test_list_invalid_pagination(self, mock_postgres_client, auth_headers):
         """Test listing with invalid pagination parameters."""
         # Invalid page
@@ -334,7 +505,10 @@ class TestDeleteDocument:
         assert response.status_code == 204
 
         # Verify deletions
-        es_client.delete_by_query.assert_called_once()
+        es_client.delete_by_query.assert_called_once_with(
+            index_name="documents",
+            query={"query": {"term": {"document_id": "test-id"}}},
+        )
         mock_postgres_client.delete_document.assert_called_once_with("test-id")
         assert not test_file.exists()
 
@@ -380,8 +554,32 @@ class TestDownloadDocument:
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["content-length"] == str(test_file.stat().st_size)
+        assert response.headers["etag"] == '"test-id"'
         assert b"PDF" in response.content
 
+    def test_download_not_modified(self, mock_postgres_client, auth_headers, tmp_path):
+        """Test a matching If-None-Match returns 304 without the file body."""
+        test_file = tmp_path / "test.pdf"
+        test_file.write_bytes(b"%PDF-1.4\ntest\n%%EOF")
+
+        mock_doc = Mock()
+        mock_doc.id = "test-id"
+        mock_doc.filename = "uuid-filename.pdf"
+        mock_doc.file_path = str(test_file)
+
+        mock_postgres_client.get_document.return_value = mock_doc
+
+        response = client.get(
+            "/api/v1/documents/test-id/download",
+            headers={**auth_headers, "If-None-Match": '"test-id"'},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"test-id"'
+        assert "immutable" in response.headers["cache-control"]
+        assert response.content == b""
+
     def test_download_not_found(self, mock_postgres_client, auth_headers):
         """Test downloading non-existent document."""
         mock_postgres_client.get_document.return_value = None
@@ -4,6 +4,7 @@ Tests for Elasticsearch client and index management.
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 
 from src.db.elasticsearch import get_elasticsearch_client, ElasticsearchClient
 from src.db.index_schemas import create_documents_index
@@ -253,3 +254,139 @@ class TestDocumentOperations:
 
         # Cleanup
         es_client.delete_index(index_name)
+
+
+@pytest.fixture
+def cached_client():
+    """ElasticsearchClient with a mocked underlying client."""
+    with patch("src.db.elasticsearch.Elasticsearch") as mock_es:
+        client = ElasticsearchClient()
+    mock_es.return_value.search.return_value = {"hits": {"hits": []}}
+    mock_es.return_value.index.return_value = {"_id": "doc-1"}
+    return client, mock_es.return_value
+
+
+class TestSearchCache:
+    """Test the in-process search response cache."""
+
+    def test_repeated_search_is_cached(self, cached_client):
+        """Identical searches only reach Elasticsearch once."""
+        client, es = cached_client
+        query = {"query": {"match": {"content": "pump"}}}
+
+        first = client.search(index_name="documents", query=query)
+        second = client.search(index_name="documents", query=dict(query))
+
+        assert first is second
+        assert es.search.call_count == 1
+
+        # Different pagination or use_cache=False goes to Elasticsearch
+        client.search(index_name="documents", query=query, from_=10)
+        client.search(index_name="documents", query=query, use_cache=False)
+        assert es.search.call_count == 3
+
+    def test_write_clears_cache(self, cached_client):
+        """Indexing a document invalidates cached searches."""
+        client, es = cached_client
+        query = {"query": {"match_all": {}}}
+
+        client.search(index_name="documents", query=query)
+        client.index_document(index_name="documents", document={"content": "x"})
+        client.search(index_name="documents", query=query)
+
+        assert es.search.call_count == 2
+
+
+    def test_other_process_writes_visible_after_ttl(self, cached_client):
+        """Pages indexed by another process (the worker) show up within the TTL."""
+        from cachetools import TTLCache
+        from src.db.elasticsearch import SEARCH_CACHE_MAXSIZE, SEARCH_CACHE_TTL_SECONDS
+
+        client, es = cached_client
+        now = [0.0]
+        client._search_cache = TTLCache(
+            maxsize=SEARCH_CACHE_MAXSIZE,
+            ttl=SEARCH_CACHE_TTL_SECONDS,
+            timer=lambda: now[0],
+        )
+        query = {"query": {"match": {"content": "pump"}}}
+
+        client.search(index_name="documents", query=query)
+
+        # The worker's client is a separate instance, so its writes leave
+        # this cache untouched
+        with patch("src.db.elasticsearch.Elasticsearch"):
+            ElasticsearchClient().index_document(
+                index_name="documents", document={"content": "pump"}
+            )
+        es.search.return_value = {"hits": {"hits": [{"_id": "new"}]}}
+
+        assert client.search(index_name="documents", query=query)["hits"]["hits"] == []
+
+        now[0] += SEARCH_CACHE_TTL_SECONDS
+        assert SEARCH_CACHE_TTL_SECONDS <= 5
+        result = client.search(index_name="documents", query=query)
+        assert result["hits"]["hits"] == [{"_id": "new"}]
+        assert es.search.call_count == 2
+
+
+class TestBulkIndexTuning:
+    """Test refresh suspension around bulk loads."""
+
+    def test_tune_refresh_restores_settings_on_failure(self, cached_client):
+        """Previous index settings are restored even if indexing fails."""
+        client, es = cached_client
+        es.indices.get_settings.return_value = {
+            "documents": {"settings": {"index.number_of_replicas": "0"}}
+        }
+
+        with patch("src.db.elasticsearch.parallel_bulk", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                client.bulk_index("documents", [{"content": "x"}], tune_refresh=True)
+
+        suspend, restore = es.indices.put_settings.call_args_list
+        assert suspend.kwargs["settings"]["index.refresh_interval"] == "-1"
+        assert restore.kwargs["settings"] == {
+            "index.refresh_interval": None,
+            "index.number_of_replicas": "0",
+        }
+        es.indices.refresh.assert_called_once_with(index="documents")
+
+    def test_tuple_documents_are_indexed_under_their_id(self, cached_client):
+        """(id, source) tuples carry a bulk _id so re-indexing overwrites."""
+        client, _ = cached_client
+        captured = []
+
+        def fake_parallel_bulk(_client, actions, **kwargs):
+            for action in actions:
+                captured.append(action)
+                yield True, {}
+
+        with patch("src.db.elasticsearch.parallel_bulk", side_effect=fake_parallel_bulk):
+            success, errors = client.bulk_index(
+                "documents", [("doc-1:1", b'{"page":1}'), {"content": "x"}]
+            )
+
+        assert (success, errors) == (2, [])
+        assert captured == [
+            {"_index": "documents", "_id": "doc-1:1", "_source": b'{"page":1}'},
+            {"_index": "documents", "_source": {"content": "x"}},
+        ]
+
+
+class TestIndexExistsCache:
+    """Test memoization of index existence checks."""
+
+    def test_create_index_checks_existence_once(self, cached_client):
+        """Known indexes skip the exists request; deletion forgets them."""
+        client, es = cached_client
+        es.indices.exists.return_value = True
+
+        assert client.create_index("documents", mappings={}) is False
+        assert client.create_index("documents", mappings={}) is False
+        assert es.indices.exists.call_count == 1
+
+        assert client.delete_index("documents") is True
+        es.indices.exists.return_value = False
+        assert client.create_index("documents", mappings={}) is True
+        assert es.indices.exists.call_count == 2
@@ -3,6 +3,7 @@ Tests for document processing pipeline components.
 """
 
 import pytest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -34,13 +35,13 @@ This is content for page 3.
         chunks = chunker.chunk_by_page(markdown)
 
         assert len(chunks) == 3
-        assert chunks[0]["page"] == 1
-        assert chunks[0]["total_pages"] == 3
-        assert "page 1" in chunks[0]["content"]
-        assert chunks[1]["page"] == 2
-        assert "page 2" in chunks[1]["content"]
-        assert chunks[2]["page"] == 3
-        assert "page 3" in chunks[2]["content"]
+        assert chunks[0].page == 1
+        assert chunks[0].total_pages == 3
+        assert "page 1" in chunks[0].content
+        assert chunks[1].page == 2
+        assert "page 2" in chunks[1].content
+        assert chunks[2].page == 3
+        assert "page 3" in chunks[2].content
 
     @pytest.mark.unit
     def test_chunk_no_markers(self, chunker):
@@ -49,9 +50,9 @@ This is content for page 3.
         chunks = chunker.chunk_by_page(markdown)
 
         assert len(chunks) == 1
-        assert chunks[0]["page"] == 1
-        assert chunks[0]["total_pages"] == 1
-        assert chunks[0]["content"] == markdown.strip()
+        assert chunks[0].page == 1
+        assert chunks[0].total_pages == 1
+        assert chunks[0].content == markdown.strip()
 
     @pytest.mark.unit
     def test_extract_metadata_headers(self, chunker):
@@ -210,6 +211,21 @@ class TestSummarizer:
             assert len(summaries) == 2
             assert all(s == "Summary" for s in summaries)
 
+    def test_batch_summarize_keeps_order_and_blanks_failures(self):
+        """Test concurrent batch summaries come back in input order."""
+        with patch('src.services.summarizer.Anthropic'):
+            summarizer = Summarizer()
+
+        def fake_summarize(content, **kwargs):
+            if content == "bad":
+                raise RuntimeError("API error")
+            return content.upper()
+
+        with patch.object(summarizer, "summarize_text_with_retry", side_effect=fake_summarize):
+            summaries = summarizer.batch_summarize(["a", "bad", "c"], max_workers=3)
+
+        assert summaries == ["A", "", "C"]
+
 
 class TestPostgreSQLClient:
     """Test PostgreSQL client functionality."""
@@ -219,6 +235,7 @@ class TestPostgreSQLClient:
         """Test converting document model to dictionary."""
         from src.db.postgres import Document
 
+        now = datetime(2024, 1, 1, 12, 0)
         doc = Document(
             id="test-123",
             filename="uuid-filename.pdf",
@@ -226,7 +243,10 @@ class TestPostgreSQLClient:
             file_path="/path/to/test.pdf",
             file_size=1024,
             category=DocumentCategory.MAINTENANCE,
-            processing_status=ProcessingStatus.UPLOADED
+            processing_status=ProcessingStatus.UPLOADED,
+            upload_date=now,
+            created_at=now,
+            updated_at=now
         )
 
         doc_dict = doc.to_dict()
@@ -235,7 +255,192 @@ class TestPostgreSQLClient:
         assert doc_dict["filename"] == "test.pdf"
         assert doc_dict["category"] == "maintenance"
         assert doc_dict["processing_status"] == "uploaded"
+        assert doc_dict["upload_date"] == "2024-01-01T12:00:00"
+        assert doc_dict["indexed_at"] is None
+
+    @pytest.mark.unit
+    def test_get_document_cached_until_status_update(self):
+        """Test get_document is served from cache and invalidated on update."""
+        from src.db.postgres import PostgreSQLClient
+
+        pg_client = PostgreSQLClient()
+        session = MagicMock()
+        doc = Mock(id="test-123")
+        session.get.return_value = doc
+
+        with patch.object(pg_client, "get_session", return_value=session):
+            assert pg_client.get_document("test-123") is doc
+            assert pg_client.get_document("test-123") is doc
+            assert session.get.call_count == 1
+
+            pg_client.update_document_status("test-123", ProcessingStatus.READY)
+            pg_client.get_document("test-123")
+            # Re-fetched after the update invalidated the cache
+            assert session.get.call_count == 2
+
+
+    @pytest.mark.unit
+    def test_feedback_rating_stored_as_smallint(self):
+        """Test feedback ratings map to 1/0 in the database and back."""
+        from src.db.postgres import FeedbackRatingType
+
+        rating_type = FeedbackRatingType()
+
+        assert rating_type.process_bind_param("positive", None) == 1
+        assert rating_type.process_bind_param("negative", None) == 0
+        assert rating_type.process_result_value(1, None) == "positive"
+        assert rating_type.process_result_value(0, None) == "negative"
+
+    @pytest.mark.unit
+    def test_get_documents_many_uses_cache_and_one_query(self):
+        """Test uncached documents are fetched together in a single query."""
+        from src.db.postgres import PostgreSQLClient, Document
+
+        pg_client = PostgreSQLClient()
+        cached = Document(id="doc-1")
+        pg_client._document_cache["doc-1"] = cached
+        session = MagicMock()
+        session.scalars.return_value = [Document(id="doc-2")]
+
+        with patch.object(pg_client, "get_session", return_value=session):
+            docs = pg_client.get_documents_many(["doc-1", "doc-2", "doc-3"])
+
+        assert docs["doc-1"] is cached
+        assert set(docs) == {"doc-1", "doc-2"}
+        session.scalars.assert_called_once()
+        assert "doc-2" in pg_client._document_cache
+
+    @pytest.mark.unit
+    def test_client_accepts_url_without_credentials(self):
+        """Test engine setup does not assume user:password@ in the URL."""
+        from src.config import settings
+        from src.db.postgres import PostgreSQLClient
+
+        local_settings = settings.model_copy(update={"database_url": "postgresql:///docsearch"})
+        with patch("src.db.postgres.settings", local_settings):
+            pg_client = PostgreSQLClient()
+
+        assert pg_client._engine.url.database == "docsearch"
+
+    @pytest.mark.unit
+    def test_engine_connect_args_merged_and_timeout_overridable(self):
+        """Test caller connect_args keep the timeout options and 0 disables them."""
+        from sqlalchemy.pool import NullPool
+        from src.db.postgres import PostgreSQLClient
+
+        with patch("src.db.postgres.create_engine") as mock_create_engine:
+            PostgreSQLClient(
+                engine_kwargs={
+                    "poolclass": NullPool,
+                    "connect_args": {"application_name": "migration"},
+                },
+                statement_timeout_seconds=0,
+            )
+
+        connect_args = mock_create_engine.call_args.kwargs["connect_args"]
+        assert connect_args["application_name"] == "migration"
+        assert "-c statement_timeout=0 " in connect_args["options"]
+        assert "idle_in_transaction_session_timeout" in connect_args["options"]
+
+    @pytest.mark.unit
+    def test_migration_client_is_unpooled_without_statement_timeout(self):
+        """Test maintenance scripts get an unpooled client with no statement timeout."""
+        from sqlalchemy.pool import NullPool
+        from src.db.postgres import get_migration_client
+
+        with patch("src.db.postgres.create_engine") as mock_create_engine:
+            get_migration_client()
+
+        kwargs = mock_create_engine.call_args.kwargs
+        assert kwargs["poolclass"] is NullPool
+        assert "-c statement_timeout=0 " in kwargs["connect_args"]["options"]
+
+    @pytest.mark.unit
+    def test_bulk_create_documents_single_commit(self):
+        """Test bulk_create_documents batches inserts and commits once."""
+        from src.db.postgres import Document, PostgreSQLClient
+
+        pg_client = PostgreSQLClient()
+        session = MagicMock()
+        rows = [{"id": f"doc-{i}"} for i in range(5)]
 
+        with patch.object(pg_client, "get_session", return_value=session):
+            inserted = pg_client.bulk_create_documents(rows, chunk_size=2)
+
+        assert inserted == 5
+        assert session.bulk_insert_mappings.call_count == 3
+        session.bulk_insert_mappings.assert_called_with(Document, rows[4:])
+        session.commit.assert_called_once()
+
+    @pytest.mark.unit
+    def test_session_scope_rolls_back_on_error(self):
+        """Test session_scope rolls back and closes the session on error."""
+        from src.db.postgres import PostgreSQLClient
+
+        pg_client = PostgreSQLClient()
+        session = MagicMock()
+        session.execute.side_effect = RuntimeError("db down")
+
+        with patch.object(pg_client, "get_session", return_value=session):
+            with pytest.raises(RuntimeError):
+                pg_client.update_document_status("test-123", ProcessingStatus.READY)
+
+        session.commit.assert_not_called()
+        session.rollback.assert_called_once()
+        session.close.assert_called_once()
+
+    @pytest.mark.unit
+    def test_count_documents_cached_until_write(self):
+        """Test count_documents is cached per filter and cleared on writes."""
+        from src.db.postgres import PostgreSQLClient
+
+        pg_client = PostgreSQLClient()
+        session = MagicMock()
+        session.execute.return_value.scalar_one.return_value = 7
+
+        with patch.object(pg_client, "get_session", return_value=session):
+            assert pg_client.count_documents() == 7
+            assert pg_client.count_documents() == 7
+            assert session.execute.call_count == 1
+
+            pg_client.delete_document("test-123")
+            pg_client.count_documents()
+            assert session.execute.call_count == 2
+
+    @pytest.mark.unit
+    def test_list_documents_returns_keyset_cursor(self):
+        """Test list_documents returns a cursor only when the page is full."""
+        from src.db.postgres import PostgreSQLClient
+
+        pg_client = PostgreSQLClient()
+        session = MagicMock()
+        docs = [
+            {"document_id": f"doc-{i}", "upload_date": datetime(2024, 1, 3 - i)}
+            for i in range(2)
+        ]
+        session.execute.return_value.mappings.return_value.all.return_value = docs
+
+        with patch.object(pg_client, "get_session", return_value=session):
+            assert pg_client.list_documents(limit=2) == (docs, (datetime(2024, 1, 2), "doc-1"))
+            assert pg_client.list_documents(limit=3) == (docs, None)
+
+    @pytest.mark.unit
+    def test_list_documents_with_feedback_single_query(self):
+        """Test feedback counts are aggregated in one joined query."""
+        from src.db.postgres import PostgreSQLClient
+
+        pg_client = PostgreSQLClient()
+        session = MagicMock()
+        rows = [{"document_id": "doc-1", "positive_count": 3, "negative_count": 1}]
+        session.execute.return_value.mappings.return_value.all.return_value = rows
+
+        with patch.object(pg_client, "get_session", return_value=session):
+            assert pg_client.list_documents_with_feedback(limit=10) == rows
+
+        session.execute.assert_called_once()
+        sql = str(session.execute.call_args[0][0])
+        assert "LEFT OUTER JOIN search_feedback" in sql
+        assert "GROUP BY documents.id" in sql
 
 class TestDocumentProcessor:
     """Test document processing pipeline."""
@@ -256,3 +461,51 @@ class TestDocumentProcessor:
             assert processor.chunker is not None
             assert processor.summarizer is not None
             assert processor.es_client is not None
+
+
+class TestProcessDocumentTask:
+    """Test Celery document processing task."""
+
+    @pytest.mark.unit
+    def test_task_marks_ready(self, tmp_path):
+        """Test successful processing marks the document ready."""
+        pdf_path = tmp_path / "doc.pdf"
+
+        with patch('src.tasks.get_postgres_client') as mock_pg, \
+             patch('src.tasks.DocumentProcessor') as mock_processor_class, \
+             patch('src.tasks.limit_pdf_to_max_pages', return_value=(pdf_path, 3, False)):
+
+            from src.tasks import process_document_task
+
+            pg_client = mock_pg.return_value
+            pg_client.get_document.return_value = Mock(original_filename="manual.pdf")
+            mock_processor_class.return_value.process_document.return_value = {"total_pages": 3}
+
+            process_document_task("doc-1", str(pdf_path), "maintenance", "MODEL-1")
+
+            call_kwargs = mock_processor_class.return_value.process_document.call_args.kwargs
+            assert call_kwargs["category"] == DocumentCategory.MAINTENANCE
+            final_status = pg_client.update_document_status.call_args.kwargs
+            assert final_status["status"] == ProcessingStatus.READY
+            assert final_status["total_pages"] == 3
+
+    @pytest.mark.unit
+    def test_task_marks_failed_when_called_directly(self, tmp_path):
+        """Test a direct (non-worker) call marks the document failed instead of retrying."""
+        pdf_path = tmp_path / "doc.pdf"
+
+        with patch('src.tasks.get_postgres_client') as mock_pg, \
+             patch('src.tasks.DocumentProcessor') as mock_processor_class, \
+             patch('src.tasks.limit_pdf_to_max_pages', return_value=(pdf_path, 3, False)):
+
+            from src.tasks import process_document_task
+
+            pg_client = mock_pg.return_value
+            pg_client.get_document.return_value = Mock(original_filename="manual.pdf")
+            mock_processor_class.return_value.process_document.side_effect = RuntimeError("boom")
+
+            process_document_task("doc-1", str(pdf_path), "maintenance")
+
+            final_status = pg_client.update_document_status.call_args.kwargs
+            assert final_status["status"] == ProcessingStatus.FAILED
+            assert final_status["error_message"] == "boom"
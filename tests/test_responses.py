@@ -0,0 +1,60 @@
+"""
+Tests for response helpers.
+"""
+
+import pytest
+
+from starlette.requests import Request
+
+from src.utils.responses import CachedPage
+
+
+class TestCachedPage:
+    """Test CachedPage."""
+
+    def _request(self, headers=None):
+        raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+        return Request({"type": "http", "headers": raw})
+
+    def test_serves_page_with_cache_headers(self, tmp_path):
+        """Test the page body is returned with ETag and Cache-Control."""
+        page_path = tmp_path / "index.html"
+        page_path.write_bytes(b"<html></html>")
+
+        response = CachedPage(page_path).response(self._request())
+
+        assert response.status_code == 200
+        assert response.body == b"<html></html>"
+        assert response.headers["etag"]
+        assert "max-age=3600" in response.headers["cache-control"]
+
+    def test_not_modified_on_matching_etag(self, tmp_path):
+        """Test a matching If-None-Match yields a 304 without a body."""
+        page_path = tmp_path / "index.html"
+        page_path.write_bytes(b"<html></html>")
+        page = CachedPage(page_path)
+        etag = page.response(self._request()).headers["etag"]
+
+        response = page.response(self._request({"If-None-Match": etag}))
+
+        assert response.status_code == 304
+        assert response.body == b""
+
+    @pytest.mark.parametrize("if_none_match", ["*", 'W/"stale", {etag}'])
+    def test_not_modified_on_wildcard_or_etag_list(self, tmp_path, if_none_match):
+        """Test If-None-Match lists, weak tags and * are honoured."""
+        page_path = tmp_path / "index.html"
+        page_path.write_bytes(b"<html></html>")
+        page = CachedPage(page_path)
+        etag = page.response(self._request()).headers["etag"]
+
+        header = if_none_match.format(etag=etag)
+        response = page.response(self._request({"If-None-Match": header}))
+
+        assert response.status_code == 304
+
+    def test_missing_file_returns_none(self, tmp_path):
+        """Test a missing page yields None so callers can fall back."""
+        page = CachedPage(tmp_path / "missing.html")
+
+        assert page.response(self._request()) is None
@@ -258,7 +258,7 @@ class TestSearchService:
     def test_search_pagination(self, search_service, mock_es_client):
         """Test search with pagination."""
         # Mock Elasticsearch response
-        mock_es_client.client.search.return_value = {
+        mock_es_client.search.return_value = {
             "took": 5,
             "hits": {
                 "total": {"value": 50},
@@ -270,7 +270,7 @@ class TestSearchService:
         response = search_service.search(request)
 
         # Check pagination calculation
-        call_args = mock_es_client.client.search.call_args
+        call_args = mock_es_client.search.call_args
         assert call_args.kwargs["from_"] == 20  # (page 3 - 1) * 10
         assert call_args.kwargs["size"] == 10
 
@@ -279,6 +279,20 @@ class TestSearchService:
         assert response.has_next is True
         assert response.has_previous is True
 
+    def test_feedback_boosts_fetched_in_one_query(self, search_service):
+        """Test uncached boosts are fetched together and cached, neutral included."""
+        search_service.feedback_cache.set("doc-1", 1, 1.5)
+        search_service.pg_client = Mock()
+        search_service.pg_client.get_feedback_boosts.return_value = {("doc-2", 3): 0.8}
+
+        boosts = search_service.get_feedback_boosts([("doc-1", 1), ("doc-2", 3), ("doc-3", 2)])
+
+        assert boosts == {("doc-1", 1): 1.5, ("doc-2", 3): 0.8, ("doc-3", 2): 1.0}
+        search_service.pg_client.get_feedback_boosts.assert_called_once_with(
+            [("doc-2", 3), ("doc-3", 2)]
+        )
+        assert search_service.feedback_cache.get("doc-3", 2) == 1.0
+
     def test_get_search_service_singleton(self):
         """Test that get_search_service returns singleton instance."""
         service1 = get_search_service()